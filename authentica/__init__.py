@@ -0,0 +1,39 @@
+"""
+Authentica — headless humanization engine.
+
+Everything the Streamlit app (app.py) runs lives here and imports without
+Streamlit, so the pipeline can be driven from scripts or the batch CLI:
+
+    python -m authentica texts.jsonl --content-type "Blog" -o out.jsonl
+"""
+
+from .cache import CACHE_MAX_BYTES, CACHE_MAX_ENTRIES, CACHE_PATH, CACHE_TTL, ResultCache, make_cache_key
+from .cancel import Cancelled, CancelToken
+from .catalog import (
+    CONTENT_GROUPS, CONTENT_TYPES, FORBIDDEN_WORDS, GEMINI_MODELS, GENERAL_BEST_MODEL, GROQ_MODELS,
+    OPENROUTER_MODELS, PROVIDER_KEY_HINTS, PROVIDER_LABELS, PROVIDER_LIMITS, TONE_PROMPTS,
+)
+from .hedging import LATENCY, LatencyTracker, alternate_routes, call_hedged
+from .jobs import (
+    FINISHED_STATES, JOB_MAX_BYTES, JOB_TTL, JOB_WORKERS, JOBS, PENDING_STATES, Job, JobQueue,
+)
+from .pipeline import (
+    CHUNK_TOKENS, MAX_CONTINUATIONS, MAX_VARIANTS, PIPELINES, PROMPT_TABLE, build_passes, generate, humanize,
+    humanize_chunked, humanize_variants, pass_stages, prompt_key, run_pass, split_into_chunks,
+)
+from .providers import (
+    CLIENT_POOL, PROVIDER_BACKENDS, ClientPool, call_api, call_gemini, call_groq, call_openrouter,
+    register_provider,
+)
+from .ratelimit import (
+    RATE_LIMITER, QuotaExhausted, RateLimiter, TokenBucket, configured_limits, parse_rate_limit,
+)
+from .scheduler import MAX_CONCURRENCY, PROVIDER_CONCURRENCY, WavefrontScheduler
+from .singleflight import PASSES, REQUESTS, SingleFlight
+from .stylometry import (
+    BATCH_METRICS, PASS_TARGETS, VARIANT_WEIGHTS, analyze, analyze_batch, compare_batch, rhythm_targets_met,
+    score_variants, targets_met,
+)
+from .telemetry import TELEMETRY, Histogram, Telemetry
+from .text import CLICHES, clean_text, detector_instructions, remove_cliches
+from .tokens import CHARS_PER_TOKEN, ESTIMATOR, TokenEstimator, estimate_tokens, output_budget
@@ -0,0 +1,137 @@
+"""
+Persistent result cache — SQLite-backed, content-addressed, LRU + TTL evicted.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  CACHE
+#  Results live in a shared SQLite file, so identical requests are served across
+#  sessions, restarts and any replicas that mount the same AUTHENTICA_CACHE_PATH.
+# ─────────────────────────────────────────────────────────────────────────────
+
+CACHE_PATH        = os.environ.get(
+    "AUTHENTICA_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "authentica", "results.sqlite3"),
+)
+CACHE_MAX_BYTES   = int(os.environ.get("AUTHENTICA_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+CACHE_MAX_ENTRIES = int(os.environ.get("AUTHENTICA_CACHE_MAX_ENTRIES", 50_000))
+CACHE_TTL         = float(os.environ.get("AUTHENTICA_CACHE_TTL", 30 * 24 * 3600))  # seconds, 0 = never expire
+
+
+class ResultCache:
+    """Disk-backed, content-addressed result cache with LRU + TTL eviction."""
+
+    def __init__(self, path: str, max_bytes: int = CACHE_MAX_BYTES,
+                 max_entries: int = CACHE_MAX_ENTRIES, ttl: float = CACHE_TTL):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        # Entry count and byte total live in a one-row table kept current by
+        # triggers, so eviction checks never scan `results` — and every process
+        # sharing the file sees the same totals
+        self._db.executescript("""
+            BEGIN IMMEDIATE;
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,
+                created REAL NOT NULL, accessed REAL NOT NULL);
+            CREATE INDEX IF NOT EXISTS results_accessed ON results(accessed);
+            CREATE INDEX IF NOT EXISTS results_created ON results(created);
+            CREATE TABLE IF NOT EXISTS results_totals (
+                id INTEGER PRIMARY KEY CHECK (id = 1), entries INTEGER NOT NULL, bytes INTEGER NOT NULL);
+            INSERT OR IGNORE INTO results_totals (id, entries, bytes)
+                SELECT 1, COUNT(*), COALESCE(SUM(size), 0) FROM results;
+            CREATE TRIGGER IF NOT EXISTS results_totals_insert AFTER INSERT ON results BEGIN
+                UPDATE results_totals SET entries = entries + 1, bytes = bytes + NEW.size WHERE id = 1;
+            END;
+            CREATE TRIGGER IF NOT EXISTS results_totals_delete AFTER DELETE ON results BEGIN
+                UPDATE results_totals SET entries = entries - 1, bytes = bytes - OLD.size WHERE id = 1;
+            END;
+            CREATE TRIGGER IF NOT EXISTS results_totals_update AFTER UPDATE OF size ON results BEGIN
+                UPDATE results_totals SET bytes = bytes - OLD.size + NEW.size WHERE id = 1;
+            END;
+            COMMIT;
+        """)
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT value, created FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl and now - row[1] > self.ttl:
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                self.evictions += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            # An upsert rather than INSERT OR REPLACE: REPLACE's implicit delete skips the totals trigger
+            self._db.execute(
+                "INSERT INTO results (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET value = excluded.value, size = excluded.size,"
+                " created = excluded.created, accessed = excluded.accessed",
+                (key, value, size, now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        if self.ttl:
+            cur = self._db.execute("DELETE FROM results WHERE created < ?", (now - self.ttl,))
+            self.evictions += max(cur.rowcount, 0)
+        count, total = self._totals()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM results ORDER BY accessed"):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            victims.append((key,))
+            count -= 1
+            total -= size
+        self._db.executemany("DELETE FROM results WHERE key = ?", victims)
+        self.evictions += len(victims)
+
+    def _totals(self) -> tuple:
+        return self._db.execute("SELECT entries, bytes FROM results_totals WHERE id = 1").fetchone()
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, total = self._totals()
+        lookups = self.hits + self.misses
+        return {
+            "entries":   count,
+            "bytes":     total,
+            "hits":      self.hits,
+            "misses":    self.misses,
+            "evictions": self.evictions,
+            "hit_rate":  self.hits / lookups if lookups else 0.0,
+        }
+
+
+def make_cache_key(*args) -> str:
+    raw = "|".join(str(a) for a in args)
+    return hashlib.sha256(raw.encode()).hexdigest()
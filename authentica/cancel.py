@@ -0,0 +1,38 @@
+"""
+Cooperative cancellation — a token the caller trips and long-running work
+(passes, retries, pacing waits, streamed completions) checks as it goes.
+"""
+
+import threading
+
+
+class Cancelled(Exception):
+    """Raised inside work whose CancelToken was tripped."""
+
+    cancelled = True   # telemetry counts these as cancelled, not failed
+
+
+class CancelToken:
+    """Thread-safe one-way flag. Checking is cheap; waiting on it is interruptible."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason = None
+
+    def cancel(self, reason: str = "Cancelled") -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise Cancelled(self.reason)
+
+    def sleep(self, seconds: float) -> None:
+        """time.sleep() that raises Cancelled as soon as the token is tripped."""
+        if self._event.wait(seconds):
+            raise Cancelled(self.reason)
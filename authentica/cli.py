@@ -0,0 +1,216 @@
+"""
+Batch CLI — humanize a directory of text files or a JSONL file of texts.
+
+    python -m authentica INPUT --content-type Blog [--tone Conversational]
+        [--provider groq] [--model llama-3.3-70b-versatile] [--detectors gpt,ori,tur,zer,qui]
+        [--concurrency 8] [--rate-limit groq=0] [-o results.jsonl] [--metrics-out metrics.prom]
+
+A directory input picks up every *.txt / *.md file below it. JSONL input lines
+look like {"id": "...", "text": "..."}; optional "content_type" and "tone" keys
+override the command-line defaults for that item. One JSONL result line is
+written per item as soon as it finishes, with its wall-clock timing.
+--score adds local stylometry for input and output to each record (needs
+NumPy). --metrics-out writes per-pass call telemetry at the end of the run, as
+Prometheus text for a .prom/.txt path and JSON otherwise. --rate-limit
+replaces the free-tier request pacing for a provider, e.g. for a paid key.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+from .cache import CACHE_PATH, ResultCache
+from .catalog import CONTENT_TYPES, GENERAL_BEST_MODEL, TONE_PROMPTS
+from .pipeline import CHUNK_TOKENS, build_passes, pass_stages, split_into_chunks
+from .ratelimit import RATE_LIMITER, parse_rate_limit
+from .scheduler import MAX_CONCURRENCY, WavefrontScheduler
+from .stylometry import compare_batch
+from .telemetry import TELEMETRY
+from .text import remove_cliches
+
+DETECTORS = ("gpt", "ori", "tur", "zer", "qui")
+
+API_KEY_ENV = {
+    "openrouter": "OPENROUTER_API_KEY",
+    "groq":       "GROQ_API_KEY",
+    "gemini":     "GEMINI_API_KEY",
+}
+
+
+def resolve_content_type(name: str) -> str:
+    """Map a loose name ("blog", "Cover Letter") to its CONTENT_TYPES key."""
+    if name in CONTENT_TYPES:
+        return name
+    plain = {re.sub(r'^\W+', '', k).strip().lower(): k for k in CONTENT_TYPES}
+    wanted = name.strip().lower()
+    if wanted in plain:
+        return plain[wanted]
+    matches = [k for p, k in plain.items() if wanted in p]
+    if len(matches) == 1:
+        return matches[0]
+    options = ", ".join(sorted(plain))
+    raise ValueError(f"Unknown or ambiguous content type {name!r}. Choose one of: {options}")
+
+
+def load_items(path: str) -> list:
+    """Read input items as dicts with at least "id" and "text"."""
+    if os.path.isdir(path):
+        items = []
+        for root, _dirs, files in os.walk(path):
+            for fname in files:
+                if fname.endswith((".txt", ".md")):
+                    fpath = os.path.join(root, fname)
+                    with open(fpath, encoding="utf-8") as f:
+                        items.append({"id": os.path.relpath(fpath, path), "text": f.read()})
+        return sorted(items, key=lambda item: item["id"])
+
+    items = []
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if "text" not in item:
+                raise ValueError(f"{path}:{lineno}: missing \"text\"")
+            item.setdefault("id", str(lineno))
+            items.append(item)
+    return items
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(prog="python -m authentica", description="Humanize texts in bulk.")
+    p.add_argument("input", help="directory of .txt/.md files, or a JSONL file of {\"id\", \"text\"} objects")
+    p.add_argument("-o", "--output", help="JSONL results file (default: stdout)")
+    p.add_argument("--content-type", default="Blog", help="content type name, e.g. Blog, SOP, Cover Letter")
+    p.add_argument("--tone", default="Conversational", choices=list(TONE_PROMPTS))
+    p.add_argument("--provider", default="openrouter", choices=list(API_KEY_ENV))
+    p.add_argument("--model", help="model id (default: the provider's general-pipeline model)")
+    p.add_argument("--api-key", help="API key (default: $AUTHENTICA_API_KEY or the provider's env var)")
+    p.add_argument("--detectors", default=",".join(DETECTORS),
+                   help="comma-separated detectors to target: " + ",".join(DETECTORS))
+    p.add_argument("--no-stealth", action="store_true", help="skip cliché post-processing")
+    p.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="max in-flight API calls")
+    p.add_argument("--chunk-tokens", type=int, default=CHUNK_TOKENS, help="approximate input tokens per chunk")
+    p.add_argument("--no-cache", action="store_true", help="do not read or write the result cache")
+    p.add_argument("--hedge", action="store_true",
+                   help="race slow calls against alternate models and fail over on errors")
+    p.add_argument("--fallback-key", action="append", default=[], metavar="PROVIDER=KEY",
+                   help="API key for another provider to hedge/fail over to (repeatable)")
+    p.add_argument("--rate-limit", action="append", default=[], metavar="PROVIDER=RPM[/RPD]",
+                   help="client-side pacing for a provider, 0 = unlimited (repeatable; "
+                        "overrides AUTHENTICA_<PROVIDER>_RPM/_RPD and the free-tier defaults)")
+    p.add_argument("--adaptive", action="store_true",
+                   help="skip passes whose targets the text already meets (checked locally)")
+    p.add_argument("--pipeline", choices=("general", "fast"),
+                   help="fast: fuse the general pipeline's four passes into two calls (formal types are unaffected)")
+    p.add_argument("--score", action="store_true",
+                   help="add input/output stylometry scores to each record (needs numpy)")
+    p.add_argument("--metrics-out", metavar="PATH",
+                   help="write call telemetry here (.prom/.txt: Prometheus text, otherwise JSON)")
+    return p.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    api_key = args.api_key or os.environ.get("AUTHENTICA_API_KEY") or os.environ.get(API_KEY_ENV[args.provider])
+    if not api_key:
+        print(f"error: no API key — pass --api-key or set {API_KEY_ENV[args.provider]}", file=sys.stderr)
+        return 2
+    flags = {d.strip() for d in args.detectors.split(",") if d.strip()}
+    unknown = flags - set(DETECTORS)
+    if unknown:
+        print(f"error: unknown detectors: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+    detector_flags = [d in flags for d in DETECTORS]
+    model_id = args.model or GENERAL_BEST_MODEL[args.provider]
+    fallback_keys = {}
+    for spec in args.fallback_key:
+        other, _, key = spec.partition("=")
+        if other not in API_KEY_ENV or not key:
+            print(f"error: --fallback-key expects PROVIDER=KEY, got {spec!r}", file=sys.stderr)
+            return 2
+        fallback_keys[other] = key
+    for spec in args.rate_limit:
+        try:
+            RATE_LIMITER.set_limit(*parse_rate_limit(spec))
+        except ValueError as e:
+            print(f"error: --rate-limit {e}", file=sys.stderr)
+            return 2
+    if args.score:
+        try:
+            compare_batch([], [])
+        except ImportError as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+    cache = None if args.no_cache else ResultCache(CACHE_PATH)
+    stealth = not args.no_stealth
+
+    try:
+        items = load_items(args.input)
+        # Every chunk of every document becomes one scheduler job
+        jobs, owner, docs = [], [], []
+        for item in items:
+            content_type = resolve_content_type(item.get("content_type", args.content_type))
+            tone = item.get("tone", args.tone)
+            passes = build_passes(content_type, tone, *detector_flags, pipeline=args.pipeline)
+            stages = pass_stages(passes, args.provider, api_key, model_id, cache,
+                                 args.hedge, fallback_keys, args.adaptive)
+            chunks = split_into_chunks(item["text"], args.chunk_tokens) or [""]
+            docs.append({"item": item, "parts": [None] * len(chunks), "pending": len(chunks),
+                         "passes": len(passes), "start": None, "error": None})
+            for c, chunk in enumerate(chunks):
+                jobs.append({"value": chunk, "stages": stages if chunk else [], "provider": args.provider})
+                owner.append((len(docs) - 1, c))
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    counts = {"ok": 0, "failed": 0}
+    t0 = time.perf_counter()
+
+    def on_result(j, value, seconds):
+        d, c = owner[j]
+        doc = docs[d]
+        now = time.perf_counter()
+        doc["start"] = min(doc["start"] or now, now - seconds)
+        if isinstance(value, Exception):
+            doc["error"] = doc["error"] or f"chunk {c + 1}: {value}"
+        else:
+            doc["parts"][c] = value
+        doc["pending"] -= 1
+        if doc["pending"]:
+            return
+        item = doc["item"]
+        record = {"id": item["id"], "seconds": round(now - doc["start"], 3),
+                  "chunks": len(doc["parts"]), "passes": doc["passes"]}
+        if doc["error"]:
+            record["error"] = doc["error"]
+            counts["failed"] += 1
+        else:
+            text = "\n\n".join(doc["parts"])
+            record["output"] = remove_cliches(text) if stealth else text
+            record["words_in"] = len(item["text"].split())
+            record["words_out"] = len(record["output"].split())
+            if args.score:
+                record["style"] = compare_batch([item["text"]], [record["output"]])[0]
+            counts["ok"] += 1
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+        doc["parts"] = []   # release memory for long runs
+
+    try:
+        WavefrontScheduler(args.concurrency).run(jobs, on_result=on_result, fail_fast=False)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if args.metrics_out:
+            prom = args.metrics_out.endswith((".prom", ".txt"))
+            with open(args.metrics_out, "w", encoding="utf-8") as f:
+                f.write(TELEMETRY.to_prometheus() if prom else TELEMETRY.to_json())
+    print(f"{counts['ok']} ok, {counts['failed']} failed in {time.perf_counter() - t0:.1f}s",
+          file=sys.stderr)
+    return 1 if counts["failed"] else 0
@@ -0,0 +1,192 @@
+"""
+Hedged requests and failover — when a call runs past the usual latency for its
+model, the same prompt is fired at an alternate model or provider and the first
+completion wins; hard errors fall through the same chain of alternates.
+"""
+
+import contextvars
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .catalog import GEMINI_MODELS, GENERAL_BEST_MODEL, GROQ_MODELS, OPENROUTER_MODELS
+from .jobs import JOB_WORKERS
+from .providers import call_api
+from .scheduler import MAX_CONCURRENCY
+
+HEDGE_PERCENTILE    = float(os.environ.get("AUTHENTICA_HEDGE_PERCENTILE", 0.9))
+HEDGE_DEFAULT_DELAY = float(os.environ.get("AUTHENTICA_HEDGE_DELAY", 20.0))  # seconds, until enough samples
+HEDGE_MIN_SAMPLES   = 8
+MAX_ALTERNATES      = 2
+# Every job worker may have MAX_CONCURRENCY passes in flight, each with its alternates
+HEDGE_WORKERS       = int(os.environ.get("AUTHENTICA_HEDGE_WORKERS",
+                                         JOB_WORKERS * MAX_CONCURRENCY * (1 + MAX_ALTERNATES)))
+
+PROVIDER_MODELS = {
+    "openrouter": OPENROUTER_MODELS,
+    "groq":       GROQ_MODELS,
+    "gemini":     GEMINI_MODELS,
+}
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies per (provider, model)."""
+
+    def __init__(self, window: int = 200):
+        self._samples = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, model: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[(provider, model)].append(seconds)
+
+    def percentile(self, provider: str, model: str, q: float):
+        """The q-quantile (0–1) of recent latencies, or None with too few samples."""
+        with self._lock:
+            samples = sorted(self._samples.get((provider, model), ()))
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+LATENCY = LatencyTracker()
+
+# Shared by every hedged call; losers are abandoned here rather than joined
+_EXECUTOR = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix="authentica-hedge")
+
+
+class _Superseded(Exception):
+    """Raised inside a losing stream to abort it once another route has won."""
+
+    cancelled = True   # telemetry counts these as cancelled, not failed
+
+
+def hedge_delay(provider: str, model: str) -> float:
+    delay = LATENCY.percentile(provider, model, HEDGE_PERCENTILE)
+    return HEDGE_DEFAULT_DELAY if delay is None else delay
+
+
+def alternate_routes(provider: str, api_key: str, model: str, fallback_keys: dict = None) -> list:
+    """Alternates for a call, most independent first: other providers we hold
+    keys for (their best general model), then other models on the same provider."""
+    routes = []
+    for other, key in (fallback_keys or {}).items():
+        if other != provider and key and other in GENERAL_BEST_MODEL:
+            routes.append((other, key, GENERAL_BEST_MODEL[other]))
+    for alt in PROVIDER_MODELS.get(provider, {}).values():
+        if alt != model:
+            routes.append((provider, api_key, alt))
+    return routes[:MAX_ALTERNATES]
+
+
+def call_hedged(provider: str, api_key: str, model: str, system: str, user: str,
+                temperature: float, max_tokens: int = 3500, on_token=None,
+                fallback_keys: dict = None, meta: dict = None, cancel=None) -> str:
+    """call_api() with hedging and failover across alternate routes.
+
+    The primary route starts immediately. If it has not finished within its
+    model's HEDGE_PERCENTILE latency — counted from when the request actually
+    left the rate limiter, not from submission — the next alternate is launched alongside
+    it; if a route fails outright, the next alternate replaces it. The first
+    success wins and the others are cancelled: calls are streamed internally so
+    a loser aborts at its next token.
+
+    With `on_token`, only the first route to produce a token is forwarded (and
+    the other routes are cancelled then). Tokens are relayed so that `on_token`
+    runs on the calling thread, like a plain call_api() stream. `meta` receives
+    the winning route's finish reason, as with call_api(). A tripped `cancel`
+    token aborts every route and raises Cancelled.
+    """
+    routes = deque([(provider, api_key, model)] + alternate_routes(provider, api_key, model, fallback_keys))
+    lock = threading.Lock()
+    cancelled = set()
+    owner = []                 # route index whose stream is forwarded to on_token
+    tokens = deque()           # owner's deltas waiting to be relayed
+    in_flight = {}             # future -> route index
+    launched = []
+    errors = []
+    metas = []                 # per-route call_api() meta dicts; "sent_at" starts the hedge clock
+
+    def sink_for(i):
+        def sink(delta):
+            if i in cancelled:
+                raise _Superseded()
+            if on_token is None:
+                return
+            with lock:
+                if not owner:
+                    owner.append(i)
+                    cancelled.update(j for j in in_flight.values() if j != i)
+            if owner[0] != i:
+                raise _Superseded()
+            tokens.append(delta)
+        return sink
+
+    def attempt(i, route):
+        prov, key, mdl = route
+        out = call_api(prov, key, mdl, system, user, temperature, max_tokens, sink_for(i), metas[i], cancel)
+        LATENCY.record(prov, mdl, time.monotonic() - metas[i]["sent_at"])
+        return out
+
+    def hedge_at():
+        """When to launch the next alternate: None until the lone in-flight route has been sent."""
+        with lock:
+            i = next(iter(in_flight.values()))
+        sent_at = metas[i].get("sent_at")
+        return None if sent_at is None else sent_at + hedge_delay(launched[i][0], launched[i][2])
+
+    def launch():
+        i = len(launched)
+        route = routes.popleft()
+        launched.append(route)
+        metas.append({})
+        with lock:
+            # Run in a copy of the caller's context so telemetry keeps the pass label
+            in_flight[_EXECUTOR.submit(contextvars.copy_context().run, attempt, i, route)] = i
+
+    def relay():
+        while tokens:
+            on_token(tokens.popleft())
+
+    launch()
+    while in_flight:
+        relay()
+        if cancel is not None and cancel.cancelled:
+            with lock:
+                cancelled.update(in_flight.values())
+            cancel.raise_if_cancelled()
+        # Hedge only while a single route runs and nothing is streaming yet
+        can_hedge = bool(routes) and not owner and len(in_flight) == 1
+        deadline = hedge_at() if can_hedge else None
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if on_token is not None or cancel is not None or (can_hedge and deadline is None):
+            timeout = 0.05 if timeout is None else min(timeout, 0.05)   # also polls for "sent_at"
+        done, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            if deadline is not None and time.monotonic() >= deadline:
+                launch()
+            continue
+        for fut in done:
+            with lock:
+                i = in_flight.pop(fut)
+            try:
+                result = fut.result()
+            except _Superseded:
+                continue
+            except Exception as e:
+                errors.append(e)
+                if owner and owner[0] == i:
+                    raise  # the caller already saw part of this stream
+                if routes and not in_flight:
+                    launch()   # failover
+                continue
+            with lock:
+                cancelled.update(in_flight.values())
+            if on_token is not None:
+                relay()
+            if meta is not None:
+                meta.update(metas[i])
+            return result
+    raise errors[-1] if errors else RuntimeError("All routes were cancelled")
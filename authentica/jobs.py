@@ -0,0 +1,237 @@
+"""
+Background jobs — runs humanization off the caller's thread on a bounded,
+process-wide worker pool and keeps progress and results pollable by job id.
+"""
+
+import contextvars
+import itertools
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .cancel import CancelToken
+from .telemetry import TELEMETRY
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  JOB QUEUE — a Streamlit rerun only abandons the script run, not the job;
+#  the next run finds it again by id
+# ─────────────────────────────────────────────────────────────────────────────
+
+JOB_WORKERS         = int(os.environ.get("AUTHENTICA_JOB_WORKERS", 8))      # documents humanized at once
+JOB_TTL             = float(os.environ.get("AUTHENTICA_JOB_TTL", 3600))     # seconds a finished job stays retrievable
+JOB_MAX_BYTES       = int(os.environ.get("AUTHENTICA_JOB_MAX_BYTES", 64 * 1024 * 1024))   # finished results, all owners
+
+PENDING_STATES  = ("queued", "running")
+FINISHED_STATES = ("done", "failed", "cancelled")
+
+
+def _text_bytes(value) -> int:
+    """UTF-8 size of the text held in a result (str, or lists/dicts of them)."""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, dict):
+        return sum(_text_bytes(k) + _text_bytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_text_bytes(v) for v in value)
+    return 0
+
+
+class Job:
+    """One submitted run. Workers report into it; readers take snapshot()s."""
+
+    def __init__(self, job_id: str, meta: dict = None, owner: str = None):
+        self.id = job_id
+        self.meta = dict(meta or {})
+        self.owner = owner
+        self.cancel_token = CancelToken()
+        self.status = "queued"
+        self.progress = 0.0
+        self.message = "Queued…"
+        self.result = None
+        self.error = None
+        self.stats = {}
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.size = 0          # bytes charged to the queue once finished
+        self._stream = []
+        self._lock = threading.Lock()
+
+    # ── Worker side ────────────────────────────────────────────────────
+
+    def report(self, fraction: float, message: str) -> None:
+        """progress_callback for humanize()."""
+        with self._lock:
+            self.progress, self.message = fraction, message
+
+    def append(self, delta: str, replace: bool = False) -> None:
+        """stream_callback for humanize()."""
+        with self._lock:
+            if replace:
+                self._stream = []
+            self._stream.append(delta)
+
+    def _set(self, **fields) -> None:
+        with self._lock:
+            for name, value in fields.items():
+                setattr(self, name, value)
+
+    # ── Reader side ────────────────────────────────────────────────────
+
+    @property
+    def pending(self) -> bool:
+        return self.status in PENDING_STATES
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "id": self.id, "status": self.status, "progress": self.progress, "message": self.message,
+                "result": self.result, "error": self.error, "stats": dict(self.stats), "meta": dict(self.meta),
+                "stream": "".join(self._stream), "submitted": self.submitted, "started": self.started,
+                "finished": self.finished,
+            }
+
+
+class JobQueue:
+    """Bounded worker pool plus a registry of jobs by id.
+
+    submit() returns at once. At most `workers` jobs run at a time and the rest
+    wait in FIFO order. A job submitted with an `owner` (e.g. a UI session)
+    supersedes that owner's previous job: it is cancelled if still pending,
+    and dropped once finished, since nothing will ask for it again.
+
+    Finished jobs are kept for `ttl` seconds, charged by the bytes of their
+    result, and evicted least recently read first once they hold more than
+    `max_bytes` together. Supersession already limits each owner to one
+    finished job; running jobs are never evicted.
+    """
+
+    def __init__(self, workers: int = JOB_WORKERS, ttl: float = JOB_TTL, max_bytes: int = JOB_MAX_BYTES):
+        self.workers = max(1, workers)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._jobs = OrderedDict()   # least recently read first
+        self._latest = {}            # owner -> id of its newest job
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+        self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="authentica-job")
+
+    def submit(self, fn, *args, stream: bool = False, meta: dict = None, owner: str = None, **kwargs) -> str:
+        """Queue fn(*args, progress_callback=..., stream_callback=..., cancel=..., **kwargs)
+        and return the job id. The return value becomes the job's `result`;
+        telemetry recorded while it runs becomes its `stats`. `cancel` is the
+        job's CancelToken, which fn should pass down (humanize(cancel=...))."""
+        job = Job(f"{next(self._seq)}-{uuid.uuid4().hex[:8]}", meta, owner)
+        with self._lock:
+            self._purge(time.time())
+            self._jobs[job.id] = job
+            previous = self._jobs.get(self._latest.get(owner)) if owner is not None else None
+            if owner is not None:
+                self._latest[owner] = job.id
+            if previous is not None and not previous.pending:
+                self._drop(previous.id)
+        if previous is not None and previous.pending:
+            previous.cancel_token.cancel("Superseded by a newer run")
+        ctx = contextvars.copy_context()
+        self._pool.submit(ctx.run, self._run, job, fn, args, kwargs, stream)
+        return job.id
+
+    def _run(self, job: Job, fn, args, kwargs, stream) -> None:
+        try:
+            self._execute(job, fn, args, kwargs, stream)
+        finally:
+            self._retire(job)
+
+    def _execute(self, job: Job, fn, args, kwargs, stream) -> None:
+        token = job.cancel_token
+        if token.cancelled:   # cancelled while still queued
+            job._set(status="cancelled", error=f"Error: {token.reason}", finished=time.time())
+            return
+        job._set(status="running", started=time.time(), message="Starting…")
+        try:
+            with TELEMETRY.collect() as stats:
+                result = fn(*args, progress_callback=job.report,
+                            stream_callback=job.append if stream else None, cancel=token, **kwargs)
+            if token.cancelled:
+                job._set(status="cancelled", error=f"Error: {token.reason}", stats=stats, finished=time.time())
+            else:
+                job._set(status="done", result=result, stats=stats, progress=1.0, finished=time.time())
+        except Exception as e:
+            status = "cancelled" if token.cancelled else "failed"
+            job._set(status=status, error=f"Error: {e}", finished=time.time())
+
+    def _retire(self, job: Job) -> None:
+        """Charge a finished job to the queue, then evict to fit."""
+        with job._lock:
+            job._stream = []   # the live preview; the result now holds the text
+        with self._lock:
+            if self._jobs.get(job.id) is not job:
+                return
+            if job.owner is not None and self._latest.get(job.owner) != job.id:
+                self._drop(job.id)   # superseded while running
+                return
+            job.size = _text_bytes(job.result) + _text_bytes(job.error)
+            self._bytes += job.size
+            self._evict()
+
+    def _evict(self) -> None:
+        # Caller holds the lock
+        if self._bytes > self.max_bytes:
+            for jid in [jid for jid, j in self._jobs.items() if j.finished is not None]:
+                if self._bytes <= self.max_bytes:
+                    break
+                self._drop(jid)
+                self.evictions += 1
+
+    def _drop(self, job_id: str) -> None:
+        # Caller holds the lock
+        job = self._jobs.pop(job_id)
+        self._bytes -= job.size
+        if self._latest.get(job.owner) == job_id:
+            del self._latest[job.owner]
+
+    def cancel(self, job_id: str, reason: str = "Cancelled") -> bool:
+        """Trip a job's cancel token. False if the job is unknown or already finished."""
+        job = self.get(job_id)
+        if job is None or not job.pending:
+            return False
+        job.cancel_token.cancel(reason)
+        return True
+
+    def get(self, job_id: str):
+        """The Job, or None if the id is unknown, expired or evicted."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._jobs.move_to_end(job_id)
+            return job
+
+    def _purge(self, now: float) -> None:
+        # Caller holds the lock
+        expired = [jid for jid, job in self._jobs.items()
+                   if job.finished is not None and now - job.finished > self.ttl]
+        for jid in expired:
+            self._drop(jid)
+
+    def stats(self) -> dict:
+        """Job counts per state, plus the bytes held by finished jobs and
+        how many were evicted to stay under the ceilings."""
+        with self._lock:
+            counts = {state: 0 for state in PENDING_STATES + FINISHED_STATES}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+            counts.update(bytes=self._bytes, owners=len(self._latest), evictions=self.evictions)
+        return counts
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+
+# One queue per process, shared by every session
+JOBS = JobQueue()
@@ -0,0 +1,583 @@
+"""
+Humanization pipelines — pass construction, humanize() and chunked runs.
+"""
+
+import os
+import re
+from itertools import product
+from types import MappingProxyType
+
+from .cache import make_cache_key
+from .catalog import CONTENT_TYPES, FORBIDDEN_WORDS, GENERAL_BEST_MODEL, TONE_PROMPTS
+from .hedging import call_hedged
+from .providers import call_api
+from .scheduler import MAX_CONCURRENCY, WavefrontScheduler
+from .singleflight import PASSES
+from .stylometry import score_variants, targets_met
+from .telemetry import TELEMETRY
+from .text import clean_text, detector_instructions, remove_cliches
+from .tokens import CHARS_PER_TOKEN, output_budget
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  HUMANIZE — MAIN FUNCTION
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Rule lists shared by the general passes and their fused "fast" counterparts
+STRUCTURE_RULES = (
+    "- Reorder arguments or ideas within paragraphs (but keep ALL facts intact)\n"
+    "- Make paragraph lengths unequal — some very short (1-2 sentences), some longer\n"
+    "- Start at least two paragraphs mid-thought rather than with a clear topic sentence\n"
+    "- Do NOT add new information. Do NOT use AI buzzwords.\n"
+    "- Vary sentence lengths dramatically within each paragraph\n"
+)
+RHYTHM_RULES = (
+    "- After any sentence over 22 words, the next sentence should be under 10 words\n"
+    "- Replace every formal transition (However, Furthermore, Moreover, Additionally, "
+    "Consequently, Nevertheless) with a casual equivalent (But, Also, So, Plus, That said, Even so)\n"
+    "- The first sentence of at least two paragraphs should be unusually short — under 8 words\n"
+    "- At least one paragraph should have no clear 'topic sentence'\n"
+    "- If three consecutive sentences are similar in length, break the pattern\n"
+    "- Do NOT add new facts. Do NOT use AI buzzwords.\n"
+)
+POLISH_RULES = (
+    "- Fix any genuinely confusing or awkward phrasing\n"
+    "- Ensure the overall meaning and argument are still clear and intact\n"
+    "- If any AI buzzwords slipped in (delve, utilize, leverage, paramount, groundbreaking, "
+    "pivotal, robust, seamlessly), replace them with plain alternatives\n"
+    "- Do NOT add new content. Do NOT re-introduce AI sentence patterns.\n"
+)
+HUMANIZE_PREFIX = (
+    "Apply your full humanization approach to this text. Make it sound undeniably like a human wrote it:\n\n"
+)
+
+PIPELINES = ("general", "fast")   # overrides accepted for general content types
+
+
+def _compose_passes(content_type, tone, flags, pipeline) -> list:
+    """Build the pass specs for one PROMPT_TABLE entry (see build_passes).
+
+    System prompts lead with their longest invariant text (FORBIDDEN_WORDS,
+    fixed rule lists, then the detector rules) and end with the content-type
+    or tone text, so requests share the longest possible byte-identical
+    prefix for provider prompt caching.
+    """
+    ct = CONTENT_TYPES[content_type]
+    ct_sys = ct["system"]
+
+    # ─── FORMAL PIPELINE (1 pass) ──────────────────────────────────────
+    if ct["pipeline"] == "formal":
+        return [{
+            "label": "Rewriting…", "progress": 0.4,
+            "system": ct_sys, "user_prefix": "Edit this text:\n\n",
+            "temperature": 0.7, "output_ratio": 1.1, "max_tokens": 3000, "best_model": False,
+            "targets": None,
+        }]
+
+    # ─── GENERAL PIPELINE (4 passes) ───────────────────────────────────
+    det_rules = detector_instructions(*flags)
+
+    # Build the base humanization system prompt
+    if ct_sys:
+        base_sys = ct_sys
+    else:
+        base_sys = (
+            f"You are rewriting this text. {TONE_PROMPTS.get(tone, TONE_PROMPTS['Conversational'])}"
+        )
+
+    full_sys = f"{FORBIDDEN_WORDS}{det_rules}\n\n{base_sys}\n\nOutput ONLY the rewritten text. No preamble."
+
+    # ─── FAST PIPELINE (2 fused passes) ────────────────────────────────
+    if pipeline == "fast":
+        return [
+            # PASS 1 — Structure + voice
+            {
+                "label": "Pass 1 — Restructuring & humanizing…", "progress": 0.2,
+                "system": (
+                    f"{FORBIDDEN_WORDS}\n\nWhile rewriting, also break the text's predictable AI structure:\n"
+                    f"{STRUCTURE_RULES}{det_rules}\n\n{base_sys}\n\n"
+                    "Output ONLY the rewritten text. No preamble."
+                ),
+                "user_prefix": HUMANIZE_PREFIX,
+                "temperature": 1.2, "output_ratio": 1.2, "max_tokens": 3500, "best_model": True,
+                "targets": None,
+            },
+            # PASS 2 — Rhythm + polish
+            {
+                "label": "Pass 2 — Rhythm & polish…", "progress": 0.6,
+                "system": (
+                    "You are a sentence rhythm specialist and final editor. Make this text's rhythm feel "
+                    "undeniably human, and make it flow naturally while preserving all human-like qualities.\n\n"
+                    f"Rhythm rules:\n{RHYTHM_RULES}\nPolish rules:\n{POLISH_RULES}"
+                    "- Output ONLY the final text. No preamble."
+                ),
+                "user_prefix": "",
+                "temperature": 0.95, "output_ratio": 1.05, "max_tokens": 3500, "best_model": True,
+                "targets": None,
+            },
+        ]
+
+    return [
+        # PASS 1 — Structural deconstruction
+        # Goal: break AI's predictable paragraph layout before humanizing
+        {
+            "label": "Pass 1 — Restructuring…", "progress": 0.15,
+            "system": (
+                "You are a structural editor. Break this text's predictable AI structure.\n\n"
+                f"Rules:\n{STRUCTURE_RULES}"
+                "- Output ONLY the restructured text. No preamble."
+            ),
+            "user_prefix": "",
+            "temperature": 1.25, "output_ratio": 1.1, "max_tokens": 3500, "best_model": True,
+            "targets": None,
+        },
+        # PASS 2 — Voice and tone humanization
+        {
+            "label": "Pass 2 — Humanizing voice…", "progress": 0.40,
+            "system": full_sys,
+            "user_prefix": HUMANIZE_PREFIX,
+            "temperature": 1.15, "output_ratio": 1.2, "max_tokens": 3500, "best_model": True,
+            "targets": None,
+        },
+        # PASS 3 — Burstiness and rhythm
+        {
+            "label": "Pass 3 — Rhythm & burstiness…", "progress": 0.65,
+            "system": (
+                "You are a sentence rhythm specialist. Make this text's rhythm feel undeniably human.\n\n"
+                f"Rules:\n{RHYTHM_RULES}"
+                "- Output ONLY the result. No preamble."
+            ),
+            "user_prefix": "",
+            "temperature": 1.0, "output_ratio": 1.05, "max_tokens": 3500, "best_model": True,
+            "targets": "rhythm",   # every rule above but the topic-sentence one is checkable
+        },
+        # PASS 4 — Coherence and final polish
+        {
+            "label": "Pass 4 — Final polish…", "progress": 0.85,
+            "system": (
+                "Final quality pass. Make this text flow naturally while preserving all human-like qualities.\n\n"
+                f"Rules:\n{POLISH_RULES}"
+                "- Output ONLY the final text. No preamble."
+            ),
+            "user_prefix": "",
+            "temperature": 0.85, "output_ratio": 1.0, "max_tokens": 3500, "best_model": True,
+            "targets": None,
+        },
+    ]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  PROMPT TABLE — every pass list (content type × tone × detector flags ×
+#  pipeline) built once at import; requests only look theirs up
+# ─────────────────────────────────────────────────────────────────────────────
+
+DETECTOR_FLAGS = tuple(product((False, True), repeat=5))   # (gpt, ori, tur, zer, qui)
+
+
+def prompt_key(content_type, tone, flags, pipeline=None) -> tuple:
+    """Canonical PROMPT_TABLE key. Tone only matters to general content types
+    without a system prompt of their own, and the pipeline only to general ones."""
+    ct = CONTENT_TYPES[content_type]
+    if ct["pipeline"] == "formal":
+        return (content_type, None, None, "formal")
+    if ct["system"]:
+        tone = None
+    elif tone not in TONE_PROMPTS:
+        tone = "Conversational"
+    return (content_type, tone, tuple(bool(f) for f in flags), pipeline or "general")
+
+
+def _build_prompt_table() -> MappingProxyType:
+    table = {}
+    for content_type, ct in CONTENT_TYPES.items():
+        if ct["pipeline"] == "formal":
+            variants = [(None, DETECTOR_FLAGS[0], None)]
+        else:
+            tones = [None] if ct["system"] else list(TONE_PROMPTS)
+            variants = product(tones, DETECTOR_FLAGS, PIPELINES)
+        for tone, flags, pipeline in variants:
+            passes = _compose_passes(content_type, tone, flags, pipeline)
+            table[prompt_key(content_type, tone, flags, pipeline)] = tuple(
+                MappingProxyType(spec) for spec in passes)
+    return MappingProxyType(table)
+
+
+PROMPT_TABLE = _build_prompt_table()
+
+
+def build_passes(content_type, tone, gpt, ori, tur, zer, qui, pipeline=None) -> list:
+    """Return the ordered pass specs for a content type, from PROMPT_TABLE.
+
+    `pipeline` overrides the content type's own for general content: "fast"
+    fuses the four general passes into two calls (structure + voice, then
+    rhythm + polish). Formal content always runs its single pass.
+
+    Each pass is a read-only mapping: `label`/`progress` for the progress bar,
+    the `system` prompt, a `user_prefix` the upstream text is appended to,
+    `temperature`, `output_ratio` (expected output length relative to the
+    input) and `max_tokens` (the ceiling for the budget sized from it),
+    `best_model` (use GENERAL_BEST_MODEL instead of the selected model) and
+    `targets` (the stylometry.PASS_TARGETS check that makes the pass
+    skippable, or None).
+    """
+    if pipeline not in (None, *PIPELINES):
+        raise ValueError(f"Unknown pipeline: {pipeline}")
+    return list(PROMPT_TABLE[prompt_key(content_type, tone, (gpt, ori, tur, zer, qui), pipeline)])
+
+
+MAX_CONTINUATIONS   = int(os.environ.get("AUTHENTICA_MAX_CONTINUATIONS", 2))
+CONTINUE_TAIL_CHARS = 400   # how much of the cut-off output to quote back
+
+_SENTENCE_END_RE   = re.compile(r'[.!?]["\')\]]?(?=\s|$)')
+_PARA_BREAK_RE     = re.compile(r'[ \t]*\n\s*\n')   # a blank line right at the cut
+_TRAILING_BREAK_RE = re.compile(r'\n\s*\n\s*$')     # the cut piece ended a paragraph
+_LEADING_BREAK_RE  = re.compile(r'\s*\n')          # the continuation opens a new one
+
+
+def continuation_prompt(user: str, partial: str) -> str:
+    """The original request plus the tail of a cut-off answer, asking for the rest."""
+    return (
+        f"{user}\n\n---\nYour previous answer was cut off by the length limit. It ended with:\n\n"
+        f"…{partial[-CONTINUE_TAIL_CHARS:]}\n\n"
+        "Continue from exactly that point. Output ONLY the remaining text — "
+        "do not repeat anything already written."
+    )
+
+
+def trim_to_sentence(text: str) -> str:
+    """Drop an unfinished trailing sentence, if a sentence ends in the last half."""
+    last = None
+    for last in _SENTENCE_END_RE.finditer(text, len(text) // 2):
+        pass
+    return text[:last.end()] if last else text
+
+
+def generate(provider, api_key, model, system, user, temperature, max_tokens,
+             on_token=None, hedge=False, fallback_keys=None, cancel=None) -> str:
+    """One completion (hedged or plain), continued up to MAX_CONTINUATIONS
+    times while the provider reports it stopped at max_tokens.
+
+    Before each continuation `on_token` is called with the text kept so far and
+    replace=True: the unfinished sentence it already streamed is dropped."""
+    out, prompt, para_break = "", user, False
+    for attempt in range(MAX_CONTINUATIONS + 1):
+        meta = {}
+        if hedge:
+            piece = call_hedged(provider, api_key, model, system, prompt, temperature, max_tokens,
+                                on_token, fallback_keys, meta, cancel)
+        else:
+            piece = call_api(provider, api_key, model, system, prompt, temperature, max_tokens,
+                             on_token, meta, cancel)
+        if out:
+            joiner = "\n\n" if para_break or _LEADING_BREAK_RE.match(piece) else " "
+            out = f"{out}{joiner}{clean_text(piece)}"
+        else:
+            out = piece
+        if meta.get("finish_reason") != "length" or attempt == MAX_CONTINUATIONS:
+            return out
+        if attempt == 0:
+            # Don't quote a preamble or <think> tail back to the model
+            out = clean_text(out)
+        # Restart from a sentence boundary so the pieces join cleanly, remembering
+        # whether that boundary also closed a paragraph
+        trimmed = trim_to_sentence(out)
+        para_break = bool(_PARA_BREAK_RE.match(out[len(trimmed):])
+                          or trimmed == out and _TRAILING_BREAK_RE.search(piece))
+        out = trimmed
+        if on_token is not None:
+            on_token(out + ("\n\n" if para_break else " "), replace=True)
+        prompt = continuation_prompt(user, out)
+    return out
+
+
+def run_pass(spec: dict, text: str, provider: str, api_key: str, model_id: str,
+             cache=None, on_token=None, hedge=False, fallback_keys=None, adaptive=False,
+             cancel=None) -> str:
+    """Run one pass over `text` and return the cleaned output.
+
+    With `adaptive`, a pass whose `targets` the text already meets (checked
+    locally by stylometry) is skipped and `text` is returned unchanged.
+
+    When `cache` (a ResultCache) is given, the pass is memoized on exactly the
+    inputs that feed it — model, prompts, temperature and upstream text — so a
+    rerun with different settings restarts from the first pass that changed.
+    Identical cached passes already in flight elsewhere in the process are
+    waited on rather than repeated (singleflight.PASSES).
+
+    With `hedge`, the call goes through call_hedged(): slow calls are raced
+    against alternate models (or providers in `fallback_keys`, a
+    {provider: api_key} dict) and hard errors fail over to them.
+
+    `max_tokens` is sized from the input (see output_budget), and a completion
+    cut off at that limit is continued rather than losing its tail.
+
+    Calls and cache hits are recorded in TELEMETRY under the pass label.
+
+    A tripped `cancel` token (cancel.CancelToken) raises Cancelled before the
+    pass starts, or inside its provider call (see call_api).
+    """
+    if cancel is not None:
+        cancel.raise_if_cancelled()
+    # For general pipeline, always use the best model for the provider
+    model = GENERAL_BEST_MODEL.get(provider, model_id) if spec["best_model"] else model_id
+    user = spec["user_prefix"] + text
+    max_tokens = output_budget(text, model, spec["output_ratio"], spec["max_tokens"])
+    out = None
+    with TELEMETRY.pass_scope(spec["label"]):
+        if adaptive and targets_met(spec["targets"], text):
+            TELEMETRY.record_skip(provider, model)
+            return text
+        if cache is not None:
+            key = make_cache_key("pass", provider, model, spec["system"], user, spec["temperature"], spec["max_tokens"])
+            out = cache.get(key)
+            if out is not None:
+                TELEMETRY.record_cache_hit(provider, model)
+        if out is None and cache is None:
+            out = generate(provider, api_key, model, spec["system"], user, spec["temperature"],
+                           max_tokens, on_token, hedge, fallback_keys, cancel)
+        elif out is None:
+            def generate_and_store():
+                result = generate(provider, api_key, model, spec["system"], user, spec["temperature"],
+                                  max_tokens, on_token, hedge, fallback_keys, cancel)
+                cache.set(key, result)
+                return result
+            out = PASSES.do(key, generate_and_store, cancel,
+                            on_shared=lambda: TELEMETRY.record_coalesced(provider, model))
+    return clean_text(out)
+
+
+def humanize(text, content_type, tone, provider, api_key, model_id,
+             stealth, gpt, ori, tur, zer, qui, progress_callback=None, cache=None,
+             stream_callback=None, hedge=False, fallback_keys=None, adaptive=False, pipeline=None,
+             cancel=None):
+    """Run the content type's pipeline over `text` (or `pipeline`, see build_passes).
+
+    `cache`, `hedge`, `fallback_keys`, `adaptive` and `cancel` apply to each pass
+    (see run_pass); a cancelled run returns "Error: Cancelled".
+    When `stream_callback` is given,
+    completions are streamed: each text delta of the final pass is passed to it,
+    and intermediate passes report a running token count through
+    `progress_callback`. A call with replace=True carries the whole text so far
+    and replaces what was streamed before (see generate).
+    """
+
+    def live(frac, label, final=False):
+        """Token sink for one pass, or None when not streaming."""
+        if stream_callback is None:
+            return None
+        if final:
+            return stream_callback
+        count = 0
+
+        def on_token(_delta, replace=False):
+            nonlocal count
+            if replace:
+                return
+            count += 1
+            if progress_callback and count % 10 == 0:
+                progress_callback(frac, f"{label} {count} tokens")
+        return on_token
+
+    try:
+        passes = build_passes(content_type, tone, gpt, ori, tur, zer, qui, pipeline)
+        result = text
+        for i, spec in enumerate(passes):
+            if progress_callback:
+                progress_callback(spec["progress"], spec["label"])
+            on_token = live(spec["progress"], spec["label"], final=i == len(passes) - 1)
+            result = run_pass(spec, result, provider, api_key, model_id, cache, on_token,
+                              hedge, fallback_keys, adaptive, cancel)
+
+        if stealth:
+            result = remove_cliches(result)
+
+        if progress_callback:
+            progress_callback(1.0, "Done")
+
+        return result
+
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  CHUNKING — long documents are split on paragraph boundaries and the chunks
+#  run through the pipeline concurrently, then stitched back in order
+# ─────────────────────────────────────────────────────────────────────────────
+
+CHUNK_TOKENS = int(os.environ.get("AUTHENTICA_CHUNK_TOKENS", 900))
+
+
+def split_into_chunks(text: str, max_tokens: int = CHUNK_TOKENS) -> list:
+    """Greedily pack whole paragraphs into chunks of at most ~max_tokens.
+    A single paragraph over budget becomes its own run of sentence-split chunks."""
+    budget = max_tokens * CHARS_PER_TOKEN
+    chunks, cur, cur_len = [], [], 0
+
+    def flush():
+        nonlocal cur, cur_len
+        if cur:
+            chunks.append("\n\n".join(cur))
+        cur, cur_len = [], 0
+
+    for para in (p.strip() for p in re.split(r'\n\s*\n', text)):
+        if not para:
+            continue
+        if len(para) > budget:
+            flush()
+            piece = ""
+            for sentence in re.split(r'(?<=[.!?])\s+', para):
+                if piece and len(piece) + 1 + len(sentence) > budget:
+                    chunks.append(piece)
+                    piece = sentence
+                else:
+                    piece = f"{piece} {sentence}" if piece else sentence
+            if piece:
+                chunks.append(piece)
+            continue
+        if cur and cur_len + 2 + len(para) > budget:
+            flush()
+        cur.append(para)
+        cur_len += len(para) + (2 if cur_len else 0)
+    flush()
+    return chunks
+
+
+def pass_stages(passes: list, provider: str, api_key: str, model_id: str, cache=None,
+                hedge=False, fallback_keys=None, adaptive=False, cancel=None) -> list:
+    """Bind pass specs into WavefrontScheduler stages (text -> cleaned text)."""
+    return [
+        lambda value, spec=spec: run_pass(spec, value, provider, api_key, model_id, cache,
+                                          hedge=hedge, fallback_keys=fallback_keys, adaptive=adaptive,
+                                          cancel=cancel)
+        for spec in passes
+    ]
+
+
+def humanize_chunked(text, content_type, tone, provider, api_key, model_id,
+                     stealth, gpt, ori, tur, zer, qui, progress_callback=None, cache=None,
+                     stream_callback=None, hedge=False, fallback_keys=None, adaptive=False, pipeline=None,
+                     cancel=None, max_workers=MAX_CONCURRENCY, chunk_tokens=CHUNK_TOKENS):
+    """humanize() for documents of any length.
+
+    Short inputs go straight through humanize() (streaming included). Longer ones
+    are split into chunks whose passes are pipelined by a WavefrontScheduler, so
+    wall-clock time tracks chunk latency rather than document length.
+    Callbacks are only invoked from the calling thread.
+    """
+    chunks = split_into_chunks(text, chunk_tokens)
+    if len(chunks) <= 1:
+        return humanize(text, content_type, tone, provider, api_key, model_id,
+                        stealth, gpt, ori, tur, zer, qui,
+                        progress_callback=progress_callback, cache=cache,
+                        stream_callback=stream_callback, hedge=hedge, fallback_keys=fallback_keys,
+                        adaptive=adaptive, pipeline=pipeline, cancel=cancel)
+
+    try:
+        passes = build_passes(content_type, tone, gpt, ori, tur, zer, qui, pipeline)
+        stages = pass_stages(passes, provider, api_key, model_id, cache, hedge, fallback_keys, adaptive, cancel)
+        jobs = [{"value": chunk, "stages": stages, "provider": provider} for chunk in chunks]
+
+        def report(done, total):
+            if progress_callback:
+                progress_callback(0.05 + 0.9 * done / total,
+                                  f"{len(chunks)} chunks — {done}/{total} passes done")
+
+        results = WavefrontScheduler(max_workers).run(jobs, report)
+        if stealth:
+            results = [remove_cliches(r) for r in results]
+        if progress_callback:
+            progress_callback(1.0, "Done")
+        return "\n\n".join(results)
+
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  VARIANTS — best-of-N: the same pipeline at spread-out temperatures, run
+#  concurrently and ranked locally, instead of N sequential reruns
+# ─────────────────────────────────────────────────────────────────────────────
+
+MAX_VARIANTS      = int(os.environ.get("AUTHENTICA_MAX_VARIANTS", 5))
+VARIANT_STEP      = float(os.environ.get("AUTHENTICA_VARIANT_STEP", 0.15))   # temperature spacing
+TEMPERATURE_RANGE = (0.1, 1.5)
+
+
+def variant_offsets(n: int, step: float = VARIANT_STEP) -> list:
+    """Temperature offsets for n variants: 0, +step, -step, +2·step, -2·step, …
+    Variant 0 is the plain pipeline, so it shares the pass cache with normal runs."""
+    offsets = [0.0]
+    for i in range(1, n):
+        offsets.append(step * ((i + 1) // 2) * (1 if i % 2 else -1))
+    return offsets[:n]
+
+
+def shift_temperature(passes: list, offset: float) -> list:
+    """Copies of the pass specs with temperatures moved by `offset`, clamped to TEMPERATURE_RANGE."""
+    if not offset:
+        return passes
+    low, high = TEMPERATURE_RANGE
+    return [MappingProxyType(dict(spec, temperature=round(min(max(spec["temperature"] + offset, low), high), 2)))
+            for spec in passes]
+
+
+def humanize_variants(text, content_type, tone, provider, api_key, model_id,
+                      stealth, gpt, ori, tur, zer, qui, n=3, progress_callback=None, cache=None,
+                      hedge=False, fallback_keys=None, adaptive=False, pipeline=None, cancel=None,
+                      max_workers=MAX_CONCURRENCY, chunk_tokens=CHUNK_TOKENS) -> list:
+    """Run `n` (at most MAX_VARIANTS) temperature-shifted copies of the pipeline
+    over `text` at once and rank them with stylometry.score_variants().
+
+    Returns one {"text", "score", "offset"} dict per variant, best first. A
+    failed variant keeps its "Error: ..." text, scores None and sorts last.
+    Long inputs are chunked as in humanize_chunked() (not at all with
+    `chunk_tokens=None`); every chunk of every variant goes through one
+    WavefrontScheduler, so provider caps still hold.
+    Streaming is not offered: no variant is final until all are scored.
+    Without NumPy the variants come back unscored, in offset order.
+    """
+    offsets = variant_offsets(max(1, min(n, MAX_VARIANTS)))
+    try:
+        chunks = (split_into_chunks(text, chunk_tokens) if chunk_tokens else None) or [text]
+        passes = build_passes(content_type, tone, gpt, ori, tur, zer, qui, pipeline)
+        jobs = [
+            {"value": chunk, "provider": provider,
+             "stages": pass_stages(shift_temperature(passes, offset), provider, api_key, model_id, cache,
+                                   hedge, fallback_keys, adaptive, cancel)}
+            for offset in offsets for chunk in chunks
+        ]
+
+        def report(done, total):
+            if progress_callback:
+                progress_callback(0.05 + 0.85 * done / total,
+                                  f"{len(offsets)} variants — {done}/{total} passes done")
+
+        results = WavefrontScheduler(max_workers).run(jobs, report, fail_fast=False)
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+    except Exception as e:
+        return [{"text": f"Error: {str(e)}", "score": None, "offset": 0.0}]
+
+    variants = []
+    for i, offset in enumerate(offsets):
+        parts = results[i * len(chunks):(i + 1) * len(chunks)]
+        failed = next((p for p in parts if isinstance(p, Exception)), None)
+        if failed is not None:
+            variants.append({"text": f"Error: {str(failed)}", "score": None, "offset": offset})
+            continue
+        out = "\n\n".join(parts)
+        variants.append({"text": remove_cliches(out) if stealth else out, "score": None, "offset": offset})
+
+    if progress_callback:
+        progress_callback(0.95, "Scoring variants")
+    ok = [v for v in variants if not v["text"].startswith("Error:")]
+    try:
+        for variant, score in zip(ok, score_variants([v["text"] for v in ok], source=text) if ok else []):
+            variant["score"] = score
+    except ImportError:
+        pass
+    variants.sort(key=lambda v: (v["text"].startswith("Error:"), -(v["score"] or 0.0)))
+    if progress_callback:
+        progress_callback(1.0, "Done")
+    return variants
@@ -0,0 +1,385 @@
+"""
+Provider API wrappers — OpenRouter, Groq and Gemini behind one call_api().
+SDKs are imported lazily, so only the providers actually used need installing.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from .ratelimit import (
+    MAX_RETRIES, MAX_RETRY_AFTER, RATE_LIMITER, QuotaExhausted, backoff, is_retryable, retry_after, status_of,
+)
+from .telemetry import TELEMETRY, first_token, note_usage
+from .tokens import ESTIMATOR
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  PROVIDER CLIENT POOL
+#  Clients are built once per (provider, api_key) and reused across passes,
+#  reruns and users, so only the first pass pays for TCP/TLS setup and SDK import.
+#  Connections are model-agnostic, so the model is not part of the pool key.
+# ─────────────────────────────────────────────────────────────────────────────
+
+CLIENT_POOL_MAX_SIZE = int(os.environ.get("AUTHENTICA_CLIENT_POOL_SIZE", 32))
+CLIENT_POOL_IDLE_TTL = float(os.environ.get("AUTHENTICA_CLIENT_IDLE_TTL", 600))  # seconds
+
+
+class GeminiHandle:
+    """A GenerativeServiceClient bound to one API key.
+
+    genai.configure() sets process-global state that GenerativeModel picks up
+    lazily at call time, so it is never used here: every model built from the
+    handle is given this key's own client instead, and concurrent sessions
+    with different keys can't send under each other's key.
+    """
+
+    def __init__(self, api_key: str):
+        import google.generativeai as genai
+        from google.ai import generativelanguage as glm
+        self.genai = genai
+        self.api_key = api_key
+        self.client = glm.GenerativeServiceClient(client_options={"api_key": api_key})
+
+    def model(self, **kwargs):
+        model = self.genai.GenerativeModel(**kwargs)
+        # generate_content() falls back to the global default client when unset
+        model._client = self.client
+        return model
+
+    def close(self):
+        self.client.transport.close()
+
+
+def _make_client(provider: str, api_key: str):
+    if provider == "openrouter":
+        import requests
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=16)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://authentica-humanizer.app",
+            "X-Title": "Authentica v6",
+        })
+        return session
+    if provider == "groq":
+        from groq import Groq
+        return Groq(api_key=api_key, max_retries=0)   # retries are handled in call_api
+    if provider == "gemini":
+        return GeminiHandle(api_key)
+    raise ValueError(f"Unknown provider: {provider}")
+
+
+class ClientPool:
+    """Bounded LRU registry of provider clients with idle eviction."""
+
+    def __init__(self, max_size: int = CLIENT_POOL_MAX_SIZE, idle_ttl: float = CLIENT_POOL_IDLE_TTL):
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl
+        self._clients = OrderedDict()   # (provider, api_key) -> [client, last_used]
+        self._lock = threading.Lock()
+
+    def get(self, provider: str, api_key: str):
+        key = (provider, api_key)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._clients.get(key)
+            if entry is not None:
+                entry[1] = now
+                self._clients.move_to_end(key)
+                return entry[0]
+        # Build outside the lock: first-time SDK imports can take a while
+        client = _make_client(provider, api_key)
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                entry[1] = now
+                return entry[0]
+            self._clients[key] = [client, now]
+            while len(self._clients) > self.max_size:
+                # Dropped, not closed: another thread may still be mid-request on it
+                self._clients.popitem(last=False)
+        return client
+
+    def _evict_idle(self, now: float) -> None:
+        while self._clients:
+            key, (client, last_used) = next(iter(self._clients.items()))
+            if now - last_used < self.idle_ttl:
+                break
+            del self._clients[key]
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def __len__(self):
+        return len(self._clients)
+
+
+# One pool per process, shared by every session and batch worker
+CLIENT_POOL = ClientPool()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  API CALL WRAPPERS
+#  Base URLs can be pointed at a local stand-in (benchmarks/standin_server.py);
+#  the Groq SDK reads GROQ_BASE_URL itself.
+# ─────────────────────────────────────────────────────────────────────────────
+
+OPENROUTER_BASE_URL = os.environ.get("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1").rstrip("/")
+
+# Provider prompt caching. OpenAI, DeepSeek and Groq cache shared prompt
+# prefixes on their own; these OpenRouter routes only cache behind an explicit
+# cache_control breakpoint, which goes on the (table-built, stable) system prompt.
+# None of the catalog's OpenRouter models are such routes, so the breakpoint
+# only applies to models named with the CLI's --model (or call_api() directly).
+PROMPT_CACHE         = os.environ.get("AUTHENTICA_PROMPT_CACHE", "1") != "0"
+CACHE_CONTROL_MODELS = ("anthropic/", "google/gemini")
+
+
+def _system_message(model: str, system: str) -> dict:
+    if PROMPT_CACHE and model.startswith(CACHE_CONTROL_MODELS):
+        return {"role": "system", "content": [
+            {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}},
+        ]}
+    return {"role": "system", "content": system}
+
+
+def call_openrouter(api_key: str, model: str, system: str, user: str, temperature: float, max_tokens: int = 3500,
+                    on_token=None) -> str:
+    session = CLIENT_POOL.get("openrouter", api_key)
+    body = {
+        "model": model,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "messages": [
+            _system_message(model, system),
+            {"role": "user", "content": user},
+        ],
+    }
+    url = f"{OPENROUTER_BASE_URL}/chat/completions"
+    if on_token is None:
+        r = session.post(url, json=body, timeout=120)
+        r.raise_for_status()
+        data = r.json()
+        _note_usage(data.get("usage"))
+        note_finish(data["choices"][0].get("finish_reason"))
+        # Handle cases where content may be empty (reasoning models)
+        content = data["choices"][0]["message"].get("content") or ""
+        return content.strip()
+
+    # Streaming: server-sent events, one "data: {json}" line per delta.
+    # Lines starting with ":" are keep-alive comments and are skipped.
+    body["stream"] = True
+    body["stream_options"] = {"include_usage": True}
+    parts = []
+    with session.post(url, json=body, timeout=120, stream=True) as r:
+        r.raise_for_status()
+        for raw in r.iter_lines():
+            line = raw.decode("utf-8", errors="replace")
+            if not line.startswith("data:"):
+                continue
+            payload = line[5:].strip()
+            if payload == "[DONE]":
+                break
+            chunk = json.loads(payload)
+            if "error" in chunk:
+                raise RuntimeError(chunk["error"].get("message", "OpenRouter stream error"))
+            _note_usage(chunk.get("usage"))   # sent on the final chunk
+            choices = chunk.get("choices") or []
+            if choices:
+                note_finish(choices[0].get("finish_reason"))
+            delta = (choices[0].get("delta") or {}).get("content") if choices else None
+            if delta:
+                parts.append(delta)
+                on_token(delta)
+    return "".join(parts).strip()
+
+
+def call_groq(api_key: str, model: str, system: str, user: str, temperature: float, max_tokens: int = 3500,
+              on_token=None) -> str:
+    client = CLIENT_POOL.get("groq", api_key)
+    r = client.chat.completions.create(
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        top_p=0.95,
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user",   "content": user},
+        ],
+        stream=on_token is not None,
+    )
+    if on_token is None:
+        _note_usage(r.usage)
+        note_finish(r.choices[0].finish_reason)
+        return r.choices[0].message.content.strip()
+    parts = []
+    for chunk in r:
+        # Groq reports stream usage on the last chunk, under x_groq
+        _note_usage(getattr(getattr(chunk, "x_groq", None), "usage", None))
+        if chunk.choices:
+            note_finish(chunk.choices[0].finish_reason)
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            parts.append(delta)
+            on_token(delta)
+    return "".join(parts).strip()
+
+
+def call_gemini(api_key: str, model: str, system: str, user: str, temperature: float, max_tokens: int = 3500,
+                on_token=None) -> str:
+    handle = CLIENT_POOL.get("gemini", api_key)
+    gmodel = handle.model(
+        model_name=model,
+        system_instruction=system,
+        generation_config=handle.genai.types.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+        )
+    )
+    if on_token is None:
+        response = gmodel.generate_content(user)
+        _note_gemini(response)
+        return response.text.strip()
+    parts = []
+    response = gmodel.generate_content(user, stream=True)
+    for chunk in response:
+        try:
+            delta = chunk.text
+        except ValueError:  # chunk without text parts (e.g. safety metadata only)
+            continue
+        if delta:
+            parts.append(delta)
+            on_token(delta)
+    _note_gemini(response)
+    return "".join(parts).strip()
+
+
+def _note_usage(usage) -> None:
+    """Forward an OpenAI-style usage block (dict or SDK object) to telemetry."""
+    if not usage:
+        return
+    get = usage.get if isinstance(usage, dict) else lambda k: getattr(usage, k, None)
+    details = get("prompt_tokens_details") or {}
+    cached = details.get("cached_tokens") if isinstance(details, dict) else getattr(details, "cached_tokens", None)
+    note_usage(get("prompt_tokens"), get("completion_tokens"), cached)
+
+
+def _note_gemini(response) -> None:
+    meta = getattr(response, "usage_metadata", None)
+    if meta is not None:
+        note_usage(getattr(meta, "prompt_token_count", None), getattr(meta, "candidates_token_count", None),
+                   getattr(meta, "cached_content_token_count", None))
+    candidates = getattr(response, "candidates", None)
+    if candidates:
+        note_finish(getattr(candidates[0], "finish_reason", None))
+
+
+# Per-call scratch dict that backends report into; see call_api(meta=...)
+_call_meta = contextvars.ContextVar("authentica_call_meta", default=None)
+
+
+def note_finish(reason) -> None:
+    """Record the completion's finish reason (plain string or SDK enum).
+    A token-limit stop is normalized to "length" for every provider."""
+    meta = _call_meta.get()
+    if meta is None or not reason:
+        return
+    reason = str(getattr(reason, "name", reason)).lower()
+    meta["finish_reason"] = "length" if reason in ("length", "max_tokens") else reason
+
+
+# provider name -> fn(api_key, model, system, user, temperature, max_tokens, on_token)
+PROVIDER_BACKENDS = {
+    "openrouter": call_openrouter,
+    "groq":       call_groq,
+    "gemini":     call_gemini,
+}
+
+
+def register_provider(name: str, fn) -> None:
+    """Plug in an extra backend (e.g. a mock for benchmarks) under `name`.
+    It takes the same arguments as call_openrouter()."""
+    PROVIDER_BACKENDS[name] = fn
+
+
+def _dispatch(provider, api_key, model, system, user, temperature, max_tokens, on_token):
+    fn = PROVIDER_BACKENDS.get(provider)
+    if fn is None:
+        raise ValueError(f"Unknown provider: {provider}")
+    return fn(api_key, model, system, user, temperature, max_tokens, on_token)
+
+
+def call_api(provider: str, api_key: str, model: str, system: str, user: str,
+             temperature: float, max_tokens: int = 3500, on_token=None, meta: dict = None,
+             cancel=None) -> str:
+    """Dispatch to a provider. With `on_token`, the completion is streamed and
+    each text delta is passed to it as it arrives; the full text is still returned.
+    A `meta` dict receives the completion's "finish_reason" ("length" when it
+    hit max_tokens) and "sent_at", the time.monotonic() at which the first
+    attempt left the rate limiter.
+
+    A tripped `cancel` token (cancel.CancelToken) raises Cancelled before each
+    attempt, during pacing and backoff waits and, when streaming, at the next
+    delta — which closes the connection mid-completion.
+
+    Every attempt waits for a slot in the key's rate-limit bucket. 429s and
+    transient failures are retried with exponential backoff and jitter, honoring
+    Retry-After — unless part of a stream was already delivered. A Retry-After
+    longer than MAX_RETRY_AFTER raises QuotaExhausted instead of sleeping.
+
+    Each invocation is recorded in TELEMETRY: wall time (including pacing and
+    retries), time to first streamed token, token usage and retry count.
+    """
+    streamed = False
+
+    def forward(delta):
+        nonlocal streamed
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+        if not streamed:
+            first_token()
+        streamed = True
+        on_token(delta)
+
+    meta_token = _call_meta.set({} if meta is None else meta)
+    try:
+        with TELEMETRY.call(provider, model) as record:
+            for attempt in range(MAX_RETRIES + 1):
+                record["retries"] = attempt
+                if cancel is not None:
+                    cancel.raise_if_cancelled()
+                RATE_LIMITER.acquire(provider, api_key, cancel)
+                _call_meta.get().setdefault("sent_at", time.monotonic())
+                try:
+                    out = _dispatch(provider, api_key, model, system, user, temperature, max_tokens,
+                                    forward if on_token else None)
+                    # Refine the token estimator from what the provider actually billed
+                    ESTIMATOR.calibrate(model, len(system) + len(user), record["prompt_tokens"])
+                    return out
+                except Exception as e:
+                    if streamed or attempt == MAX_RETRIES or not is_retryable(e):
+                        raise
+                    delay = retry_after(e)
+                    if delay is not None and delay > MAX_RETRY_AFTER:
+                        # Sleeping it out would hold a job worker, and the whole key, for that long
+                        raise QuotaExhausted(
+                            f"{provider} asked to retry after {delay:.0f}s (limit {MAX_RETRY_AFTER:.0f}s)"
+                            " — try again later or use another key."
+                        ) from e
+                    if delay is None:
+                        delay = backoff(attempt)
+                    if status_of(e) == 429:
+                        # The whole key is throttled: hold back every caller, not just this one
+                        RATE_LIMITER.pause(provider, api_key, delay)
+                    (cancel.sleep if cancel is not None else time.sleep)(delay)
+    finally:
+        _call_meta.reset(meta_token)
@@ -0,0 +1,219 @@
+"""
+Rate limiting — per-key token buckets for free-tier quotas, plus the retry
+policy call_api() applies to 429s and transient provider failures.
+
+Limits default to the free tiers in catalog.PROVIDER_LIMITS and are
+overridden per provider with AUTHENTICA_<PROVIDER>_RPM / _RPD (0 = no limit)
+or RateLimiter.set_limit() (the CLI's --rate-limit). The catalog's daily caps
+are only enforced locally with AUTHENTICA_ENFORCE_RPD=1: the counter lives in
+this process, so the provider's own 429s are what track the real quota.
+"""
+
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from .catalog import PROVIDER_LIMITS
+
+MAX_RETRIES   = int(os.environ.get("AUTHENTICA_MAX_RETRIES", 4))
+BACKOFF_BASE  = 1.0    # seconds; doubled per attempt
+BACKOFF_CAP   = 30.0   # seconds
+# Longest Retry-After worth sleeping through; beyond it the call fails with QuotaExhausted
+MAX_RETRY_AFTER = float(os.environ.get("AUTHENTICA_MAX_RETRY_AFTER", BACKOFF_CAP))
+RETRY_STATUSES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+ENFORCE_RPD   = os.environ.get("AUTHENTICA_ENFORCE_RPD", "").lower() in ("1", "true", "yes", "on")
+
+# Network-level failures worth retrying, matched by name so no SDK is imported
+TRANSIENT_ERRORS = {
+    "ConnectionError", "ConnectTimeout", "ReadTimeout", "Timeout", "ChunkedEncodingError",
+    "APIConnectionError", "APITimeoutError", "ServiceUnavailable", "DeadlineExceeded",
+}
+
+
+class QuotaExhausted(RuntimeError):
+    """The request quota for a provider key is used up — the local daily cap,
+    or a Retry-After longer than MAX_RETRY_AFTER."""
+
+
+def _env_limit(provider: str, kind: str):
+    value = os.environ.get(f"AUTHENTICA_{provider.upper()}_{kind}")
+    return None if value in (None, "") else int(value)
+
+
+def configured_limits(defaults: dict = None) -> dict:
+    """Per-provider {"rpm", "rpd"} after env overrides; None means unlimited.
+    Catalog daily caps are dropped unless AUTHENTICA_ENFORCE_RPD is set; an
+    explicit AUTHENTICA_<PROVIDER>_RPD always applies."""
+    defaults = PROVIDER_LIMITS if defaults is None else defaults
+    limits = {}
+    for provider, limit in defaults.items():
+        rpm, rpd = _env_limit(provider, "RPM"), _env_limit(provider, "RPD")
+        limits[provider] = {
+            "rpm": limit.get("rpm") if rpm is None else rpm or None,
+            "rpd": (limit.get("rpd") if ENFORCE_RPD else None) if rpd is None else rpd or None,
+        }
+    return limits
+
+
+def parse_rate_limit(spec: str) -> tuple:
+    """"PROVIDER=RPM[/RPD]" -> (provider, rpm, rpd), with 0 or a missing RPD as None."""
+    provider, sep, value = spec.partition("=")
+    rpm, _, rpd = value.partition("/")
+    try:
+        if not (provider and sep and rpm):
+            raise ValueError
+        return provider, int(rpm) or None, int(rpd) if rpd else None
+    except ValueError:
+        raise ValueError(f"expected PROVIDER=RPM[/RPD], got {spec!r}") from None
+
+
+class TokenBucket:
+    """Requests-per-minute bucket with an optional daily cap (reset at UTC midnight).
+
+    Callers reserve a slot and are told how long to wait for it, so concurrent
+    callers queue in arrival order instead of failing. A reservation counts
+    against the daily cap once commit()ed after the wait; one given up with
+    release() (a cancelled wait) costs nothing.
+    """
+
+    def __init__(self, rpm: int = None, rpd: int = None):
+        self.capacity = max(1, rpm or 1)
+        self.rate = rpm / 60.0 if rpm else None   # None: no per-minute pacing
+        self.rpd = rpd
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.day = None
+        self.used_today = 0
+        self.reserved = 0   # reservations still waiting to send
+        self._lock = threading.Lock()
+
+    def _roll_day(self) -> None:
+        # Caller holds the lock
+        today = datetime.now(timezone.utc).date()
+        if today != self.day:
+            self.day, self.used_today = today, 0
+
+    def reserve(self) -> float:
+        """Claim one request and return the seconds to wait before sending it."""
+        with self._lock:
+            now = time.monotonic()
+            self._roll_day()
+            if self.rpd is not None and self.used_today + self.reserved >= self.rpd:
+                raise QuotaExhausted(f"Daily quota of {self.rpd} requests reached — resets at 00:00 UTC.")
+            self.reserved += 1
+            wait = 0.0
+            if self.rate is not None:
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                self.tokens -= 1
+                wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.paused_until - now)
+
+    def commit(self) -> None:
+        """The reserved request is being sent: count it against the daily cap."""
+        with self._lock:
+            self._roll_day()
+            self.reserved -= 1
+            self.used_today += 1
+
+    def release(self) -> None:
+        """Give a reservation back unused (its wait was cancelled)."""
+        with self._lock:
+            self.reserved -= 1
+            if self.rate is not None:
+                self.tokens = min(self.capacity, self.tokens + 1)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller back for `seconds` (the provider said Retry-After)."""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    """Process-wide registry of token buckets keyed by (provider, api_key)."""
+
+    def __init__(self, limits: dict = None):
+        self.limits = configured_limits() if limits is None else dict(limits)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, provider: str, rpm: int = None, rpd: int = None) -> None:
+        """Replace `provider`'s limits (None or 0 = unlimited); existing buckets are dropped."""
+        with self._lock:
+            self.limits[provider] = {"rpm": rpm or None, "rpd": rpd or None}
+            for key in [k for k in self._buckets if k[0] == provider]:
+                del self._buckets[key]
+
+    def bucket(self, provider: str, api_key: str):
+        with self._lock:
+            key = (provider, api_key)
+            if key not in self._buckets:
+                limit = self.limits.get(provider) or {}
+                rpm, rpd = limit.get("rpm"), limit.get("rpd")
+                self._buckets[key] = TokenBucket(rpm, rpd) if rpm or rpd else None
+            return self._buckets[key]
+
+    def acquire(self, provider: str, api_key: str, cancel=None) -> None:
+        """Block until a request to `provider` may be sent (or `cancel` is tripped).
+        The request only counts against a daily cap once the wait is over."""
+        bucket = self.bucket(provider, api_key)
+        if bucket is not None:
+            wait = bucket.reserve()
+            try:
+                if wait > 0:
+                    (cancel.sleep if cancel is not None else time.sleep)(wait)
+            except BaseException:
+                bucket.release()
+                raise
+            bucket.commit()
+
+    def pause(self, provider: str, api_key: str, seconds: float) -> None:
+        bucket = self.bucket(provider, api_key)
+        if bucket is not None:
+            bucket.pause(seconds)
+
+
+RATE_LIMITER = RateLimiter()
+
+
+def status_of(exc: Exception):
+    """Best-effort HTTP status of a provider exception (requests, groq, google)."""
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    return getattr(getattr(exc, "response", None), "status_code", None)
+
+
+def retry_after(exc: Exception):
+    """Seconds from a Retry-After header on the exception's response, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, QuotaExhausted):
+        return False
+    status = status_of(exc)
+    if status is not None:
+        return status in RETRY_STATUSES
+    return type(exc).__name__ in TRANSIENT_ERRORS or isinstance(exc, (ConnectionError, TimeoutError))
+
+
+def backoff(attempt: int) -> float:
+    """Exponential backoff with full jitter."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
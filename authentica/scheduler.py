@@ -0,0 +1,156 @@
+"""
+Wavefront scheduler — pipelines multi-stage jobs across a bounded thread pool.
+"""
+
+import contextvars
+import heapq
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  WAVEFRONT SCHEDULER — runs many pass pipelines at pass granularity, so chunk
+#  N can be in pass 2 while chunk N+1 is still in pass 1
+# ─────────────────────────────────────────────────────────────────────────────
+
+MAX_CONCURRENCY = int(os.environ.get("AUTHENTICA_MAX_CONCURRENCY", 8))
+
+# In-flight request caps per provider (free tiers throttle bursts hard)
+PROVIDER_CONCURRENCY = {
+    "openrouter": 4,
+    "groq":       6,
+    "gemini":     4,
+}
+
+
+class WavefrontScheduler:
+    """Pipelines independent jobs through their stages like an instruction pipeline.
+
+    A job is a dict with an initial `value`, a list of `stages` (callables
+    value -> value, run strictly in order) and the `provider` its stages hit.
+    Each stage is one task; ready tasks are dispatched deepest-stage first, then
+    by job order, under a global concurrency cap and per-provider caps.
+    """
+
+    def __init__(self, max_concurrency: int = MAX_CONCURRENCY, provider_limits: dict = None):
+        self.max_concurrency = max(1, max_concurrency)
+        self.provider_limits = dict(PROVIDER_CONCURRENCY if provider_limits is None else provider_limits)
+
+    def run(self, jobs: list, progress_callback=None, on_result=None, fail_fast: bool = True) -> list:
+        """Run every job to completion and return the final values in job order.
+
+        With `fail_fast`, the first stage exception stops dispatch and is
+        re-raised here once in-flight tasks drain. Otherwise a failing job is
+        abandoned, its slot in the returned list holds the exception, and the
+        other jobs carry on.
+
+        `progress_callback(done, total)` and `on_result(index, value, seconds)` —
+        called as each job finishes, with `seconds` measured from its first
+        dispatch — are only ever invoked from the calling thread.
+        """
+        total = sum(len(job["stages"]) for job in jobs)
+        results = [job["value"] for job in jobs]
+        started = [None] * len(jobs)
+        finished = deque((j, 0.0) for j, job in enumerate(jobs) if not job["stages"])
+        ready = [(0, j) for j, job in enumerate(jobs) if job["stages"]]
+        heapq.heapify(ready)
+        in_flight = {}
+        state = {"done": 0, "running": 0, "error": None}
+        cond = threading.Condition()
+
+        def next_task():
+            # Caller holds `cond`. Pops the best task whose provider has capacity.
+            skipped, task = [], None
+            while ready:
+                cand = heapq.heappop(ready)
+                provider = jobs[cand[1]].get("provider")
+                limit = self.provider_limits.get(provider)
+                if limit is None or in_flight.get(provider, 0) < limit:
+                    task = cand
+                    break
+                skipped.append(cand)
+            for cand in skipped:
+                heapq.heappush(ready, cand)
+            return task
+
+        def worker():
+            while True:
+                with cond:
+                    while True:
+                        if state["error"] is not None or state["done"] + state["running"] >= total:
+                            return
+                        task = next_task()
+                        if task is not None:
+                            break
+                        cond.wait()
+                    neg_stage, j = task
+                    provider = jobs[j].get("provider")
+                    in_flight[provider] = in_flight.get(provider, 0) + 1
+                    state["running"] += 1
+                    if started[j] is None:
+                        started[j] = time.perf_counter()
+                stage = -neg_stage
+                stages = jobs[j]["stages"]
+                try:
+                    value = stages[stage](results[j])
+                    error = None
+                except Exception as e:
+                    value, error = None, e
+                with cond:
+                    in_flight[provider] -= 1
+                    state["running"] -= 1
+                    if error is not None and fail_fast:
+                        state["error"] = state["error"] or error
+                    elif error is not None:
+                        # Abandon the job: its remaining stages count as done
+                        results[j] = error
+                        state["done"] += len(stages) - stage
+                        finished.append((j, time.perf_counter() - started[j]))
+                    else:
+                        results[j] = value
+                        state["done"] += 1
+                        if stage + 1 < len(stages):
+                            heapq.heappush(ready, (-(stage + 1), j))
+                        else:
+                            finished.append((j, time.perf_counter() - started[j]))
+                    cond.notify_all()
+
+        # Each worker runs in its own copy of the caller's context (telemetry scopes)
+        threads = [threading.Thread(target=contextvars.copy_context().run, args=(worker,), daemon=True)
+                   for _ in range(min(self.max_concurrency, len(ready)))]
+        for t in threads:
+            t.start()
+        reported = -1
+        with cond:
+            while True:
+                if finished and on_result:
+                    j, seconds = finished.popleft()
+                    with _released(cond):
+                        on_result(j, results[j], seconds)
+                    continue
+                if progress_callback and state["done"] != reported:
+                    reported = state["done"]
+                    with _released(cond):
+                        progress_callback(reported, total)
+                    continue
+                if not state["running"] and (state["error"] is not None or state["done"] >= total):
+                    break
+                cond.wait(0.25)
+        for t in threads:
+            t.join()
+        if state["error"] is not None:
+            raise state["error"]
+        return results
+
+
+@contextmanager
+def _released(lock):
+    """Temporarily release a held lock (to run a callback without holding it)."""
+    lock.release()
+    try:
+        yield
+    finally:
+        lock.acquire()
@@ -0,0 +1,108 @@
+"""
+Single-flight — coalesces identical concurrent work: the first caller for a
+key runs it and every caller that arrives while it is in flight shares the
+outcome instead of running it again.
+"""
+
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+
+from .cancel import Cancelled
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  SINGLE-FLIGHT
+#  Unlike the result cache this holds nothing once the work finishes — it only
+#  covers the window where the cache can't help yet because nobody has a result.
+# ─────────────────────────────────────────────────────────────────────────────
+
+POLL_SECONDS = 0.1   # how often a waiting follower checks its own cancel token
+
+
+class SingleFlight:
+    """Per-key leader election over in-flight calls.
+
+    do(key, fn) runs fn() if no call for `key` is in flight, otherwise waits
+    for the one that is and returns (or raises) what it did. A leader that is
+    cancelled does not cancel its followers: they retry, and one of them
+    becomes the new leader.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key: str, fn, cancel=None, on_shared=None):
+        """Return fn(), run at most once at a time per key across threads.
+
+        `cancel` (a CancelToken) stops this caller's wait, and, when this
+        caller leads, marks a result produced after it tripped as not shareable.
+        `on_shared` is called when the result came from another caller's run.
+        """
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                leader = future is None
+                if leader:
+                    future = self._calls[key] = Future()
+                    self.leaders += 1
+            if leader:
+                return self._lead(key, future, fn, cancel)
+            try:
+                result = self._follow(future, cancel)
+            except Exception as e:
+                if getattr(e, "cancelled", False) and not (cancel is not None and cancel.cancelled):
+                    continue   # the leader was cancelled, we weren't — run it again
+                raise
+            with self._lock:
+                self.shared += 1
+            if on_shared is not None:
+                on_shared()
+            return result
+
+    def _lead(self, key, future, fn, cancel):
+        try:
+            result = fn()
+        except BaseException as e:
+            self._release(key)
+            future.set_exception(e)
+            raise
+        self._release(key)
+        if cancel is not None and cancel.cancelled:
+            # Work that swallows cancellation into its return value (humanize()'s
+            # "Error: ..." strings) must not hand that to followers
+            future.set_exception(Cancelled(cancel.reason))
+        else:
+            future.set_result(result)
+        return result
+
+    @staticmethod
+    def _follow(future, cancel):
+        if cancel is None:
+            return future.result()
+        while True:
+            cancel.raise_if_cancelled()
+            try:
+                return future.result(timeout=POLL_SECONDS)
+            except FutureTimeout:
+                pass
+
+    def _release(self, key) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"in_flight": len(self._calls), "leaders": self.leaders, "shared": self.shared}
+
+
+# One table per granularity, shared by every session and batch worker
+REQUESTS = SingleFlight()   # whole humanize() runs, keyed by the normalized request
+PASSES   = SingleFlight()   # single passes, keyed like the pass cache
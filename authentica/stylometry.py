@@ -0,0 +1,375 @@
+"""
+Local stylometry — fast, dependency-free checks of the mechanically testable
+pass rules (sentence rhythm, formal transitions, short paragraph openers,
+buzzwords), used to skip passes whose targets a text already meets, plus a
+NumPy batch analyzer for scoring whole runs and ranking alternative outputs
+(NumPy is imported lazily).
+"""
+
+import re
+
+from .catalog import FORBIDDEN_WORDS
+from .text import CLICHES
+
+LONG_SENTENCE   = 22   # words; must be followed by a short one
+SHORT_FOLLOW    = 10   # words
+SHORT_OPENER    = 8    # words in a paragraph's first sentence
+MIN_OPENERS     = 2    # paragraphs that should open short
+SIMILAR_SPREAD  = 3    # three consecutive sentences within this many words are "similar"
+
+FORMAL_TRANSITIONS = ("However", "Furthermore", "Moreover", "Additionally", "Consequently", "Nevertheless")
+BUZZWORDS = ("delve", "utilize", "leverage", "paramount", "groundbreaking", "pivotal", "robust", "seamlessly")
+
+_PARA_RE       = re.compile(r'\n\s*\n')
+_SENTENCE_RE   = re.compile(r'(?<=[.!?])["\')\]]*\s+')
+_TRANSITION_RE = re.compile(r'^(?:%s)\b' % "|".join(FORMAL_TRANSITIONS))
+_BUZZWORD_RE   = re.compile(r'\b(?:%s)' % "|".join(BUZZWORDS), re.IGNORECASE)
+
+
+def split_sentences(paragraph: str) -> list:
+    return [s for s in _SENTENCE_RE.split(paragraph.strip()) if s]
+
+
+def analyze(text: str) -> dict:
+    """Rhythm and vocabulary statistics for `text`.
+
+    Keys: `sentences`, `paragraphs`, `mean_words`, `burstiness` (coefficient
+    of variation of sentence length), `long_without_short` (sentences over
+    LONG_SENTENCE words not followed by one under SHORT_FOLLOW),
+    `formal_transitions`, `short_openers`, `similar_runs` (windows of three
+    similar-length sentences) and `buzzwords`.
+    """
+    paragraphs = [p for p in _PARA_RE.split(text) if p.strip()]
+    lengths, short_openers, transitions = [], 0, 0
+    for para in paragraphs:
+        sentences = split_sentences(para)
+        if sentences and len(sentences[0].split()) < SHORT_OPENER:
+            short_openers += 1
+        for sentence in sentences:
+            lengths.append(len(sentence.split()))
+            if _TRANSITION_RE.match(sentence):
+                transitions += 1
+
+    n = len(lengths)
+    mean = sum(lengths) / n if n else 0.0
+    var = sum((x - mean) ** 2 for x in lengths) / n if n else 0.0
+    long_without_short = sum(
+        1 for a, b in zip(lengths, lengths[1:]) if a > LONG_SENTENCE and b >= SHORT_FOLLOW
+    )
+    similar_runs = sum(
+        1 for i in range(n - 2) if max(lengths[i:i + 3]) - min(lengths[i:i + 3]) <= SIMILAR_SPREAD
+    )
+    return {
+        "sentences":          n,
+        "paragraphs":         len(paragraphs),
+        "mean_words":         mean,
+        "burstiness":         (var ** 0.5) / mean if mean else 0.0,
+        "long_without_short": long_without_short,
+        "formal_transitions": transitions,
+        "short_openers":      short_openers,
+        "similar_runs":       similar_runs,
+        "buzzwords":          len(_BUZZWORD_RE.findall(text)),
+    }
+
+
+def rhythm_targets_met(stats: dict) -> bool:
+    """Pass 3's checkable rules: every long sentence answered by a short one,
+    no formal transitions, enough short paragraph openers, no similar runs."""
+    return (
+        stats["long_without_short"] == 0
+        and stats["formal_transitions"] == 0
+        and stats["short_openers"] >= min(MIN_OPENERS, stats["paragraphs"])
+        and stats["similar_runs"] == 0
+    )
+
+
+# Pass spec "targets" name -> predicate over analyze() output
+PASS_TARGETS = {
+    "rhythm": rhythm_targets_met,
+}
+
+
+def targets_met(name: str, text: str) -> bool:
+    check = PASS_TARGETS.get(name)
+    return bool(check and text.strip() and check(analyze(text)))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  BATCH ANALYZER — NumPy over one byte buffer for a whole batch of documents.
+#  Words, sentences and paragraphs are arrays of byte offsets, never Python
+#  objects, so scoring every input and output of a run costs milliseconds.
+# ─────────────────────────────────────────────────────────────────────────────
+
+LENGTH_BINS = (5, 10, 15, 22, 30)   # sentence-length histogram edges, in words
+STARTER_BYTES = 16                  # sentence starters compare on their first 16 letters
+
+FORBIDDEN_TERMS = tuple(
+    term.split(" (")[0].strip()
+    for term in FORBIDDEN_WORDS.split(":", 1)[1].rstrip(".").split(",")
+)
+
+_WHITESPACE = b" \t\n\r\x0b\x0c"
+_TERMINALS  = b".!?"
+_CLOSERS    = b"\"')]"
+
+# Phrase hits are found by hashing: each lexical token (letters, apostrophes,
+# hyphens, non-ASCII) gets a polynomial hash mod 2**64 and n-word phrases a
+# hash of their token hashes, matched with np.isin against the term lists.
+_HASH_P    = 0x100000001B3                 # odd, so invertible mod 2**64
+_HASH_PINV = pow(_HASH_P, -1, 1 << 64)
+_HASH_Q    = 0x9E3779B97F4A7C15
+_MASK64    = (1 << 64) - 1
+
+
+def _phrase_key(phrase: str):
+    """(word count, hash) of a phrase, computed exactly as analyze_batch() does."""
+    tokens = re.findall(r"[a-z'\-\x80-\U0010ffff]+", phrase.lower())
+    key = 0
+    for token in tokens:
+        h = 0
+        for i, byte in enumerate(token.encode("utf-8")):
+            h = (h + byte * pow(_HASH_P, i, 1 << 64)) & _MASK64
+        key = (key * _HASH_Q + h) & _MASK64
+    return len(tokens), key
+
+
+def _phrase_table(phrases) -> dict:
+    table = {}
+    for phrase in phrases:
+        n, key = _phrase_key(phrase)
+        table.setdefault(n, set()).add(key)
+    return table
+
+
+PHRASE_TABLES = {
+    "transitions": _phrase_table(FORMAL_TRANSITIONS),
+    "forbidden":   _phrase_table(FORBIDDEN_TERMS),
+    "cliches":     _phrase_table(CLICHES),
+}
+
+BATCH_METRICS = (
+    "words", "sentences", "paragraphs", "mean_sentence", "sentence_var", "burstiness",
+    "paragraph_cv", "transitions", "transition_rate", "forbidden", "cliches", "repeated_starters",
+)
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("analyze_batch() needs NumPy: pip install numpy") from e
+    return np
+
+
+def _byte_class(np, members: bytes):
+    """256-entry membership table, indexed by byte value."""
+    table = np.zeros(256, dtype=bool)
+    table[list(members)] = True
+    return table
+
+
+def _per_doc(np, groups, values, n):
+    """Count, mean and variance of `values` grouped by document index."""
+    count = np.bincount(groups, minlength=n)
+    total = np.bincount(groups, weights=values, minlength=n)
+    squares = np.bincount(groups, weights=values.astype(np.float64) ** 2, minlength=n)
+    safe = np.maximum(count, 1)
+    mean = total / safe
+    return count, mean, np.maximum(squares / safe - mean ** 2, 0.0)
+
+
+_tables = {}   # lazily built NumPy lookup state, see _hash_tables()
+
+
+def _hash_tables(np, size: int):
+    """Powers of _HASH_P and its inverse for `size` bytes, plus per phrase
+    length a sorted key array and a category bitmask per key (a phrase such as
+    "moreover" can be in several categories). Grown and cached across calls."""
+    if _tables.get("size", 0) < size:
+        grow = max(size, 2 * _tables.get("size", 0), 1 << 16)
+        with np.errstate(over="ignore"):
+            powers = np.full(grow, _HASH_P, dtype=np.uint64)
+            inverse = np.full(grow, _HASH_PINV, dtype=np.uint64)
+            powers[0] = inverse[0] = 1
+            _tables.update(size=grow, powers=np.cumprod(powers, dtype=np.uint64),
+                           inverse=np.cumprod(inverse, dtype=np.uint64))
+    if "lookup" not in _tables:
+        masks = {}
+        for bit, table in enumerate(PHRASE_TABLES.values()):
+            for length, keys in table.items():
+                for key in keys:
+                    masks.setdefault(length, {})[key] = masks.get(length, {}).get(key, 0) | (1 << bit)
+        _tables["lookup"] = {
+            length: (np.array(sorted(m), dtype=np.uint64), np.array([m[k] for k in sorted(m)]))
+            for length, m in masks.items()
+        }
+    return _tables["powers"], _tables["inverse"], _tables["lookup"]
+
+
+def _phrase_hits(np, buf, starts, n) -> dict:
+    """Per-document hit counts for every PHRASE_TABLES category."""
+    lower = np.where((buf >= 65) & (buf <= 90), buf | 0x20, buf)
+    lexical = ((lower >= 97) & (lower <= 122)) | (lower == 39) | (lower == 45) | (lower >= 128)
+    ts = np.flatnonzero(lexical & np.concatenate(([True], ~lexical[:-1])))
+    te = np.flatnonzero(lexical & np.concatenate((~lexical[1:], [True])))
+    hits = {name: np.zeros(n, dtype=np.int64) for name in PHRASE_TABLES}
+    if not ts.size:
+        return hits
+    powers, inverse, lookup = _hash_tables(np, buf.size)
+    with np.errstate(over="ignore"):
+        weighted = np.where(lexical, lower, 0).astype(np.uint64) * powers[:buf.size]
+        prefix = np.concatenate((np.zeros(1, dtype=np.uint64), np.cumsum(weighted, dtype=np.uint64)))
+        token = (prefix[te + 1] - prefix[ts]) * inverse[ts]
+        doc = np.searchsorted(starts, ts, side="right") - 1
+        gram = np.zeros(ts.size, dtype=np.uint64)
+        for length in range(1, max(lookup) + 1):
+            count = ts.size - length + 1
+            if count <= 0:
+                break
+            gram = gram[:count] * np.uint64(_HASH_Q) + token[length - 1:]
+            if length not in lookup:
+                continue
+            keys, masks = lookup[length]
+            at = np.minimum(np.searchsorted(keys, gram), keys.size - 1)
+            found = (keys[at] == gram) & (doc[:count] == doc[length - 1:])
+            where, category = doc[:count][found], masks[at[found]]
+            for bit, name in enumerate(PHRASE_TABLES):
+                hits[name] += np.bincount(where[(category >> bit) & 1 == 1], minlength=n)
+    return hits
+
+
+def analyze_batch(texts: list) -> dict:
+    """Score many documents at once. Returns {metric: array of len(texts)}.
+
+    Metrics (BATCH_METRICS): word, sentence and paragraph counts; mean and
+    variance of sentence length and its coefficient of variation
+    (`burstiness`); `paragraph_cv`, the coefficient of variation of paragraph
+    length (low means symmetric paragraphs); formal `transitions` and their
+    per-sentence `transition_rate`; FORBIDDEN_WORDS and CLICHES hits; and
+    `repeated_starters`, sentences opening with a word already used as an
+    opener in the same document. `length_hist` is an (n, len(LENGTH_BINS)+1)
+    array of sentence counts per length bin.
+    """
+    np = _numpy()
+    n = len(texts)
+    encoded = [t.encode("utf-8") for t in texts]
+    sizes = np.array([len(e) for e in encoded], dtype=np.int64)
+    starts = np.concatenate(([0], np.cumsum(sizes + 2)[:-1])).astype(np.int64)
+    joined = b"\n\n".join(encoded)
+    buf = np.frombuffer(joined, dtype=np.uint8)
+    out = {name: np.zeros(n) for name in BATCH_METRICS}
+    out["length_hist"] = np.zeros((n, len(LENGTH_BINS) + 1), dtype=np.int64)
+    if not buf.size:
+        return out
+
+    space = _byte_class(np, _WHITESPACE)[buf]
+    word = ~space
+    ws = np.flatnonzero(word & np.concatenate(([True], space[:-1])))   # word start offsets
+    we = np.flatnonzero(word & np.concatenate((space[1:], [True])))    # inclusive end offsets
+    if not ws.size:
+        return out
+    doc = np.searchsorted(starts, ws, side="right") - 1
+
+    # Sentence ends: terminal punctuation (optionally before a closer), a blank
+    # line, or the end of a document
+    last, before = buf[we], buf[np.maximum(we - 1, 0)]
+    terminals, closers = _byte_class(np, _TERMINALS), _byte_class(np, _CLOSERS)
+    terminal = terminals[last] | (closers[last] & terminals[before])
+    newlines = np.cumsum(buf == 10)
+    para_end = np.concatenate(((newlines[ws[1:]] - newlines[we[:-1]]) >= 2, [True]))
+    para_end |= np.concatenate((doc[1:] != doc[:-1], [True]))
+    sent_end = terminal | para_end
+
+    sent_first = np.flatnonzero(np.concatenate(([True], sent_end[:-1])))   # word index opening each sentence
+    sent_len = np.diff(np.concatenate((sent_first, [ws.size])))
+    sent_doc = doc[sent_first]
+    para_first = np.flatnonzero(np.concatenate(([True], para_end[:-1])))
+    para_len = np.diff(np.concatenate((para_first, [ws.size])))
+
+    sentences, mean, var = _per_doc(np, sent_doc, sent_len, n)
+    paragraphs, pmean, pvar = _per_doc(np, doc[para_first], para_len, n)
+    out["words"] = np.bincount(doc, minlength=n).astype(np.float64)
+    out["sentences"] = sentences.astype(np.float64)
+    out["paragraphs"] = paragraphs.astype(np.float64)
+    out["mean_sentence"] = mean
+    out["sentence_var"] = var
+    out["burstiness"] = np.divide(np.sqrt(var), mean, out=np.zeros(n), where=mean > 0)
+    out["paragraph_cv"] = np.divide(np.sqrt(pvar), pmean, out=np.zeros(n), where=pmean > 0)
+    bins = np.searchsorted(np.array(LENGTH_BINS), sent_len, side="left")
+    out["length_hist"] = np.bincount(sent_doc * (len(LENGTH_BINS) + 1) + bins,
+                                     minlength=n * (len(LENGTH_BINS) + 1)).reshape(n, -1)
+
+    for name, counts in _phrase_hits(np, buf, starts, n).items():
+        out[name] = counts.astype(np.float64)
+    out["transition_rate"] = np.divide(out["transitions"], sentences, out=np.zeros(n), where=sentences > 0)
+
+    # Sentence starters: the opening word's first STARTER_BYTES letters, lower-cased
+    # ASCII, with punctuation zeroed — packed into two uint64 words per sentence
+    offsets = ws[sent_first][:, None] + np.arange(STARTER_BYTES)
+    inside = offsets <= we[sent_first][:, None]
+    letters = buf[np.minimum(offsets, buf.size - 1)]
+    upper = (letters >= 65) & (letters <= 90)
+    letters = np.where(upper, letters | 0x20, letters)
+    letters = np.where(inside & (upper | (letters >= 97) & (letters <= 122) | (letters >= 128)), letters, 0)
+    keys = np.ascontiguousarray(letters.astype(np.uint8)).view(np.uint64)   # (sentences, 2)
+    with np.errstate(over="ignore"):
+        starter = keys[:, 0] * np.uint64(_HASH_Q) + keys[:, 1]
+    # Document index in the top 24 bits, starter hash below: one 1-D unique
+    unique = np.unique((sent_doc.astype(np.uint64) << np.uint64(40)) | (starter >> np.uint64(24)))
+    starters = np.bincount((unique >> np.uint64(40)).astype(np.int64), minlength=n)
+    out["repeated_starters"] = (sentences - starters).astype(np.float64)
+    return out
+
+
+def compare_batch(inputs: list, outputs: list) -> list:
+    """analyze_batch() over inputs and outputs in one call; one
+    {"in": {...}, "out": {...}} dict of scalar metrics per pair."""
+    scores = analyze_batch(list(inputs) + list(outputs))
+    n = len(inputs)
+    return [
+        {side: {name: round(float(scores[name][i + k]), 4) for name in BATCH_METRICS}
+         for side, k in (("in", 0), ("out", n))}
+        for i in range(n)
+    ]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  VARIANT SCORER — ranks alternative outputs of the same input on the
+#  batch metrics, so best-of-N picks a winner without another model call
+# ─────────────────────────────────────────────────────────────────────────────
+
+BURSTINESS_CAP = 1.0   # more sentence-length variation than this earns nothing extra
+
+# Per-metric weights; positive rewards, negative penalties
+VARIANT_WEIGHTS = {
+    "burstiness":      1.0,    # sentence-length variation, capped at BURSTINESS_CAP
+    "paragraph_cv":    0.5,    # uneven paragraph lengths
+    "transition_rate": -2.0,   # formal transitions per sentence
+    "phrase_hits":     -0.5,   # FORBIDDEN_WORDS and CLICHES hits, each
+    "starter_rate":    -1.0,   # repeated sentence openers per sentence
+    "length_drift":    -1.0,   # relative word-count change from the source
+}
+
+
+def score_variants(texts: list, source: str = None) -> list:
+    """One score per text, higher is better: VARIANT_WEIGHTS over analyze_batch()
+    metrics. With `source`, variants that drift in length from it (dropped or
+    padded content) are penalized. Empty texts score -inf."""
+    scores = analyze_batch(list(texts) + ([source] if source else []))
+    source_words = float(scores["words"][-1]) if source else 0.0
+    out = []
+    for i in range(len(texts)):
+        sentences, words = scores["sentences"][i], scores["words"][i]
+        if not words:
+            out.append(float("-inf"))
+            continue
+        features = {
+            "burstiness":      min(scores["burstiness"][i], BURSTINESS_CAP),
+            "paragraph_cv":    scores["paragraph_cv"][i],
+            "transition_rate": scores["transition_rate"][i],
+            "phrase_hits":     scores["forbidden"][i] + scores["cliches"][i],
+            "starter_rate":    scores["repeated_starters"][i] / sentences if sentences else 0.0,
+            "length_drift":    abs(words / source_words - 1.0) if source_words else 0.0,
+        }
+        out.append(float(sum(VARIANT_WEIGHTS[name] * value for name, value in features.items())))
+    return out
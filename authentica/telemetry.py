@@ -0,0 +1,228 @@
+"""
+Telemetry — wall time, time-to-first-token, token usage (including prompt
+tokens served from the provider's prompt cache), retries, cache hits,
+coalesced duplicates and skipped passes for every provider call, aggregated
+per (pass, provider, model) into rolling histograms and exportable as JSON or
+Prometheus text.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+TELEMETRY_WINDOW = int(os.environ.get("AUTHENTICA_TELEMETRY_WINDOW", 500))   # samples kept per series
+
+SECONDS_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120)
+TOKEN_BUCKETS   = (16, 64, 128, 256, 512, 1024, 2048, 4096)
+
+HISTOGRAMS = {
+    "wall_seconds":      SECONDS_BUCKETS,
+    "ttft_seconds":      SECONDS_BUCKETS,
+    "prompt_tokens":     TOKEN_BUCKETS,
+    "completion_tokens": TOKEN_BUCKETS,
+}
+COUNTERS = ("calls", "errors", "cancelled", "retries", "cache_hits", "coalesced", "skipped", "cached_tokens")
+
+# Carried into scheduler and hedging worker threads via contextvars.copy_context()
+_pass_label  = contextvars.ContextVar("authentica_pass", default="")
+_active_call = contextvars.ContextVar("authentica_call", default=None)
+_active_runs = contextvars.ContextVar("authentica_runs", default=())
+
+
+class Histogram:
+    """Cumulative buckets (for Prometheus) plus a rolling window of raw samples
+    (for percentiles that follow recent behaviour)."""
+
+    def __init__(self, buckets: tuple, window: int = TELEMETRY_WINDOW):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        i = 0
+        while i < len(self.buckets) and value > self.buckets[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+
+    def summary(self) -> dict:
+        samples = sorted(self.recent)
+        if not samples:
+            return {"count": self.count}
+
+        def q(p):
+            return samples[min(len(samples) - 1, int(p * len(samples)))]
+        return {"count": self.count, "mean": sum(samples) / len(samples),
+                "p50": q(0.5), "p90": q(0.9), "p99": q(0.99), "max": samples[-1]}
+
+
+class Telemetry:
+    """Thread-safe registry of per-series counters and histograms."""
+
+    def __init__(self, window: int = TELEMETRY_WINDOW):
+        self.window = window
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        # Caller holds the lock
+        series = self._series.get(key)
+        if series is None:
+            series = {name: 0 for name in COUNTERS}
+            series.update({name: Histogram(b, self.window) for name, b in HISTOGRAMS.items()})
+            self._series[key] = series
+        return series
+
+    def _add(self, key, counters: dict, samples: dict) -> None:
+        with self._lock:
+            series = self._get(key)
+            for name, n in counters.items():
+                series[name] += n
+            for name, value in samples.items():
+                if value is not None:
+                    series[name].observe(value)
+            for run in _active_runs.get():
+                for name, n in counters.items():
+                    run[name] = run.get(name, 0) + n
+                for name, value in samples.items():
+                    if value is not None:
+                        run[name] = run.get(name, 0) + value
+                        run[name + "_count"] = run.get(name + "_count", 0) + 1
+
+    # ── Instrumentation hooks ──────────────────────────────────────────
+
+    @contextmanager
+    def pass_scope(self, label: str):
+        """Attribute calls made inside the block to pipeline pass `label`."""
+        token = _pass_label.set(label.rstrip("…"))
+        try:
+            yield
+        finally:
+            _pass_label.reset(token)
+
+    @contextmanager
+    def call(self, provider: str, model: str):
+        """Time one call_api() invocation. Yields a record the caller fills in:
+        `retries`, plus `ttft`/token counts via first_token() and note_usage()."""
+        record = {"start": time.perf_counter(), "ttft": None, "retries": 0,
+                  "prompt_tokens": None, "completion_tokens": None, "cached_tokens": None}
+        token = _active_call.set(record)
+        outcome = "ok"
+        try:
+            yield record
+        except BaseException as e:
+            # Hedging losers are aborted on purpose; they are not failures
+            outcome = "cancelled" if getattr(e, "cancelled", False) else "error"
+            raise
+        finally:
+            _active_call.reset(token)
+            counters = {"calls": 1, "retries": record["retries"], "cached_tokens": record["cached_tokens"] or 0}
+            if outcome == "error":
+                counters["errors"] = 1
+            elif outcome == "cancelled":
+                counters["cancelled"] = 1
+            samples = {"ttft_seconds": record["ttft"]}
+            if outcome == "ok":
+                samples.update(wall_seconds=time.perf_counter() - record["start"],
+                               prompt_tokens=record["prompt_tokens"],
+                               completion_tokens=record["completion_tokens"])
+            self._add((_pass_label.get(), provider, model), counters, samples)
+
+    def record_cache_hit(self, provider: str, model: str, pass_label: str = None) -> None:
+        label = _pass_label.get() if pass_label is None else pass_label
+        self._add((label, provider, model), {"cache_hits": 1}, {})
+
+    def record_coalesced(self, provider: str, model: str, pass_label: str = None) -> None:
+        """Work served by an identical run already in flight (see singleflight)."""
+        label = _pass_label.get() if pass_label is None else pass_label
+        self._add((label, provider, model), {"coalesced": 1}, {})
+
+    def record_skip(self, provider: str, model: str) -> None:
+        """A pass skipped because its targets were already met."""
+        self._add((_pass_label.get(), provider, model), {"skipped": 1}, {})
+
+    @contextmanager
+    def collect(self):
+        """Totals for everything recorded inside the block (including worker
+        threads it spawns): counters, plus a sum and a `<name>_count` for each
+        histogram metric."""
+        run = {}
+        token = _active_runs.set(_active_runs.get() + (run,))
+        try:
+            yield run
+        finally:
+            _active_runs.reset(token)
+
+    # ── Export ─────────────────────────────────────────────────────────
+
+    def snapshot(self) -> list:
+        with self._lock:
+            rows = []
+            for (label, provider, model), series in sorted(self._series.items()):
+                row = {"pass": label, "provider": provider, "model": model}
+                row.update({name: series[name] for name in COUNTERS})
+                row.update({name: series[name].summary() for name in HISTOGRAMS})
+                rows.append(row)
+            return rows
+
+    def to_json(self) -> str:
+        return json.dumps({"generated_at": time.time(), "series": self.snapshot()}, indent=2)
+
+    def to_prometheus(self, prefix: str = "authentica") -> str:
+        lines = []
+        with self._lock:
+            items = sorted(self._series.items())
+            for name in COUNTERS:
+                lines.append(f"# TYPE {prefix}_{name}_total counter")
+                for key, series in items:
+                    lines.append(f"{prefix}_{name}_total{{{_labels(key)}}} {series[name]}")
+            for name, buckets in HISTOGRAMS.items():
+                lines.append(f"# TYPE {prefix}_{name} histogram")
+                for key, series in items:
+                    h, labels, running = series[name], _labels(key), 0
+                    for bound, n in zip(buckets + ("+Inf",), h.counts):
+                        running += n
+                        lines.append(f'{prefix}_{name}_bucket{{{labels},le="{bound}"}} {running}')
+                    lines.append(f"{prefix}_{name}_sum{{{labels}}} {h.sum}")
+                    lines.append(f"{prefix}_{name}_count{{{labels}}} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+def _labels(key) -> str:
+    def esc(v):
+        return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    label, provider, model = key
+    return f'pass="{esc(label)}",provider="{esc(provider)}",model="{esc(model)}"'
+
+
+def first_token() -> None:
+    """Mark time-to-first-token on the active call (first call wins)."""
+    record = _active_call.get()
+    if record is not None and record["ttft"] is None:
+        record["ttft"] = time.perf_counter() - record["start"]
+
+
+def note_usage(prompt_tokens, completion_tokens, cached_tokens=None) -> None:
+    """Called by provider wrappers with the usage block of a completed response.
+    `cached_tokens` is the part of the prompt the provider served from its cache."""
+    record = _active_call.get()
+    if record is not None:
+        record["prompt_tokens"] = prompt_tokens
+        record["completion_tokens"] = completion_tokens
+        record["cached_tokens"] = cached_tokens
+
+
+# One registry per process, shared by every session and batch worker
+TELEMETRY = Telemetry()
@@ -0,0 +1,210 @@
+"""
+Local text processing — detector rules, cliché removal and output cleanup.
+"""
+
+import random
+import re
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  DETECTOR TARGETING
+# ─────────────────────────────────────────────────────────────────────────────
+
+def detector_instructions(gpt: bool, ori: bool, tur: bool, zer: bool, qui: bool) -> str:
+    parts = []
+    if gpt:
+        parts.append(
+            "GPTZERO (perplexity + burstiness): Make at least 20% of sentences dramatically short (<7 words) "
+            "and 20% deliberately long (>25 words with embedded clauses). Use at least one word that is correct "
+            "but slightly unexpected in context. Include one rhetorical question. Never start two consecutive "
+            "sentences with the same word."
+        )
+    if ori:
+        parts.append(
+            "ORIGINALITY.AI (semantic fingerprinting): Restructure the logical ORDER of ideas across paragraphs — "
+            "do not just rephrase in the same sequence. Use at least two idiomatic or colloquial expressions. "
+            "Introduce one concrete real-world detail (a number, a named scenario). Avoid clean topic-sentence → "
+            "supporting-detail → conclusion paragraph structure. Let at least one paragraph begin mid-thought."
+        )
+    if tur:
+        parts.append(
+            "TURNITIN (stylometric patterns + personal voice): Break paragraph symmetry — not all 3-4 sentences; "
+            "include at least one 1-sentence paragraph and one 6+ sentence paragraph. Include at least one "
+            "subjective observation: 'which, in practice, works better than it sounds.' Avoid parallel list "
+            "structures (First... Second... Third...). Vary where the main claim appears within paragraphs."
+        )
+    if zer:
+        parts.append(
+            "ZEROGPT (formal transitions + uniform clauses): Replace ALL of these: However / Furthermore / Moreover / "
+            "Additionally / Consequently / Nevertheless / In conclusion. Use instead: But / Also / So / Plus / "
+            "That said / Even so / And yet / Which means. Vary clause length within sentences. At least two "
+            "sentences should begin with a conjunction (And, But, So). At least one sentence should be "
+            "deliberately shorter than everything around it."
+        )
+    if qui:
+        parts.append(
+            "QUILLBOT (paraphrase-pattern detection): Do NOT simply swap synonyms — Quillbot detects this. "
+            "Instead restructure sentences syntactically: change grammatical form, not just word choice. "
+            "Convert some noun phrases to verb phrases and vice versa. Combine or split sentences. "
+            "Change perspective/framing of claims. Introduce at least one informal phrase that no paraphraser "
+            "would generate."
+        )
+    if not parts:
+        return ""
+    return "\n\nDETECTOR-SPECIFIC RULES:\n" + "\n".join(f"• {p}" for p in parts)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  CLICHE REMOVAL  (post-processing — cliché phrases only, no structural edits)
+# ─────────────────────────────────────────────────────────────────────────────
+
+CLICHES = {
+    "delve into": ["dig into", "explore", "look at"],
+    "delves into": ["digs into", "explores"],
+    "delving into": ["digging into", "exploring"],
+    "utilize": ["use", "apply"],
+    "utilizes": ["uses", "applies"],
+    "leverage": ["use", "tap into", "draw on"],
+    "leverages": ["uses", "draws on"],
+    "foster": ["build", "grow", "encourage"],
+    "facilitate": ["help", "enable"],
+    "harness": ["use", "tap into", "channel"],
+    "realm": ["area", "field", "world"],
+    "landscape": ["field", "scene", "environment"],
+    "testament": ["proof", "sign", "evidence"],
+    "paradigm": ["model", "approach", "framework"],
+    "synergy": ["teamwork", "collaboration"],
+    "ecosystem": ["system", "network", "environment"],
+    "paramount": ["key", "critical", "essential"],
+    "pivotal": ["key", "crucial", "central"],
+    "groundbreaking": ["new", "innovative", "novel"],
+    "cutting-edge": ["new", "modern", "latest"],
+    "cutting edge": ["new", "modern", "latest"],
+    "robust": ["strong", "solid", "reliable"],
+    "comprehensive": ["complete", "thorough", "detailed"],
+    "innovative": ["new", "creative", "fresh"],
+    "transformative": ["significant", "major", "powerful"],
+    "multifaceted": ["complex", "layered", "varied"],
+    "seamlessly": ["smoothly", "easily", "naturally"],
+    "in conclusion": ["to wrap up", "so", "in short"],
+    "in summary": ["in short", "briefly"],
+    "it is important to note that": ["worth noting,", "note that"],
+    "it's important to note that": ["worth noting,", "note that"],
+    "it is worth noting that": ["worth noting,"],
+    "it's worth noting that": ["worth noting,"],
+    "in order to": ["to"],
+    "due to the fact that": ["because", "since"],
+    "game-changer": ["big shift", "major change"],
+    "game changer": ["big shift", "major change"],
+    "needless to say": ["clearly", "obviously"],
+    "as we can see": ["clearly", "as shown"],
+    "it goes without saying": ["clearly"],
+    "at the end of the day": ["ultimately", "in the end"],
+}
+
+
+def _trie_pattern(phrases) -> str:
+    """Regex source matching any of `phrases`, factored into a prefix trie so the
+    engine walks each character once per position instead of once per phrase.
+    Optional continuations are greedy, so the longest phrase wins."""
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node):
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+# Built once at import: one pass over the text finds every cliché occurrence
+_CLICHE_OPTIONS = {phrase.lower(): options for phrase, options in CLICHES.items()}
+_CLICHE_RE = re.compile(
+    r'(?<![A-Za-z])' + _trie_pattern(_CLICHE_OPTIONS) + r'(?![A-Za-z])',
+    re.IGNORECASE,
+)
+
+
+def remove_cliches(text: str, rng: random.Random = None) -> str:
+    """Replace every cliché occurrence in a single linear pass.
+
+    `rng` picks the replacements (defaults to the module-level generator), so
+    callers can make a run reproducible. A capitalized match keeps its capital.
+    """
+    choose = (rng or random).choice
+
+    def replace(m):
+        found = m.group(0)
+        repl = choose(_CLICHE_OPTIONS[found.lower()])
+        return repl[0].upper() + repl[1:] if found[0].isupper() else repl
+
+    return _CLICHE_RE.sub(replace, text)
+
+
+# Compiled once; clean_text() runs after every pass, so it is on the hot path.
+# The preamble line is capped at 200 characters: a real preamble is short, and an
+# unbounded [^:\n]* backtracks across the whole text when the first line has no
+# newline (e.g. a single long paragraph that happens to start with "This is").
+_PREAMBLE_RE = re.compile(
+    r'^(Here is|Here\'s|Below is|Below\'s|This is|The following is)'
+    r'[^:\n]{0,200}:?\s*\n+',
+    re.IGNORECASE,
+)
+_DOTS_RE       = re.compile(r'\.{2,}')
+_PRE_PUNCT_RE  = re.compile(r' +(?=[.,!?;:])')
+_SPACES_RE     = re.compile(r'  +')
+_BLANK_RE      = re.compile(r'\n{3,}')
+_PRE_PUNCT     = (" .", " ,", " !", " ?", " ;", " :")
+
+
+def strip_think(text: str) -> str:
+    """Remove <think>...</think> blocks from reasoning models in linear time.
+
+    Equivalent to re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL), which
+    rescans to the end of the text for every unclosed <think> and goes quadratic.
+    """
+    start = text.find("<think>")
+    if start < 0:
+        return text
+    parts, pos = [], 0
+    while start >= 0:
+        end = text.find("</think>", start + 7)
+        if end < 0:
+            break   # unclosed: like the regex, leave the rest untouched
+        parts.append(text[pos:start])
+        pos = end + 8
+        start = text.find("<think>", pos)
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def clean_text(text: str) -> str:
+    """Remove LLM preamble artifacts and fix punctuation spacing.
+
+    Each fix is a precompiled constant-replacement pass guarded by a substring
+    check, so clean model output costs a handful of memchr-speed scans.
+    """
+    # Reasoning blocks come first in the output, so drop them before the preamble check
+    text = strip_think(text)
+    # Strip common LLM preamble patterns
+    text = _PREAMBLE_RE.sub('', text, count=1)
+    # Fix double periods
+    if ".." in text:
+        text = _DOTS_RE.sub('.', text)
+    # Fix space before punctuation
+    if any(p in text for p in _PRE_PUNCT):
+        text = _PRE_PUNCT_RE.sub('', text)
+    # Collapse multiple spaces
+    if "  " in text:
+        text = _SPACES_RE.sub(' ', text)
+    # Collapse excessive blank lines
+    if "\n\n\n" in text:
+        text = _BLANK_RE.sub('\n\n', text)
+    return text.strip()
@@ -0,0 +1,77 @@
+"""
+Token estimation — a chars-per-token model per model family, refined from the
+prompt-token counts providers report, and the output budgets derived from it.
+"""
+
+import os
+import threading
+
+CHARS_PER_TOKEN = 4   # rough average for English prose
+
+# Characters per token on English prose, by tokenizer family (matched against
+# the model id). Larger vocabularies pack more characters into a token.
+FAMILY_CHARS_PER_TOKEN = {
+    "llama-3":  4.2,   # 128k-vocab tiktoken-style tokenizer
+    "llama3":   4.2,
+    "gemma":    4.3,   # 256k vocab, shared with Gemini
+    "gemini":   4.3,
+    "deepseek": 4.0,
+    "qwen":     4.1,
+    "mistral":  3.7,   # 32k sentencepiece vocab
+    "mixtral":  3.7,
+    "phi":      3.7,
+}
+
+CALIBRATION_WEIGHT    = 0.2   # EMA weight of each observed prompt
+CALIBRATION_MIN_CHARS = 400   # ignore prompts too short to say much
+PROMPT_OVERHEAD       = 8     # chat-template tokens around system + user
+
+BUDGET_MARGIN   = float(os.environ.get("AUTHENTICA_BUDGET_MARGIN", 0.3))   # safety margin on the estimate
+BUDGET_HEADROOM = 64    # tokens for stray preambles and closing lines
+BUDGET_FLOOR    = 256
+
+
+class TokenEstimator:
+    """Chars-per-token per model: starts from the family table and follows the
+    prompt_tokens providers report (exponential moving average)."""
+
+    def __init__(self):
+        self._observed = {}
+        self._lock = threading.Lock()
+
+    def chars_per_token(self, model: str = "") -> float:
+        with self._lock:
+            if model in self._observed:
+                return self._observed[model]
+        lowered = (model or "").lower()
+        for family, ratio in FAMILY_CHARS_PER_TOKEN.items():
+            if family in lowered:
+                return ratio
+        return CHARS_PER_TOKEN
+
+    def estimate(self, text: str, model: str = "") -> int:
+        return max(1, int(len(text) / self.chars_per_token(model)) + 1)
+
+    def calibrate(self, model: str, chars: int, tokens) -> None:
+        """Fold in one observation: a prompt of `chars` characters billed as `tokens`."""
+        if not tokens or chars < CALIBRATION_MIN_CHARS or tokens <= PROMPT_OVERHEAD:
+            return
+        ratio = chars / (tokens - PROMPT_OVERHEAD)
+        current = self.chars_per_token(model)
+        with self._lock:
+            self._observed[model] = current + CALIBRATION_WEIGHT * (ratio - current)
+
+
+ESTIMATOR = TokenEstimator()
+
+
+def estimate_tokens(text: str, model: str = "") -> int:
+    return ESTIMATOR.estimate(text, model)
+
+
+def output_budget(text: str, model: str, ratio: float = 1.0, ceiling: int = 3500) -> int:
+    """max_tokens for rewriting `text`: the expected output (`ratio` × input
+    tokens) plus BUDGET_MARGIN and BUDGET_HEADROOM, clamped to [BUDGET_FLOOR, ceiling]."""
+    expected = estimate_tokens(text, model) * ratio
+    budget = int(expected * (1 + BUDGET_MARGIN)) + BUDGET_HEADROOM
+    return max(min(BUDGET_FLOOR, ceiling), min(budget, ceiling))
@@ -0,0 +1,323 @@
+"""
+Static page content for the Streamlit app — CSS, header, reference text and
+HTML snippets. Built once at import, so app.py reruns only send them.
+"""
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  PAGE STYLE & HEADER
+# ─────────────────────────────────────────────────────────────────────────────
+
+APP_CSS = """
+<style>
+@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Fraunces:ital,wght@0,700;1,400&display=swap');
+
+html, body, [class*="css"] { font-family: 'Inter', sans-serif !important; }
+h1, h2, h3 { font-family: 'Fraunces', serif !important; }
+
+/* App background */
+.stApp { background: #0c0c10 !important; }
+.main .block-container { padding-top: 1.5rem; padding-bottom: 2rem; max-width: 1280px; }
+
+/* Sidebar */
+section[data-testid="stSidebar"] {
+    background: #111117 !important;
+    border-right: 1px solid #1e1e2e !important;
+}
+section[data-testid="stSidebar"] * { color: #b0b0c0 !important; font-size: 13px !important; }
+section[data-testid="stSidebar"] h3 { color: #e0e0f0 !important; font-size: 14px !important; font-family: 'Inter', sans-serif !important; font-weight: 600 !important; }
+section[data-testid="stSidebar"] .stRadio > label { color: #888 !important; }
+section[data-testid="stSidebar"] hr { border-color: #1e1e2e !important; }
+
+/* Inputs */
+div[data-testid="stTextArea"] textarea {
+    background: #13131a !important;
+    border: 1.5px solid #252535 !important;
+    border-radius: 10px !important;
+    color: #d8d8e8 !important;
+    font-family: 'Inter', sans-serif !important;
+    font-size: 14px !important;
+    line-height: 1.75 !important;
+    resize: vertical !important;
+}
+div[data-testid="stTextArea"] textarea:focus {
+    border-color: #6366f1 !important;
+    box-shadow: 0 0 0 3px rgba(99,102,241,0.12) !important;
+    outline: none !important;
+}
+div[data-testid="stTextArea"] textarea::placeholder { color: #3a3a55 !important; }
+div[data-testid="stTextArea"] label { color: #4a4a6a !important; font-size: 11px !important; }
+div[data-testid="stTextInput"] input {
+    background: #13131a !important;
+    border: 1.5px solid #252535 !important;
+    border-radius: 8px !important;
+    color: #c0c0d8 !important;
+    font-size: 13px !important;
+}
+div[data-testid="stSelectbox"] > div > div {
+    background: #13131a !important;
+    border: 1.5px solid #252535 !important;
+    border-radius: 8px !important;
+    color: #c0c0d8 !important;
+}
+.stSelectbox label { color: #5a5a7a !important; font-size: 11px !important; }
+.stCheckbox label { color: #9090b0 !important; }
+.stRadio label { color: #9090b0 !important; }
+
+/* Primary button */
+.stButton > button[kind="primary"] {
+    background: linear-gradient(135deg, #4f46e5, #7c3aed) !important;
+    color: #fff !important;
+    border: none !important;
+    border-radius: 10px !important;
+    font-family: 'Inter', sans-serif !important;
+    font-weight: 600 !important;
+    font-size: 14px !important;
+    padding: 12px 20px !important;
+    letter-spacing: 0.02em !important;
+    box-shadow: 0 4px 24px rgba(99,102,241,0.28) !important;
+    transition: all 0.2s !important;
+}
+.stButton > button[kind="primary"]:hover {
+    box-shadow: 0 6px 32px rgba(99,102,241,0.42) !important;
+    transform: translateY(-1px) !important;
+}
+/* Secondary button */
+.stButton > button[kind="secondary"] {
+    background: #1a1a28 !important;
+    color: #9090c0 !important;
+    border: 1px solid #2a2a40 !important;
+    border-radius: 8px !important;
+    font-size: 13px !important;
+    font-weight: 500 !important;
+    padding: 8px 16px !important;
+}
+.stButton > button[kind="secondary"]:hover {
+    border-color: #4f46e5 !important;
+    color: #b0b0e0 !important;
+}
+
+/* Metric cards */
+div[data-testid="stMetric"] {
+    background: #13131a;
+    border: 1px solid #1e1e2e;
+    border-radius: 10px;
+    padding: 12px 14px;
+}
+div[data-testid="stMetric"] label { color: #4a4a6a !important; font-size: 11px !important; }
+div[data-testid="stMetric"] div[data-testid="stMetricValue"] { color: #8080c8 !important; font-size: 20px !important; font-weight: 700 !important; }
+
+/* Expander */
+details summary { color: #7070a8 !important; font-size: 13px !important; }
+details { border: 1px solid #1e1e2e !important; border-radius: 10px !important; background: #111117 !important; }
+
+/* Scrollbar */
+::-webkit-scrollbar { width: 5px; height: 5px; }
+::-webkit-scrollbar-track { background: #0c0c10; }
+::-webkit-scrollbar-thumb { background: #252535; border-radius: 4px; }
+
+/* Alert boxes */
+div[data-testid="stAlert"] { border-radius: 8px !important; border-width: 1px !important; }
+</style>
+"""
+
+HEADER_HTML = """
+<div style="
+  background: linear-gradient(135deg, #0f0f1a 0%, #12121f 50%, #0a0a15 100%);
+  border: 1px solid #1e1e30;
+  border-radius: 16px;
+  padding: 28px 36px;
+  margin-bottom: 24px;
+">
+  <h1 style="
+    font-family: 'Fraunces', serif !important;
+    font-size: 30px;
+    color: #e8e8f8;
+    margin: 0 0 6px 0;
+    letter-spacing: -0.5px;
+  ">✍️ Authentica <span style="color:#6366f1">v6</span></h1>
+  <p style="color:#3a3a5a;font-size:13px;margin:0;letter-spacing:0.05em;text-transform:uppercase">
+    Structural AI Humanizer &nbsp;·&nbsp; 5 Detector Targets &nbsp;·&nbsp; 20 Content Types &nbsp;·&nbsp; 3 Free Providers
+  </p>
+</div>
+"""
+
+FREE_LIMITS_HTML = """<div style='font-size:11px;color:#2e2e4e;line-height:1.8'>
+<b style='color:#3a3a5a'>Free API limits:</b><br>
+OpenRouter — rate limited but free<br>
+Groq — 14,400 req/day free<br>
+Gemini — 1,000 req/day free<br>
+Requests are paced per minute and retried on 429s.
+</div>"""
+
+
+def badge(label, active):
+    """A detector pill for the header, lit when the detector is targeted."""
+    if active:
+        return f'<span style="background:rgba(99,102,241,0.15);color:#818cf8;border:1px solid rgba(99,102,241,0.35);border-radius:20px;padding:3px 11px;font-size:11px;font-weight:600;margin:2px;display:inline-block;letter-spacing:0.04em">{label}</span>'
+    return f'<span style="background:rgba(255,255,255,0.03);color:#2e2e4e;border:1px solid rgba(255,255,255,0.06);border-radius:20px;padding:3px 11px;font-size:11px;font-weight:600;margin:2px;display:inline-block;letter-spacing:0.04em">{label}</span>'
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  TIPS & REFERENCE
+# ─────────────────────────────────────────────────────────────────────────────
+
+TIPS = [
+    "Add one real specific detail — a year, a number, a named example",
+    'Turn one statement into a question: "Why does this matter? Because..."',
+    "Break one symmetrical long paragraph in half",
+    "Add one self-correction or parenthetical aside (like this one)",
+    "Read it aloud — anything that sounds robotic is a detector signal",
+    "Vary where the key claim sits: sometimes lead, sometimes build to it",
+]
+
+REASONS = [
+    ("No contraction injection", "Detectors now flag forced I'm/I'd/I've chains as a humanizer artifact"),
+    ("Structural Pass 1", "Breaks AI's predictable topic-sentence→support→conclusion layout before humanizing"),
+    ("Syntax restructuring", "Sentences change grammatical form, not just vocabulary — defeats Quillbot detection"),
+    ("Rhythm Pass 3", "Explicitly targets burstiness (sentence length variation) — the #1 GPTZero signal"),
+    ("Preamble stripping", 'Removes "Here is the rewritten text:" and <think> blocks from reasoning models'),
+]
+
+# Each list as one markdown element rather than one per row
+TIPS_HTML = "".join(
+    f'<div style="background:#0f0f18;border-left:3px solid #1e1e35;border-radius:0 7px 7px 0;'
+    f'padding:8px 13px;font-size:12px;color:#4a4a6a;margin:5px 0">{tip}</div>'
+    for tip in TIPS
+)
+REASONS_HTML = "".join(
+    f'<div style="background:#0f0f18;border-left:3px solid #1e1e35;border-radius:0 7px 7px 0;'
+    f'padding:8px 13px;font-size:12px;color:#4a4a6a;margin:5px 0">'
+    f'<b style="color:#3a3a5a">{title}</b> — {desc}</div>'
+    for title, desc in REASONS
+)
+
+REFERENCE_MD = """
+### Free Model Guide
+
+| Provider | Model | Best for | Free limit |
+|---|---|---|---|
+| OpenRouter | **Mistral 7B Instruct** | General humanization | Rate limited |
+| OpenRouter | **Gemma 2 9B** | Lightweight, fast | Rate limited |
+| OpenRouter | **Llama 3.1 8B** | Balanced quality/speed | Rate limited |
+| OpenRouter | **Phi-3.5 Mini** | Small but capable | Rate limited |
+| OpenRouter | **DeepSeek V2.5** | Reasoning tasks | Rate limited |
+| Groq | **Llama 3.3 70B** | Fastest inference, high quality | 14,400 req/day |
+| Gemini | **Gemini 2.0 Flash** | Multimodal, fast | 1,000 req/day |
+
+**Setup:** OpenRouter at openrouter.ai/keys · Groq at console.groq.com · Gemini at aistudio.google.com/apikey
+
+---
+
+### Pipeline Summary
+
+| Type | Passes | What each pass does |
+|---|---|---|
+| **General (Blog, LinkedIn, Marketing, etc.)** | 4 | 1: Structural deconstruction → 2: Voice humanization → 3: Burstiness/rhythm → 4: Coherence polish |
+| **Formal (SOP, Email, Cover Letter, etc.)** | 1 | Single carefully-prompted pass with document-specific rules |
+
+---
+
+### Detector Signal Map
+
+| Detector | Primary signal measured | v6 counter-strategy |
+|---|---|---|
+| **GPTZero 3.15b** | Token perplexity + sentence burstiness | Pass 1 breaks structure; Pass 3 forces dramatic length variation; high temperature raises perplexity |
+| **Originality.ai** | Semantic fingerprinting vs known LLM probability chains | Reorders idea sequence, injects idioms, adds concrete specifics, avoids predictable paragraph structure |
+| **Turnitin** | Stylometric ML — structural patterns, paragraph symmetry, absent personal voice | Breaks paragraph symmetry, injects subjective observations, eliminates parallel list structures |
+| **ZeroGPT** | Formal transition detection + uniform clause lengths | All formal transitions replaced in Pass 3; clause lengths varied explicitly |
+| **Quillbot** | Paraphrase pattern — detects synonym-replacement chains as distinct fingerprint | Rewrites at syntax level (grammatical form, perspective, structure) not vocabulary level |
+
+---
+
+### Common reasons detection remains high (after using this tool)
+
+1. **Text is very short** (<100 words) — detectors are more confident on short texts
+2. **Highly technical content** — domain jargon creates low-perplexity sequences that read as AI
+3. **Original was heavily formulaic** — even 4 passes can't fully mask extreme structural AI patterns
+4. **Post-edit drift** — running the output through another tool (Quillbot, etc.) can re-introduce AI patterns
+5. **Model rate limits** — free models at capacity may return lower-quality rewrites
+"""
+
+FOOTER_HTML = (
+    '<div style="text-align:center;color:#1e1e2e;font-size:11px;margin-top:32px;padding:16px">'
+    'Authentica v6 · Structural AI Humanizer · Powered by OpenRouter / Groq / Gemini · For legitimate content work only'
+    '</div>'
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  CLIPBOARD BUTTON  (page for app.clipboard_button's iframe)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def clipboard_html(text_to_copy: str, button_label: str) -> str:
+    """A self-contained page with a working JS copy-to-clipboard button."""
+    # Safely encode the text for embedding in JS
+    escaped = text_to_copy.replace("\\", "\\\\").replace("`", "\\`").replace("$", "\\$")
+    return f"""
+    <html>
+    <head>
+    <style>
+      body {{ margin:0; padding:0; background:transparent; display:flex; align-items:center; }}
+      button {{
+        background: linear-gradient(135deg, #4f46e5, #7c3aed);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-family: 'Inter', -apple-system, sans-serif;
+        font-size: 13px;
+        font-weight: 600;
+        cursor: pointer;
+        width: 100%;
+        letter-spacing: 0.03em;
+        transition: opacity 0.15s;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        gap: 8px;
+      }}
+      button:hover {{ opacity: 0.88; }}
+      button.done {{
+        background: linear-gradient(135deg, #059669, #10b981);
+      }}
+    </style>
+    </head>
+    <body>
+    <button id="cb" onclick="doCopy()">
+      {button_label}
+    </button>
+    <script>
+      const txt = `{escaped}`;
+      function doCopy() {{
+        if (navigator.clipboard && navigator.clipboard.writeText) {{
+          navigator.clipboard.writeText(txt).then(function() {{
+            const b = document.getElementById('cb');
+            b.innerText = '✓ Copied!';
+            b.className = 'done';
+            setTimeout(() => {{ b.innerText = '{button_label}'; b.className = ''; }}, 2200);
+          }}).catch(fallback);
+        }} else {{ fallback(); }}
+      }}
+      function fallback() {{
+        const ta = document.createElement('textarea');
+        ta.value = txt;
+        ta.style.position = 'fixed';
+        ta.style.opacity = '0';
+        document.body.appendChild(ta);
+        ta.focus(); ta.select();
+        try {{
+          document.execCommand('copy');
+          const b = document.getElementById('cb');
+          b.innerText = '✓ Copied!';
+          b.className = 'done';
+          setTimeout(() => {{ b.innerText = '{button_label}'; b.className = ''; }}, 2200);
+        }} catch(e) {{
+          alert('Copy failed. Please use Ctrl+A → Ctrl+C on the text area above.');
+        }}
+        document.body.removeChild(ta);
+      }}
+    </script>
+    </body>
+    </html>
+    """
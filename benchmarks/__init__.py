@@ -0,0 +1,5 @@
+"""
+Micro- and end-to-end benchmarks. Run from the repository root, e.g.
+
+    python -m benchmarks.bench_text
+"""
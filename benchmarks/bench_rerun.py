@@ -0,0 +1,121 @@
+"""
+Streamlit rerun latency — drives app.py headlessly with AppTest and times the
+reruns that widget interactions trigger, optionally across concurrent sessions.
+
+    python -m benchmarks.bench_rerun [--reruns 30] [--sessions 1,4,16]
+    python -m benchmarks.bench_rerun --script /tmp/app_before.py    # compare another version
+
+Sessions run in separate processes (AppTest keeps one runtime per process),
+so --sessions measures CPU contention between reruns rather than shared
+in-process caches. Each session toggles a sidebar checkbox, switches the content group and
+reruns unchanged in turn; no provider is called (the Humanize button is never
+pressed). The first run of each session (imports, cache_resource set-up) is
+reported separately as the cold start. Wall times include AppTest's own
+polling; the CPU column (process time per rerun) isolates the work done.
+Needs streamlit.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .suite import percentile
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+TIMEOUT  = 60   # seconds per run
+
+
+def _widget(widgets, label):
+    return next(w for w in widgets if w.label == label)
+
+
+def _interactions(at):
+    """Cycle of widget changes, each returning the AppTest to run. Elements are
+    looked up afresh every time, since each run replaces them."""
+    groups = list(_widget(at.radio, "Group").options)
+    step = 0
+    while True:
+        step += 1
+        kind = step % 3
+        if kind == 0:
+            yield at
+        elif kind == 1:
+            toggle = _widget(at.checkbox, "Stream Output")
+            toggle.set_value(not toggle.value)
+            yield at
+        else:
+            _widget(at.radio, "Group").set_value(groups[step % len(groups)])
+            yield at
+
+
+def _share_script_cache() -> None:
+    """AppTest compiles the script afresh on every run, where a server compiles
+    it once per process; share one ScriptCache so reruns are timed like the server's."""
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test, local_script_runner
+
+    shared = ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: shared
+
+
+def run_session(script: str, reruns: int, compile_each_run: bool = False) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    if not compile_each_run:
+        _share_script_cache()
+    at = AppTest.from_file(script, default_timeout=TIMEOUT)
+    start = time.perf_counter()
+    at.run()
+    cold = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"app raised on first run: {at.exception[0].message}")
+    steps, times, cpu = _interactions(at), [], []
+    for _ in range(reruns):
+        pending = next(steps)
+        start, start_cpu = time.perf_counter(), time.process_time()
+        pending.run()
+        times.append(time.perf_counter() - start)
+        cpu.append(time.process_time() - start_cpu)
+    return {"cold": cold, "times": times, "cpu": cpu}
+
+
+def run_level(script: str, sessions: int, reruns: int, compile_each_run: bool = False) -> dict:
+    # AppTest keeps one runtime per process, so each session gets its own process
+    start = time.perf_counter()
+    with ProcessPoolExecutor(sessions) as pool:
+        results = list(pool.map(run_session, [script] * sessions, [reruns] * sessions,
+                                 [compile_each_run] * sessions))
+    elapsed = time.perf_counter() - start
+    times = [t * 1000 for r in results for t in r["times"]]
+    cpu = [t * 1000 for r in results for t in r["cpu"]]
+    return {
+        "sessions":     sessions,
+        "cold_ms":      max(r["cold"] for r in results) * 1000,
+        "p50_ms":       percentile(times, 50),
+        "p95_ms":       percentile(times, 95),
+        "cpu_p50_ms":   percentile(cpu, 50),
+        "reruns_per_s": len(times) / elapsed,
+    }
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--script", default=APP_PATH, help="Streamlit script to drive (default: app.py)")
+    p.add_argument("--reruns", type=int, default=30, help="timed reruns per session")
+    p.add_argument("--sessions", default="1,4,16", help="comma-separated concurrent session counts")
+    p.add_argument("--compile-each-run", action="store_true",
+                   help="keep AppTest's per-run script compilation (a server compiles once)")
+    args = p.parse_args(argv)
+    script = os.path.abspath(args.script)   # AppTest resolves relative paths against this file
+
+    print(f"{'sessions':>9}{'cold ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'cpu p50 ms':>12}{'reruns/s':>11}")
+    for sessions in (int(s) for s in args.sessions.split(",")):
+        level = run_level(script, sessions, args.reruns, args.compile_each_run)
+        print(f"{sessions:>9}{level['cold_ms']:>10.1f}{level['p50_ms']:>10.1f}{level['p95_ms']:>10.1f}"
+              f"{level['cpu_p50_ms']:>12.1f}{level['reruns_per_s']:>11.1f}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
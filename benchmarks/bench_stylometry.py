@@ -0,0 +1,46 @@
+"""
+Stylometry throughput — analyze_batch() over a batch vs analyze() per document.
+
+    python -m benchmarks.bench_stylometry [--docs 4000] [--words 300] [--repeat 3]
+
+analyze_batch() computes more metrics than analyze() (phrase hits, length
+histograms, repeated starters), so equal docs/s already favours the batch path.
+"""
+
+import argparse
+import time
+
+from authentica.stylometry import analyze, analyze_batch
+
+from .suite import make_corpus
+
+
+def best_of(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--docs", type=int, default=4000, help="documents per batch")
+    p.add_argument("--words", type=int, default=300, help="approximate words per document")
+    p.add_argument("--repeat", type=int, default=3, help="runs per case; the best is reported")
+    args = p.parse_args(argv)
+
+    docs = make_corpus(args.docs, args.words)
+    analyze_batch(docs[:10])   # import NumPy and build the hash tables outside the timing
+    mib = sum(len(d) for d in docs) / (1024 * 1024)
+    print(f"{'function':<18}{'seconds':>10}{'docs/s':>12}{'MiB/s':>10}")
+    for name, fn in (("analyze_batch", lambda: analyze_batch(docs)),
+                     ("analyze", lambda: [analyze(d) for d in docs])):
+        secs = best_of(fn, args.repeat)
+        print(f"{name:<18}{secs:>10.3f}{args.docs / secs:>12.0f}{mib / secs:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
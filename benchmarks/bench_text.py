@@ -0,0 +1,77 @@
+"""
+clean_text() / remove_cliches() throughput on multi-megabyte inputs.
+
+    python -m benchmarks.bench_text [--mb 4] [--repeat 3]
+
+Each case is timed against the legacy multi-regex implementation kept below
+for reference; the legacy run is skipped on the pathological case, where it
+is quadratic.
+"""
+
+import argparse
+import re
+import time
+
+from authentica.text import clean_text, remove_cliches
+
+CLEAN = (
+    "The quarterly numbers held up better than expected, mostly because the team cut two "
+    "projects early. Nobody loved that call at the time.\n\n"
+)
+PROSE = (
+    "Here's the thing: we delve into robust data in order to win .. and then  some.  "
+    "It is important to note that the landscape shifts , every quarter!\n\n\n"
+)
+
+
+def legacy_clean_text(text: str) -> str:
+    """clean_text() as it was before the regexes were fused (for comparison)."""
+    text = re.sub(r'^(Here is|Here\'s|Below is|Below\'s|This is|The following is)'
+                  r'[^:\n]*:?\s*\n+', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL)
+    text = re.sub(r'\.{2,}', '.', text)
+    text = re.sub(r' +([.,!?;:])', r'\1', text)
+    text = re.sub(r'  +', ' ', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+def make_cases(mb: float) -> dict:
+    size = int(mb * 1024 * 1024)
+    clean = (CLEAN * (size // len(CLEAN) + 1))[:size]
+    prose = (PROSE * (size // len(PROSE) + 1))[:size]
+    thinking = ("<think>" + "reasoning step. " * 2000 + "</think>\n" + PROSE * 50) * (size // 40000 + 1)
+    # Many openers and no closer: every opener makes the lazy regex rescan to the end
+    unclosed = ("<think> partial thought " * (size // 24 + 1))[:size]
+    return {"clean output": clean, "artifact-heavy prose": prose, "closed <think> blocks": thinking[:size], "unclosed <think> tags": unclosed}
+
+
+def best_of(fn, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--mb", type=float, default=4.0, help="input size per case in MiB")
+    p.add_argument("--repeat", type=int, default=5, help="runs per case; the best is reported")
+    args = p.parse_args(argv)
+
+    print(f"{'case':<24}{'function':<18}{'seconds':>10}{'MiB/s':>10}{'legacy s':>12}")
+    for name, text in make_cases(args.mb).items():
+        mib = len(text) / (1024 * 1024)
+        fns = [("clean_text", clean_text, legacy_clean_text if "unclosed" not in name else None),
+               ("remove_cliches", remove_cliches, None)]
+        for fname, fn, legacy in fns:
+            secs = best_of(fn, text, args.repeat)
+            old = f"{best_of(legacy, text, args.repeat):>12.3f}" if legacy else f"{'—':>12}"
+            print(f"{name:<24}{fname:<18}{secs:>10.3f}{mib / secs:>10.1f}{old}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+"""
+Pipeline mode comparison — runs the same corpus through the general (4-pass)
+and fast (2-pass) pipelines and reports latency, token usage and the local
+stylometric metrics side by side.
+
+    python -m benchmarks.compare_modes                        # in-process mock provider
+    python -m benchmarks.compare_modes --serve                # local stand-in server over HTTP
+    python -m benchmarks.compare_modes --provider groq --api-key $GROQ_API_KEY --corpus texts.jsonl
+
+--corpus takes anything `python -m authentica` accepts (a directory of
+.txt/.md files or a JSONL file); without it a synthetic corpus is used. The
+mock and the stand-in echo their input, so with them only the latency and
+token columns mean anything — run against a real provider to compare style.
+Needs NumPy for the stylometry columns.
+"""
+
+import argparse
+import os
+import threading
+import time
+
+from authentica import providers
+from authentica.catalog import CONTENT_TYPES, GENERAL_BEST_MODEL
+from authentica.cli import load_items
+from authentica.pipeline import humanize
+from authentica.ratelimit import RATE_LIMITER
+from authentica.stylometry import analyze_batch
+from authentica.telemetry import TELEMETRY
+
+from . import standin_server
+from .mock_provider import MockProvider
+from .suite import make_corpus, percentile
+
+MODES = ("general", "fast")
+STYLE_METRICS = ("mean_sentence", "burstiness", "paragraph_cv", "transition_rate",
+                 "forbidden", "cliches", "repeated_starters")
+
+
+def run_mode(mode: str, docs: list, provider: str, api_key: str, model: str, content_type: str) -> dict:
+    """Humanize every document with one pipeline; return latency, usage and outputs."""
+    latencies, outputs, errors = [], [], 0
+    with TELEMETRY.collect() as run:
+        for doc in docs:
+            t0 = time.perf_counter()
+            result = humanize(doc, content_type, "Conversational", provider, api_key, model,
+                              False, True, True, True, True, True, pipeline=mode)
+            if result.startswith("Error:"):
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - t0)
+                outputs.append(result)
+    n = len(docs)
+    return {
+        "p50_s":                  percentile(latencies, 50),
+        "p90_s":                  percentile(latencies, 90),
+        "calls_per_doc":          run.get("calls", 0) / n,
+        "prompt_tok_per_doc":     run.get("prompt_tokens", 0) / n,
+        "completion_tok_per_doc": run.get("completion_tokens", 0) / n,
+        "error_rate":             errors / n,
+        "outputs":                outputs,
+    }
+
+
+def style_means(texts: list) -> dict:
+    if not texts:
+        return {}
+    cols = analyze_batch(texts)
+    return {name: float(cols[name].mean()) for name in STYLE_METRICS}
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--corpus", help="directory of .txt/.md files or a JSONL file (default: synthetic)")
+    p.add_argument("--docs", type=int, default=20, help="synthetic documents to generate")
+    p.add_argument("--words", type=int, default=300, help="approximate words per synthetic document")
+    p.add_argument("--content-type", default=None,
+                   help="general-pipeline content type (default: the first one in the catalog)")
+    p.add_argument("--provider", default="mock", choices=["mock", *providers.PROVIDER_BACKENDS])
+    p.add_argument("--model", help="model id (default: the provider's general-pipeline model)")
+    p.add_argument("--api-key", default=os.environ.get("AUTHENTICA_API_KEY", "x"))
+    p.add_argument("--base-url", help="stand-in root URL, e.g. http://127.0.0.1:8787")
+    p.add_argument("--serve", action="store_true", help="start a stand-in server in this process")
+    p.add_argument("--latency", type=float, default=0.05, help="mock / stand-in mean latency (s)")
+    args = p.parse_args(argv)
+
+    if args.serve:
+        server = standin_server.make_server(standin_server.parse_args(
+            ["--port", "0", f"--latency={args.latency}"]))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address[:2]
+        args.base_url = f"http://{host}:{port}"
+        if args.provider == "mock":
+            args.provider = "openrouter"
+    if args.base_url:
+        providers.OPENROUTER_BASE_URL = args.base_url.rstrip("/") + "/api/v1"
+        os.environ["GROQ_BASE_URL"] = args.base_url.rstrip("/")
+        RATE_LIMITER.set_limit(args.provider, 0)
+    if args.provider == "mock":
+        MockProvider(latency=args.latency, jitter=args.latency / 4).install()
+
+    content_type = args.content_type or next(k for k, v in CONTENT_TYPES.items() if v["pipeline"] == "general")
+    if CONTENT_TYPES.get(content_type, {}).get("pipeline") != "general":
+        p.error(f"{content_type!r} is not a general-pipeline content type")
+    model = args.model or GENERAL_BEST_MODEL.get(args.provider, "standin-model")
+    docs = [item["text"] for item in load_items(args.corpus)] if args.corpus else make_corpus(args.docs, args.words)
+
+    results = {mode: run_mode(mode, docs, args.provider, args.api_key, model, content_type) for mode in MODES}
+    try:
+        style = {"input": style_means(docs)}
+        style.update({mode: style_means(results[mode]["outputs"]) for mode in MODES})
+    except ImportError as e:
+        print(f"(stylometry skipped: {e})")
+        style = {}
+
+    print(f"{len(docs)} documents, {content_type}, {args.provider}/{model}\n")
+    print(f"{'metric':<26}" + "".join(f"{mode:>12}" for mode in MODES))
+    for key in ("p50_s", "p90_s", "calls_per_doc", "prompt_tok_per_doc", "completion_tok_per_doc", "error_rate"):
+        print(f"{key:<26}" + "".join(f"{results[mode][key]:>12.2f}" for mode in MODES))
+    if style:
+        print(f"\n{'stylometry (mean)':<26}" + "".join(f"{col:>12}" for col in style))
+        for name in STYLE_METRICS:
+            print(f"{name:<26}" + "".join(f"{style[col].get(name, float('nan')):>12.3f}" for col in style))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,135 @@
+"""
+Load generator — ramps N concurrent simulated users through humanize() and
+reports where throughput stops growing.
+
+    python -m benchmarks.loadgen --serve [--users 1,2,4,8,16,32] [--duration 20]
+    python -m benchmarks.loadgen --base-url http://127.0.0.1:8787 --provider groq
+    python -m benchmarks.loadgen --provider mock     # in-process, no HTTP
+
+--serve starts benchmarks.standin_server on a free local port (its knobs are
+passed through: --latency, --tokens-per-sec, --rps, --max-concurrency,
+--rate-429, --output-words). Each user has its own API key, as separate app
+users would, and loops over fresh documents with the result cache off.
+Client-side free-tier pacing is disabled unless --client-limits is given, so
+the numbers describe the app and the server rather than the quota.
+"""
+
+import argparse
+import os
+import threading
+import time
+
+from authentica import providers
+from authentica.catalog import CONTENT_TYPES, GENERAL_BEST_MODEL
+from authentica.pipeline import humanize
+from authentica.ratelimit import RATE_LIMITER
+
+from . import standin_server
+from .mock_provider import MockProvider
+from .suite import make_corpus, percentile
+
+SATURATION_GAIN = 1.10   # a level must beat the previous one's throughput by 10% to count as scaling
+
+
+def run_level(users: int, duration: float, docs: list, provider: str, model: str, content_type: str) -> dict:
+    """Run `users` closed-loop users for `duration` seconds."""
+    latencies, errors = [], []
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def user(u):
+        n = u
+        while time.monotonic() < deadline:
+            doc = docs[n % len(docs)]
+            n += users
+            t0 = time.perf_counter()
+            result = humanize(doc, content_type, "Conversational", provider, f"load-user-{u}", model,
+                              False, True, True, True, True, True)
+            seconds = time.perf_counter() - t0
+            with lock:
+                (errors if result.startswith("Error:") else latencies).append(seconds)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=user, args=(u,), daemon=True) for u in range(users)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    total = len(latencies) + len(errors)
+    return {
+        "users":      users,
+        "docs_per_s": len(latencies) / elapsed,
+        "p50_s":      percentile(latencies, 50),
+        "p95_s":      percentile(latencies, 95),
+        "error_rate": len(errors) / total if total else 0.0,
+    }
+
+
+def saturation_point(levels: list):
+    """The last user count whose throughput still grew by SATURATION_GAIN, or None if it never stopped."""
+    for prev, cur in zip(levels, levels[1:]):
+        if cur["docs_per_s"] < prev["docs_per_s"] * SATURATION_GAIN:
+            return prev["users"]
+    return None
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--users", default="1,2,4,8,16,32", help="comma-separated concurrency levels")
+    p.add_argument("--duration", type=float, default=20, help="seconds per level")
+    p.add_argument("--docs", type=int, default=50, help="distinct documents to cycle through")
+    p.add_argument("--words", type=int, default=300, help="approximate words per document")
+    p.add_argument("--content-type", choices=("general", "formal"), default="general",
+                   help="which pipeline to drive (4 passes or 1)")
+    p.add_argument("--provider", choices=("openrouter", "groq", "mock"), default="openrouter")
+    p.add_argument("--model", help="model id sent to the server (default: the provider's general model)")
+    p.add_argument("--base-url", help="stand-in root URL, e.g. http://127.0.0.1:8787")
+    p.add_argument("--serve", action="store_true", help="start a stand-in server in this process")
+    p.add_argument("--client-limits", action="store_true", help="keep the app's free-tier request pacing")
+    sp = standin_server.parse_args([])
+    for flag in ("latency", "jitter", "tokens_per_sec", "rps", "max_concurrency", "rate_429", "output_words"):
+        p.add_argument("--" + flag.replace("_", "-"), type=type(getattr(sp, flag)), default=getattr(sp, flag),
+                       help="stand-in server setting (--latency/--jitter also drive --provider mock)")
+    args = p.parse_args(argv)
+
+    if args.serve:
+        server = standin_server.make_server(standin_server.parse_args(
+            ["--port", "0"] + [f"--{k.replace('_', '-')}={getattr(args, k)}" for k in
+                               ("latency", "jitter", "tokens_per_sec", "rps", "max_concurrency",
+                                "rate_429", "output_words")]))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address[:2]
+        args.base_url = f"http://{host}:{port}"
+    if args.provider == "mock":
+        MockProvider(latency=args.latency, jitter=args.jitter).install()
+    elif not args.base_url:
+        p.error("--base-url or --serve is required unless --provider mock")
+    else:
+        providers.OPENROUTER_BASE_URL = args.base_url.rstrip("/") + "/api/v1"
+        os.environ["GROQ_BASE_URL"] = args.base_url.rstrip("/")
+    if not args.client_limits:
+        RATE_LIMITER.set_limit(args.provider, 0)
+
+    model = args.model or GENERAL_BEST_MODEL.get(args.provider, "standin-model")
+    content_type = next(k for k, v in CONTENT_TYPES.items() if v["pipeline"] == args.content_type)
+    docs = make_corpus(args.docs, args.words)
+
+    print(f"{'users':>6}{'docs/s':>10}{'p50 s':>10}{'p95 s':>10}{'errors':>9}")
+    levels = []
+    for users in (int(u) for u in args.users.split(",")):
+        level = run_level(users, args.duration, docs, args.provider, model, content_type)
+        levels.append(level)
+        print(f"{users:>6}{level['docs_per_s']:>10.2f}{level['p50_s']:>10.2f}{level['p95_s']:>10.2f}"
+              f"{level['error_rate']:>9.1%}", flush=True)
+
+    knee = saturation_point(levels)
+    if knee is None:
+        print("No saturation within the tested levels — try higher --users.")
+    else:
+        print(f"Throughput stops scaling beyond ~{knee} concurrent users.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
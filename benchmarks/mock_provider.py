@@ -0,0 +1,94 @@
+"""
+In-process mock provider for benchmarks — echoes the text it was asked to
+rewrite after a configurable latency, optionally streaming and failing.
+
+    mock = MockProvider(latency=0.05, jitter=0.02, error_rate=0.02).install()
+    humanize(..., provider=mock.name, api_key="x", model_id="mock-model", ...)
+"""
+
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+from authentica.providers import note_finish, register_provider
+from authentica.telemetry import note_usage
+
+
+class MockHTTPError(Exception):
+    """Shaped like a provider HTTP error, so call_api()'s retry policy applies."""
+
+    def __init__(self, status_code: int, retry_after: float = None):
+        super().__init__(f"mock provider returned HTTP {status_code}")
+        self.status_code = status_code
+        headers = {"Retry-After": str(retry_after)} if retry_after is not None else {}
+        self.response = SimpleNamespace(status_code=status_code, headers=headers)
+
+
+class MockProvider:
+    """Callable backend with the call_openrouter() signature.
+
+    Each call sleeps for a normally distributed latency (mean `latency`,
+    std-dev `jitter`, floored at 0), then fails with `error_status` at
+    `error_rate` or echoes the user text. Streaming calls emit one word per
+    token, `token_delay` apart. Replies are cut at `max_tokens` words with
+    finish reason "length", and usage is reported as word counts. Every call
+    is recorded in `calls` as (system_prompt, seconds, ok).
+    """
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.02, error_rate: float = 0.0,
+                 error_status: int = 503, retry_after: float = 0.01, token_delay: float = 0.0,
+                 seed: int = None, name: str = "mock"):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.token_delay = token_delay
+        self.name = name
+        self.calls = []
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def install(self) -> "MockProvider":
+        register_provider(self.name, self)
+        return self
+
+    @staticmethod
+    def respond(user: str) -> str:
+        """The text to 'rewrite': the user message minus an instruction line ending in ':'."""
+        head, sep, rest = user.partition("\n\n")
+        return rest if sep and head.endswith(":") else user
+
+    def __call__(self, api_key, model, system, user, temperature, max_tokens=3500, on_token=None):
+        start = time.perf_counter()
+        with self._lock:
+            delay = max(0.0, self._rng.gauss(self.latency, self.jitter))
+            fail = self._rng.random() < self.error_rate
+        time.sleep(delay)
+        if fail:
+            self._record(system, start, ok=False)
+            raise MockHTTPError(self.error_status, self.retry_after)
+        text = self.respond(user)
+        words = text.split(" ")
+        if len(words) > max_tokens:   # one word per token, like the stream
+            text = " ".join(words[:max_tokens])
+            note_finish("length")
+        else:
+            note_finish("stop")
+        if on_token is not None:
+            for word in text.split(" "):
+                if self.token_delay:
+                    time.sleep(self.token_delay)
+                on_token(word + " ")
+        note_usage(len(system.split()) + len(user.split()), len(text.split()))
+        self._record(system, start, ok=True)
+        return text
+
+    def _record(self, system, start, ok):
+        with self._lock:
+            self.calls.append((system, time.perf_counter() - start, ok))
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = []
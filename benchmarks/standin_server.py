@@ -0,0 +1,212 @@
+"""
+Local stand-in for the provider chat-completions APIs, for load tests that
+must not burn free-tier quota.
+
+    python -m benchmarks.standin_server [--port 8787] [--latency 0.3] [--tokens-per-sec 200]
+        [--rps 50] [--max-concurrency 64] [--rate-429 0.02] [--output-words 0]
+
+Serves the OpenRouter shape at /api/v1/chat/completions and the Groq shape at
+/openai/v1/chat/completions, both with SSE streaming ("stream": true). Point
+the app at it with
+
+    OPENROUTER_BASE_URL=http://127.0.0.1:8787/api/v1
+    GROQ_BASE_URL=http://127.0.0.1:8787
+
+The reply echoes the text the request asked to rewrite (or is padded/cut to
+--output-words), is cut at max_tokens words with finish_reason "length", and
+carries a usage block. Requests over --rps or --max-concurrency, plus a
+--rate-429 fraction of the rest, get a 429 with Retry-After.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROUTES = {"/api/v1/chat/completions", "/openai/v1/chat/completions"}
+
+
+class StandinState:
+    """Server-wide knobs, admission control and counters."""
+
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.recent = deque()       # admission timestamps within the last second
+        self.counts = {"ok": 0, "429": 0}
+
+    def admit(self):
+        """Return a Retry-After value (seconds) if the request must be rejected, else None."""
+        with self.lock:
+            now = time.monotonic()
+            while self.recent and now - self.recent[0] > 1.0:
+                self.recent.popleft()
+            a = self.args
+            if (a.rps and len(self.recent) >= a.rps) or \
+               (a.max_concurrency and self.in_flight >= a.max_concurrency) or \
+               self.rng.random() < a.rate_429:
+                self.counts["429"] += 1
+                return 1
+            self.recent.append(now)
+            self.in_flight += 1
+            return None
+
+    def release(self):
+        with self.lock:
+            self.in_flight -= 1
+            self.counts["ok"] += 1
+
+    def latency(self) -> float:
+        with self.lock:
+            return max(0.0, self.rng.gauss(self.args.latency, self.args.jitter))
+
+
+def message_text(message: dict) -> str:
+    """A message's text, whether `content` is a string or a list of parts."""
+    content = message.get("content") or ""
+    if isinstance(content, list):
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content
+
+
+def reply_words(messages: list, output_words: int) -> list:
+    user = next((message_text(m) for m in reversed(messages) if m.get("role") == "user"), "")
+    head, sep, rest = user.partition("\n\n")
+    words = (rest if sep and head.endswith(":") else user).split(" ")
+    if output_words:
+        words = (words * (output_words // max(1, len(words)) + 1))[:output_words]
+    return words
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, like the real endpoints
+    state: StandinState = None
+
+    def log_message(self, fmt, *args):
+        if self.state.args.verbose:
+            super().log_message(fmt, *args)
+
+    def _json(self, status: int, payload: dict, headers: dict = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _chunk(self, data: str):
+        raw = data.encode()
+        self.wfile.write(f"{len(raw):x}\r\n".encode() + raw + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        if self.path not in ROUTES:
+            self._json(404, {"error": {"message": f"no route {self.path}"}})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            req = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._json(400, {"error": {"message": "invalid JSON"}})
+            return
+        retry = self.state.admit()
+        if retry is not None:
+            self._json(429, {"error": {"message": "Rate limit exceeded (stand-in)", "code": 429}},
+                       {"Retry-After": str(retry)})
+            return
+        try:
+            self._complete(req)
+        finally:
+            self.state.release()
+
+    def _complete(self, req: dict):
+        args = self.state.args
+        words = reply_words(req.get("messages", []), args.output_words)
+        max_tokens = int(req.get("max_tokens") or 0)
+        finish = "stop"
+        if max_tokens and len(words) > max_tokens:
+            words, finish = words[:max_tokens], "length"
+        prompt_tokens = sum(len(message_text(m).split()) for m in req.get("messages", []))
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": len(words),
+                 "total_tokens": prompt_tokens + len(words)}
+        base = {"id": f"chatcmpl-{uuid.uuid4().hex[:12]}", "created": int(time.time()),
+                "model": req.get("model", "standin")}
+        per_token = 1.0 / args.tokens_per_sec if args.tokens_per_sec else 0.0
+        time.sleep(self.state.latency())   # time to first token
+
+        if not req.get("stream"):
+            time.sleep(per_token * len(words))
+            self._json(200, dict(base, object="chat.completion", usage=usage, choices=[{
+                "index": 0, "finish_reason": finish,
+                "message": {"role": "assistant", "content": " ".join(words)},
+            }]))
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self._chunk(": OPENROUTER PROCESSING\n\n")
+        for i, word in enumerate(words):
+            if per_token:
+                time.sleep(per_token)
+            delta = {"role": "assistant", "content": word if i == 0 else " " + word}
+            self._chunk("data: " + json.dumps(dict(base, object="chat.completion.chunk", choices=[
+                {"index": 0, "delta": delta, "finish_reason": None}])) + "\n\n")
+        self._chunk("data: " + json.dumps(dict(base, object="chat.completion.chunk", usage=usage, choices=[
+            {"index": 0, "delta": {}, "finish_reason": finish}])) + "\n\n")
+        self._chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8787)
+    p.add_argument("--latency", type=float, default=0.3, help="mean time to first token, seconds")
+    p.add_argument("--jitter", type=float, default=0.1, help="time-to-first-token std-dev, seconds")
+    p.add_argument("--tokens-per-sec", type=float, default=200, help="per-stream output rate (0 = instant)")
+    p.add_argument("--rps", type=int, default=0, help="admitted requests per second (0 = unlimited)")
+    p.add_argument("--max-concurrency", type=int, default=0, help="in-flight request cap (0 = unlimited)")
+    p.add_argument("--rate-429", type=float, default=0.0, help="fraction of admitted requests answered 429")
+    p.add_argument("--output-words", type=int, default=0, help="fixed reply length in words (0 = echo input)")
+    p.add_argument("--seed", type=int, default=None)
+    p.add_argument("--verbose", action="store_true", help="log every request")
+    return p.parse_args(argv)
+
+
+def make_server(args) -> ThreadingHTTPServer:
+    handler = type("StandinHandler", (Handler,), {"state": StandinState(args)})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    server = make_server(args)
+    host, port = server.server_address[:2]
+    print(f"Stand-in provider on http://{host}:{port}  (OPENROUTER_BASE_URL=http://{host}:{port}/api/v1)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        counts = server.RequestHandlerClass.state.counts
+        print(f"served {counts['ok']} completions, rejected {counts['429']} with 429")
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,180 @@
+"""
+Pipeline benchmark suite — local text processing plus full humanize() runs
+against the in-process mock provider, with stored baselines.
+
+    python -m benchmarks.suite [--docs 20] [--latency 0.05] [--jitter 0.02] [--error-rate 0.02]
+    python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+    python -m benchmarks.suite --compare benchmarks/baseline.json [--tolerance 0.15]
+
+Micro benchmarks report µs per call. End-to-end runs report per-pass and
+per-document latency percentiles, provider requests per document and CPU
+time per document for one formal and one general content type. With
+--compare, any metric more than --tolerance worse than the baseline is
+flagged and the exit status is 1.
+"""
+
+import argparse
+import json
+import random
+import time
+from itertools import product
+
+from authentica.catalog import CONTENT_TYPES, TONE_PROMPTS
+from authentica.pipeline import build_passes, humanize
+from authentica.text import clean_text, detector_instructions, remove_cliches
+
+from .mock_provider import MockProvider
+
+SENTENCES = [
+    "In today's fast-paced world, it is important to note that teams must leverage robust tools.",
+    "Furthermore, the landscape of remote work continues to evolve in order to meet new demands.",
+    "This comprehensive approach fosters collaboration and drives innovative outcomes.",
+    "Moreover, organizations that delve into data gain a pivotal advantage.",
+    "Needless to say, the results were groundbreaking.",
+    "Additionally, a seamless onboarding process can be a game-changer for new hires.",
+    "At the end of the day, success depends on people, not platforms.",
+]
+
+ALL_FLAGS = list(product((False, True), repeat=5))
+
+
+def make_corpus(n: int, words: int = 300, seed: int = 7) -> list:
+    """Synthetic AI-flavoured documents of roughly `words` words each."""
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(n):
+        paras, count = [], 0
+        while count < words:
+            para = " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(3, 6)))
+            paras.append(para)
+            count += len(para.split())
+        docs.append("\n\n".join(paras))
+    return docs
+
+
+def percentile(values: list, q: float) -> float:
+    """Nearest-rank percentile, q in [0, 100]."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered))) - 1))]
+
+
+def time_per_call(fn, n: int) -> float:
+    """Mean µs per call over n calls."""
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def run_micro(doc: str) -> dict:
+    raw = "Here is the rewritten text:\n\n<think>plan the edit</think>" + doc.replace(". ", " .. ")
+    assembly = list(product(CONTENT_TYPES, TONE_PROMPTS))
+    return {
+        "remove_cliches_us":        time_per_call(lambda: remove_cliches(doc), 500),
+        "clean_text_us":            time_per_call(lambda: clean_text(raw), 500),
+        "detector_instructions_us": time_per_call(lambda: [detector_instructions(*f) for f in ALL_FLAGS], 200) / 32,
+        "prompt_assembly_us":       time_per_call(
+            lambda: [build_passes(ct, tone, *ALL_FLAGS[-1]) for ct, tone in assembly], 50) / len(assembly),
+    }
+
+
+def run_pipeline(mock: MockProvider, content_type: str, docs: list) -> dict:
+    flags = ALL_FLAGS[-1]
+    labels = {p["system"]: p["label"].rstrip("…") for p in build_passes(content_type, "Conversational", *flags)}
+    e2e, cpu, requests = [], [], []
+    mock.reset()
+    for doc in docs:
+        before = len(mock.calls)
+        t0, c0 = time.perf_counter(), time.process_time()
+        result = humanize(doc, content_type, "Conversational", mock.name, "mock-key", "mock-model",
+                          True, *flags)
+        e2e.append(time.perf_counter() - t0)
+        cpu.append(time.process_time() - c0)
+        requests.append(len(mock.calls) - before)
+        if result.startswith("Error:"):
+            raise RuntimeError(result)
+    per_pass = {}
+    for system, seconds, ok in mock.calls:
+        if ok:
+            per_pass.setdefault(labels.get(system, "other"), []).append(seconds)
+    return {
+        "e2e_p50_s":        percentile(e2e, 50),
+        "e2e_p90_s":        percentile(e2e, 90),
+        "e2e_p99_s":        percentile(e2e, 99),
+        "requests_per_doc": sum(requests) / len(requests),
+        "cpu_ms_per_doc":   sum(cpu) / len(cpu) * 1000,
+        "passes": {
+            label: {"p50_s": percentile(v, 50), "p90_s": percentile(v, 90), "p99_s": percentile(v, 99)}
+            for label, v in per_pass.items()
+        },
+    }
+
+
+def flatten(metrics: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in metrics.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, path + "."))
+        else:
+            flat[path] = value
+    return flat
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Metrics (all lower-is-better) that got worse than baseline × (1 + tolerance)."""
+    cur, base = flatten(current), flatten(baseline)
+    return [
+        (key, base[key], cur[key]) for key in sorted(cur)
+        if key in base and base[key] > 0 and cur[key] > base[key] * (1 + tolerance)
+    ]
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    p.add_argument("--docs", type=int, default=20, help="documents per pipeline")
+    p.add_argument("--latency", type=float, default=0.05, help="mock mean latency per call, seconds")
+    p.add_argument("--jitter", type=float, default=0.02, help="mock latency std-dev, seconds")
+    p.add_argument("--error-rate", type=float, default=0.0, help="fraction of mock calls that fail with 503")
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--save-baseline", metavar="PATH", help="write results as the new baseline")
+    p.add_argument("--compare", metavar="PATH", help="compare against a saved baseline")
+    p.add_argument("--tolerance", type=float, default=0.15, help="allowed slowdown before flagging")
+    args = p.parse_args(argv)
+
+    mock = MockProvider(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                        seed=args.seed).install()
+    docs = make_corpus(args.docs)
+    formal = next(k for k, v in CONTENT_TYPES.items() if v["pipeline"] == "formal")
+    general = next(k for k, v in CONTENT_TYPES.items() if v["pipeline"] == "general")
+
+    results = {"micro": run_micro(docs[0]), "formal": run_pipeline(mock, formal, docs),
+               "general": run_pipeline(mock, general, docs)}
+
+    for key, value in flatten(results).items():
+        print(f"{key:<48}{value:>14.4f}")
+
+    status = 0
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        for key in ("docs", "latency", "jitter", "error_rate", "seed"):
+            if baseline["settings"].get(key) != getattr(args, key):
+                print(f"note: baseline was recorded with {key}={baseline['settings'].get(key)}")
+        regressions = compare(results, baseline["results"], args.tolerance)
+        for key, old, new in regressions:
+            print(f"REGRESSION {key}: {old:.4f} -> {new:.4f} (+{(new / old - 1) * 100:.0f}%)")
+        if not regressions:
+            print(f"No regressions beyond {args.tolerance:.0%} of {args.compare}")
+        status = 1 if regressions else 0
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+        print(f"Baseline written to {args.save_baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
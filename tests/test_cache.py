@@ -0,0 +1,132 @@
+"""
+Result cache — LRU and TTL eviction, the byte and entry ceilings, and the
+trigger-maintained totals row, against a throwaway SQLite file.
+
+    python -m pytest tests
+"""
+
+import sqlite3
+
+import pytest
+
+from authentica import cache as cache_module
+from authentica.cache import ResultCache, make_cache_key
+
+
+class FakeClock:
+    """Stands in for the time module inside cache: every reading moves on a second."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        self.now += 1.0
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "results.sqlite3")
+
+
+def actual_totals(cache):
+    """What the totals row should say, counted the slow way."""
+    return cache._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+
+
+def test_get_set_and_stats(path, clock):
+    cache = ResultCache(path, ttl=0)
+    assert cache.get("a") is None
+    cache.set("a", "héllo")
+    assert cache.get("a") == "héllo"
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"]) == (1, 6)       # bytes are UTF-8 bytes, not characters
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_entry_ceiling_evicts_least_recently_used(path, clock):
+    cache = ResultCache(path, max_entries=2, ttl=0)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")                                            # b is now the least recently used
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1" and cache.get("c") == "3"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_ceiling_evicts_until_under(path, clock):
+    cache = ResultCache(path, max_bytes=10, ttl=0)
+    for key in "abc":
+        cache.set(key, "x" * 4)
+    assert cache.get("a") is None and cache.get("b") == "xxxx" and cache.get("c") == "xxxx"
+    cache.set("big", "y" * 11)                                # larger than the whole cache: not stored
+    assert cache.get("big") is None
+    assert cache.stats()["bytes"] == 8
+
+
+def test_ttl_expires_on_read_and_on_write(path, clock):
+    cache = ResultCache(path, ttl=100)
+    cache.set("old", "1")
+    cache.set("older", "2")
+    clock.now += 200
+    assert cache.get("old") is None                           # expired on read
+    cache.set("new", "3")                                     # sweeps the rest on write
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["evictions"] == 2
+
+
+def test_upsert_replaces_value_and_keeps_totals(path, clock):
+    cache = ResultCache(path, ttl=0)
+    cache.set("a", "short")
+    cache.set("a", "a much longer value")
+    assert cache.get("a") == "a much longer value"
+    assert cache._totals() == actual_totals(cache) == (1, 19)
+
+
+def test_totals_track_every_change(path, clock):
+    cache = ResultCache(path, max_entries=5, max_bytes=40, ttl=50)
+    for i in range(30):
+        cache.set(f"k{i % 9}", "v" * (i % 7 + 1))
+        if i % 4 == 0:
+            cache.get(f"k{i % 5}")
+        if i == 20:
+            clock.now += 100
+        assert cache._totals() == actual_totals(cache)
+
+
+def test_totals_are_shared_between_handles(path, clock):
+    first, second = ResultCache(path, ttl=0), ResultCache(path, ttl=0)
+    first.set("a", "1234")
+    second.set("b", "56")
+    assert first.stats()["entries"] == second.stats()["entries"] == 2
+    assert first.stats()["bytes"] == 6
+
+
+def test_existing_file_is_backfilled(path, clock):
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE results (key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,"
+               " created REAL NOT NULL, accessed REAL NOT NULL)")
+    db.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?)",
+                   [(f"k{i}", "v" * i, i, clock.now, clock.now) for i in range(1, 5)])
+    db.commit()
+    db.close()
+    cache = ResultCache(path, ttl=0)
+    assert cache._totals() == (4, 10)
+    cache.set("k1", "vvvvv")
+    assert cache._totals() == actual_totals(cache) == (4, 14)
+    indexes = {row[0] for row in cache._db.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"results_accessed", "results_created"} <= indexes
+
+
+def test_cache_key_separates_arguments():
+    assert make_cache_key("a", "b") == make_cache_key("a", "b")
+    assert make_cache_key("a", True) != make_cache_key("a", False)
+    assert make_cache_key("text", "tone", True, False) != make_cache_key("text", "tone", False, True)
@@ -0,0 +1,248 @@
+"""
+Concurrency regressions — single-flight coalescing, wavefront scheduling,
+the job queue and cancellation, driven by the in-process mock provider.
+
+    python -m pytest tests
+"""
+
+import threading
+import time
+
+import pytest
+
+from authentica.cache import ResultCache
+from authentica.cancel import Cancelled, CancelToken
+from authentica.catalog import CONTENT_TYPES
+from authentica.jobs import JobQueue
+from authentica.pipeline import humanize
+from authentica.scheduler import WavefrontScheduler
+from authentica.singleflight import SingleFlight
+from benchmarks.mock_provider import MockProvider
+
+GENERAL = next(k for k, v in CONTENT_TYPES.items() if v["pipeline"] == "general")
+TEXT = ("The committee reviewed the proposal in detail. Several members raised concerns about cost. "
+        "A revised budget was requested before the next meeting. ") * 4
+
+
+@pytest.fixture
+def mock():
+    return MockProvider(latency=0.1, jitter=0.0, name="mock", seed=1).install()
+
+
+def run(text=TEXT, **kwargs):
+    return humanize(text, GENERAL, "Conversational", "mock", "key", "mock-model",
+                    False, True, True, True, True, True, **kwargs)
+
+
+def in_threads(fn, n):
+    results = [None] * n
+
+    def target(i):
+        results[i] = fn(i)
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+    return results
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  SINGLE-FLIGHT
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_identical_requests_share_one_run(mock):
+    flights = SingleFlight()
+    outputs = in_threads(lambda i: flights.do("request", run), 8)
+    assert len(set(outputs)) == 1 and not outputs[0].startswith("Error:")
+    assert len(mock.calls) == 4                    # one 4-pass run, not 32 calls
+    assert flights.stats() == {"in_flight": 0, "leaders": 1, "shared": 7}
+
+
+def test_identical_cached_passes_share_one_call(mock):
+    cache = ResultCache(":memory:")
+    outputs = in_threads(lambda i: run(TEXT + " Pass-level.", cache=cache), 8)
+    assert len(set(outputs)) == 1
+    assert len(mock.calls) == 4
+
+
+def test_cancelled_leader_hands_over_to_follower(mock):
+    flights, leader_token = SingleFlight(), CancelToken()
+    results = {}
+
+    def call(name, token):
+        results[name] = flights.do("request", lambda: run(cancel=token), token)
+
+    leader = threading.Thread(target=call, args=("leader", leader_token))
+    leader.start()
+    time.sleep(0.05)
+    follower = threading.Thread(target=call, args=("follower", CancelToken()))
+    follower.start()
+    time.sleep(0.1)
+    leader_token.cancel()
+    leader.join(10)
+    follower.join(10)
+    assert results["leader"] == "Error: Cancelled"
+    assert not results["follower"].startswith("Error:")   # reran it rather than sharing the cancellation
+
+
+def test_follower_cancel_stops_only_its_wait():
+    flights, release, token = SingleFlight(), threading.Event(), CancelToken()
+    leader = threading.Thread(target=flights.do, args=("k", lambda: release.wait(5) and "done"))
+    leader.start()
+    wait_for(lambda: flights.in_flight() == 1)
+    token.cancel()
+    with pytest.raises(Cancelled):
+        flights.do("k", lambda: "not run", token)
+    release.set()
+    leader.join(5)
+    assert flights.stats()["leaders"] == 1
+
+
+def test_leader_exception_reaches_followers():
+    flights, calls = SingleFlight(), []
+
+    def fail():
+        calls.append(1)
+        time.sleep(0.2)
+        raise ValueError("boom")
+
+    def call(_):
+        try:
+            return flights.do("k", fail)
+        except ValueError as e:
+            return str(e)
+
+    assert in_threads(call, 3) == ["boom"] * 3
+    assert len(calls) == 1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  WAVEFRONT SCHEDULER
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_scheduler_abandons_failed_job_without_fail_fast():
+    def boom(_value):
+        raise RuntimeError("stage failed")
+
+    jobs = [{"value": 1, "stages": [lambda v: v + 1, lambda v: v * 10]},
+            {"value": 5, "stages": [boom, lambda v: v * 10]},
+            {"value": 2, "stages": [lambda v: v + 1]}]
+    finished = []
+    results = WavefrontScheduler(4).run(jobs, on_result=lambda j, value, s: finished.append(j), fail_fast=False)
+    assert results[0] == 20 and results[2] == 3
+    assert isinstance(results[1], RuntimeError)
+    assert sorted(finished) == [0, 1, 2]
+
+
+def test_scheduler_fail_fast_raises_first_error():
+    def boom(_value):
+        raise RuntimeError("stage failed")
+
+    jobs = [{"value": 1, "stages": [boom]}, {"value": 2, "stages": [lambda v: v]}]
+    with pytest.raises(RuntimeError, match="stage failed"):
+        WavefrontScheduler(2).run(jobs)
+
+
+def test_scheduler_respects_provider_cap():
+    lock, state = threading.Lock(), {"now": 0, "peak": 0}
+
+    def stage(value):
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.02)
+        with lock:
+            state["now"] -= 1
+        return value
+
+    jobs = [{"value": i, "stages": [stage, stage], "provider": "capped"} for i in range(12)]
+    results = WavefrontScheduler(8, provider_limits={"capped": 3}).run(jobs)
+    assert results == list(range(12))
+    assert state["peak"] <= 3
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  JOB QUEUE AND CANCELLATION
+# ─────────────────────────────────────────────────────────────────────────────
+
+def text_job(size, delay=0.0):
+    def job(progress_callback=None, stream_callback=None, cancel=None):
+        if delay:
+            cancel.sleep(delay)
+        return "x" * size
+    return job
+
+
+def test_newer_job_supersedes_pending_one():
+    queue = JobQueue(workers=2)
+    first = queue.submit(text_job(10, delay=5), owner="session")
+    wait_for(lambda: queue.get(first).status == "running")
+    second = queue.submit(text_job(10), owner="session")
+    wait_for(lambda: queue.get(second) is not None and not queue.get(second).pending)
+    assert queue.get(second).status == "done"
+    # Superseded, cancelled, then dropped once finished: nothing will ask for it again
+    wait_for(lambda: queue.get(first) is None)
+    assert queue.stats()["bytes"] == 10
+
+
+def test_finished_job_is_dropped_when_superseded():
+    queue = JobQueue(workers=1)
+    first = queue.submit(text_job(10), owner="session")
+    wait_for(lambda: not queue.get(first).pending)
+    queue.submit(text_job(10), owner="session")
+    assert queue.get(first) is None
+
+
+def test_cancel_marks_job_cancelled(mock):
+    queue = JobQueue(workers=1)
+    job_id = queue.submit(lambda **kw: run(**kw))
+    wait_for(lambda: len(mock.calls) >= 1)
+    assert queue.cancel(job_id)
+    wait_for(lambda: not queue.get(job_id).pending)
+    snap = queue.get(job_id).snapshot()
+    assert snap["status"] == "cancelled" and snap["error"] == "Error: Cancelled"
+    time.sleep(0.3)
+    assert len(mock.calls) < 4                      # the remaining passes never went out
+    assert not queue.cancel(job_id)                 # already finished
+
+
+def test_job_cancelled_while_queued_never_runs():
+    queue, ran = JobQueue(workers=1), []
+    blocker = queue.submit(text_job(1, delay=0.2))
+    queued = queue.submit(lambda **kw: ran.append(1))
+    assert queue.cancel(queued)
+    wait_for(lambda: not queue.get(blocker).pending and not queue.get(queued).pending)
+    assert queue.get(queued).status == "cancelled" and not ran
+
+
+def test_owner_keeps_one_finished_job():
+    queue = JobQueue(workers=1)
+    ids = []
+    for size in (100, 200, 300):
+        ids.append(queue.submit(text_job(size), owner="session"))
+        wait_for(lambda: not queue.get(ids[-1]).pending)
+    assert [queue.get(i) is not None for i in ids] == [False, False, True]
+    stats = queue.stats()
+    assert stats["bytes"] == 300 and stats["owners"] == 1
+
+
+def test_global_ceiling_evicts_least_recently_read():
+    queue = JobQueue(workers=1, max_bytes=250)
+    a = queue.submit(text_job(100))
+    wait_for(lambda: not queue.get(a).pending)
+    b = queue.submit(text_job(100))
+    wait_for(lambda: not queue.get(b).pending)
+    queue.get(a)                                      # a is now the most recently read
+    c = queue.submit(text_job(100))
+    wait_for(lambda: queue.get(c) is not None and not queue.get(c).pending)
+    assert queue.get(b) is None and queue.get(a) is not None
+    stats = queue.stats()
+    assert stats["bytes"] == 200 and stats["evictions"] == 1
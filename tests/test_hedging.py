@@ -0,0 +1,161 @@
+"""
+Hedged requests and failover — when a hedge fires, failover order, losing
+routes being cancelled and only the winner's stream reaching the caller,
+driven by the in-process mock provider.
+
+    python -m pytest tests
+"""
+
+import threading
+import time
+
+import pytest
+
+from authentica import hedging, providers
+from authentica.cancel import Cancelled, CancelToken
+from authentica.hedging import LatencyTracker, alternate_routes, call_hedged
+from authentica.providers import register_provider
+from authentica.ratelimit import RateLimiter
+from benchmarks.mock_provider import MockProvider
+
+PROVIDER = "mock-hedge"
+MODELS = ("primary", "alternate-1", "alternate-2")
+
+
+class Route(MockProvider):
+    """A mock model that answers with its own name, so the winner is visible."""
+
+    def __init__(self, model, **kwargs):
+        super().__init__(jitter=0.0, name=model, **kwargs)
+        self.dispatched = 0   # calls that reached the backend, finished or not
+
+    def respond(self, user):
+        return f"{self.name} rewrote it in ten plain words right here"
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            self.dispatched += 1
+        return super().__call__(*args, **kwargs)
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    fresh = RateLimiter({})
+    monkeypatch.setattr(providers, "RATE_LIMITER", fresh)
+    return fresh
+
+
+@pytest.fixture
+def routes(monkeypatch, limiter):
+    """Install one mock provider whose models are separate Route mocks; the
+    hedge fires 0.2 s after a route is sent."""
+    monkeypatch.setattr(hedging, "LATENCY", LatencyTracker())
+    monkeypatch.setattr(hedging, "HEDGE_DEFAULT_DELAY", 0.2)
+    monkeypatch.setitem(hedging.PROVIDER_MODELS, PROVIDER, {m: m for m in MODELS})
+    table = {}
+
+    def install(**settings):
+        for model in MODELS:
+            table[model] = Route(model, **settings.get(model, {}))
+        return table
+
+    def backend(api_key, model, *args, **kwargs):
+        return table[model](api_key, model, *args, **kwargs)
+
+    register_provider(PROVIDER, backend)
+    return install
+
+
+def hedged(**kwargs):
+    return call_hedged(PROVIDER, "key", "primary", "system", "text", 0.7, **kwargs)
+
+
+def settle(seconds=0.6):
+    """Give abandoned routes time to finish (or abort) before checking on them."""
+    time.sleep(seconds)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  ROUTES
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_alternates_prefer_other_providers():
+    keys = {"gemini": "ak", "groq": "gk", "openrouter": ""}
+    routes = alternate_routes("groq", "gk", "llama-3.3-70b-versatile", keys)
+    assert routes[0] == ("gemini", "ak", "gemini-2.0-flash")
+    assert routes[1][:2] == ("groq", "gk") and routes[1][2] != "llama-3.3-70b-versatile"
+    assert len(routes) == hedging.MAX_ALTERNATES
+
+
+def test_fast_primary_is_not_hedged(routes):
+    table = routes(primary={"latency": 0.05})
+    assert hedged().startswith("primary")
+    settle(0.3)
+    assert table["alternate-1"].dispatched == 0
+
+
+def test_slow_primary_is_hedged_and_loses(routes):
+    table = routes(primary={"latency": 0.6, "token_delay": 0.05}, **{"alternate-1": {"latency": 0.05}})
+    start = time.monotonic()
+    assert hedged().startswith("alternate-1")
+    assert time.monotonic() - start < 0.5
+    settle(1.0)
+    assert table["primary"].dispatched == 1
+    assert table["primary"].calls == []              # aborted at its first token, never finished
+    assert table["alternate-2"].dispatched == 0      # one hedge at a time
+
+
+def test_hedge_clock_starts_when_the_request_is_sent(routes, limiter):
+    table = routes(primary={"latency": 0.05})
+    limiter.set_limit(PROVIDER, 6000)
+    limiter.pause(PROVIDER, "key", 0.4)              # queued longer than the hedge delay
+    assert hedged().startswith("primary")
+    settle(0.3)
+    assert table["alternate-1"].dispatched == 0
+    assert max(hedging.LATENCY._samples[(PROVIDER, "primary")]) < 0.3   # the pacing wait isn't latency
+
+
+def test_failover_walks_the_alternates_in_order(routes):
+    table = routes(primary={"latency": 0.0, "error_rate": 1.0, "error_status": 400},
+                   **{"alternate-1": {"latency": 0.0, "error_rate": 1.0, "error_status": 400},
+                      "alternate-2": {"latency": 0.0}})
+    assert hedged().startswith("alternate-2")
+    assert [table[m].dispatched for m in MODELS] == [1, 1, 1]
+
+
+def test_last_error_is_raised_when_every_route_fails(routes):
+    failing = {"latency": 0.0, "error_rate": 1.0, "error_status": 400}
+    routes(**{m: failing for m in MODELS})
+    with pytest.raises(Exception, match="HTTP 400"):
+        hedged()
+
+
+def test_only_the_winner_is_streamed(routes):
+    table = routes(primary={"latency": 0.6, "token_delay": 0.05},
+                   **{"alternate-1": {"latency": 0.05, "token_delay": 0.01}})
+    received, threads = [], set()
+
+    def on_token(delta):
+        threads.add(threading.current_thread())
+        received.append(delta)
+
+    meta = {}
+    out = hedged(on_token=on_token, meta=meta)
+    assert out.startswith("alternate-1")
+    assert "".join(received).strip() == out
+    assert threads == {threading.current_thread()}   # relayed on the calling thread
+    assert meta["finish_reason"] == "stop" and "sent_at" in meta
+    settle(1.0)
+    assert table["primary"].calls == []
+
+
+def test_cancel_aborts_every_route(routes):
+    slow = {"latency": 0.3, "token_delay": 0.05}
+    table = routes(primary=slow, **{"alternate-1": slow})
+    token = CancelToken()
+    threading.Timer(0.35, token.cancel).start()
+    with pytest.raises(Cancelled):
+        hedged(cancel=token)
+    settle(1.0)
+    assert [table[m].dispatched for m in MODELS[:2]] == [1, 1]
+    assert table["primary"].calls == [] and table["alternate-1"].calls == []
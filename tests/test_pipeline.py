@@ -0,0 +1,227 @@
+"""
+Pipeline behavior — continuation of cut-off completions (driven by the mock
+provider's max_tokens truncation, one word per token), chunking of long
+documents and best-of-N variants.
+
+    python -m pytest tests
+"""
+
+import pytest
+
+from authentica import pipeline
+from authentica.catalog import CONTENT_TYPES
+from authentica.jobs import Job
+from authentica.pipeline import (
+    MAX_VARIANTS, TEMPERATURE_RANGE, build_passes, generate, humanize_chunked, humanize_variants,
+    shift_temperature, split_into_chunks, trim_to_sentence, variant_offsets,
+)
+from authentica.tokens import CHARS_PER_TOKEN
+from benchmarks.mock_provider import MockHTTPError, MockProvider
+
+GENERAL = next(k for k, v in CONTENT_TYPES.items() if v["pipeline"] == "general")
+N_PASSES = len(build_passes(GENERAL, "Conversational", True, True, True, True, True))
+
+PARAGRAPHS = (
+    "The first paragraph opens here. It has a second sentence that runs on a little. And a third.",
+    "A new paragraph starts now. It also says a few more things before it ends.",
+    "The last paragraph is short. Done.",
+)
+DOCUMENT = "\n\n".join(PARAGRAPHS)
+
+
+class ContinuingMock(MockProvider):
+    """The mock provider, but a continuation prompt is answered with the text
+    that follows the quoted tail — what a model asked to carry on would write."""
+
+    def __init__(self, **kwargs):
+        super().__init__(latency=0.0, jitter=0.0, **kwargs)
+        self.prompts = []
+
+    def respond(self, user):
+        self.prompts.append(user)
+        original, sep, request = user.partition("\n\n---\n")
+        text = MockProvider.respond(original)
+        if not sep:
+            return text
+        tail = request.split("…", 1)[1].split("\n\nContinue from exactly", 1)[0]
+        return text[text.index(tail) + len(tail):].lstrip(" ")
+
+
+@pytest.fixture
+def mock():
+    return ContinuingMock(name="mock-continue").install()
+
+
+def complete(text, max_tokens, on_token=None):
+    return generate("mock-continue", "key", "mock-model", "system", f"Rewrite:\n\n{text}", 0.7,
+                    max_tokens, on_token)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  CONTINUATIONS
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_trim_to_sentence():
+    assert trim_to_sentence("One. Two. Three. Four is cut") == "One. Two. Three."
+    assert trim_to_sentence('He said "stop." Then he') == 'He said "stop."'
+    assert trim_to_sentence("Short. A much longer unfinished sentence with no end") == \
+        "Short. A much longer unfinished sentence with no end"   # no sentence end in the second half
+
+
+def test_uncut_completion_is_returned_as_is(mock):
+    assert complete(DOCUMENT, 500) == DOCUMENT
+    assert len(mock.calls) == 1
+
+
+@pytest.mark.parametrize("max_tokens", [16, 18])   # cut mid-paragraph / right after a paragraph
+def test_cut_completion_is_continued(mock, max_tokens):
+    out = complete(DOCUMENT, max_tokens)
+    assert out == DOCUMENT                          # sentences joined by a space, paragraphs by a blank line
+    assert len(mock.calls) == 3
+
+
+def test_continuations_stop_at_the_limit(mock, monkeypatch):
+    monkeypatch.setattr(pipeline, "MAX_CONTINUATIONS", 1)
+    out = complete(DOCUMENT, 12)
+    assert len(mock.calls) == 2
+    assert DOCUMENT.startswith(out) and len(out) < len(DOCUMENT)
+
+
+def test_first_piece_is_cleaned_before_it_is_quoted(mock):
+    out = complete("<think>Plan the rewrite first.</think>\n\n" + DOCUMENT, 18)
+    assert out == DOCUMENT
+    assert all("<think>" not in prompt.split("---", 1)[1] for prompt in mock.prompts[1:])
+
+
+def test_stream_preview_drops_the_trimmed_tail(mock):
+    job = Job("preview")
+    out = complete(DOCUMENT, 16, on_token=job.append)
+    preview = job.snapshot()["stream"]
+    assert preview.split() == out.split()          # each trimmed sentence appears once
+    assert preview.count("It also says") == 1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  CHUNKING
+# ─────────────────────────────────────────────────────────────────────────────
+
+def numbered_paragraphs(n):
+    return [f"Paragraph {i} makes its point. Then it adds a second, somewhat longer sentence." for i in range(n)]
+
+
+@pytest.fixture
+def echo():
+    return MockProvider(latency=0.02, jitter=0.02, name="mock-echo", seed=3).install()
+
+
+def chunked(text, **kwargs):
+    return humanize_chunked(text, GENERAL, "Conversational", "mock-echo", "key", "mock-model",
+                            False, True, True, True, True, True, **kwargs)
+
+
+def test_paragraphs_are_packed_greedily():
+    paras = numbered_paragraphs(10)
+    budget = 60 * CHARS_PER_TOKEN
+    chunks = split_into_chunks("\n\n".join(paras), 60)
+    assert "\n\n".join(chunks) == "\n\n".join(paras)   # whole paragraphs, in order
+    assert all(len(c) <= budget for c in chunks)
+    for chunk, following in zip(chunks, chunks[1:]):
+        assert len(chunk) + 2 + len(following.split("\n\n")[0]) > budget   # the next one didn't fit
+
+
+def test_blank_paragraphs_are_dropped():
+    assert split_into_chunks("One.\n\n   \n\n\nTwo.\n\n") == ["One.\n\nTwo."]
+    assert split_into_chunks("   ") == []
+
+
+def test_oversized_paragraph_is_split_at_sentences():
+    long_para = " ".join(f"Sentence {i} is in the long paragraph." for i in range(40))
+    chunks = split_into_chunks(f"Intro.\n\n{long_para}\n\nOutro.", 60)
+    assert chunks[0] == "Intro." and chunks[-1] == "Outro."
+    assert " ".join(chunks[1:-1]) == long_para
+    assert all(len(c) <= 60 * CHARS_PER_TOKEN for c in chunks[1:-1])
+
+
+def test_chunks_are_stitched_in_order(echo):
+    document = "\n\n".join(numbered_paragraphs(12))
+    chunks = split_into_chunks(document, 60)
+    assert len(chunks) > 2
+    assert chunked(document, chunk_tokens=60) == document    # finishing order scrambled by jitter
+    assert len(echo.calls) == len(chunks) * N_PASSES
+
+
+def test_short_document_is_not_chunked_and_streams(echo):
+    streamed = []
+    out = chunked(DOCUMENT, stream_callback=streamed.append)
+    assert out == DOCUMENT and len(echo.calls) == N_PASSES
+    assert "".join(streamed).split() == DOCUMENT.split()
+
+
+def test_failed_chunk_fails_the_run(echo):
+    echo.error_rate, echo.error_status = 1.0, 400
+    assert chunked("\n\n".join(numbered_paragraphs(12)), chunk_tokens=60).startswith("Error:")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  VARIANTS
+# ─────────────────────────────────────────────────────────────────────────────
+
+FIRST_PASS = build_passes(GENERAL, "Conversational", True, True, True, True, True)[0]
+PADDING = " Moreover, we leverage a robust, comprehensive paradigm. Furthermore, it is pivotal."
+
+
+class VariantMock(MockProvider):
+    """Echoes, except in the first pass of the variants at the given temperature
+    offsets: `pad` appends cliché-laden filler, `fail` rejects one chunk."""
+
+    def __init__(self, pad=None, fail=None):
+        super().__init__(latency=0.01, jitter=0.0, name="mock-variants")
+        self.pad, self.fail = pad, fail
+
+    def first_pass_of(self, offset, system, temperature):
+        return (offset is not None and system == FIRST_PASS["system"]
+                and temperature == shift_temperature([FIRST_PASS], offset)[0]["temperature"])
+
+    def __call__(self, api_key, model, system, user, temperature, max_tokens=3500, on_token=None):
+        if self.first_pass_of(self.fail, system, temperature) and "Paragraph 3 " in user:
+            raise MockHTTPError(400)
+        out = super().__call__(api_key, model, system, user, temperature, max_tokens, on_token)
+        return out + PADDING if self.first_pass_of(self.pad, system, temperature) else out
+
+
+def variants(n, **kwargs):
+    return humanize_variants("\n\n".join(numbered_paragraphs(12)), GENERAL, "Conversational",
+                             "mock-variants", "key", "mock-model", False, True, True, True, True, True,
+                             n=n, **kwargs)
+
+
+def test_variant_offsets_and_temperatures():
+    assert variant_offsets(5, 0.15) == pytest.approx([0.0, 0.15, -0.15, 0.3, -0.3])
+    assert shift_temperature([FIRST_PASS], 0.0)[0] is FIRST_PASS       # variant 0 shares the pass cache
+    low, high = TEMPERATURE_RANGE
+    assert shift_temperature([FIRST_PASS], 10.0)[0]["temperature"] == high
+    assert shift_temperature([FIRST_PASS], -10.0)[0]["temperature"] == low
+
+
+def test_variants_are_ranked_and_failures_sort_last():
+    pytest.importorskip("numpy")
+    VariantMock(pad=0.0, fail=0.15).install()
+    document = "\n\n".join(numbered_paragraphs(12))
+    ranked = variants(3, chunk_tokens=60)
+    assert [v["offset"] for v in ranked] == pytest.approx([-0.15, 0.0, 0.15])
+    best, padded, failed = ranked
+    assert best["text"] == document and padded["text"].count(PADDING.strip()) >= 1
+    assert best["score"] > padded["score"]
+    assert failed["text"].startswith("Error:") and failed["score"] is None   # one failed chunk sinks the variant
+
+
+def test_variants_without_chunking():
+    mock = VariantMock().install()
+    ranked = variants(2, chunk_tokens=None)
+    assert len(mock.calls) == 2 * N_PASSES                 # one job per variant, not one per chunk
+    assert all(v["text"] == "\n\n".join(numbered_paragraphs(12)) for v in ranked)
+
+
+def test_variant_count_is_capped():
+    VariantMock().install()
+    assert len(variants(MAX_VARIANTS + 3, chunk_tokens=None)) == MAX_VARIANTS
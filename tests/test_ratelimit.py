@@ -0,0 +1,232 @@
+"""
+Rate limiting and retries — token buckets on a fake clock, Retry-After
+parsing, limit configuration, and call_api()'s 429 handling against the mock
+provider.
+
+    python -m pytest tests
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+
+from authentica import providers, ratelimit
+from authentica.cancel import Cancelled, CancelToken
+from authentica.providers import call_api, register_provider
+from authentica.ratelimit import (
+    MAX_RETRIES, QuotaExhausted, RateLimiter, TokenBucket, configured_limits, parse_rate_limit, retry_after,
+)
+from benchmarks.mock_provider import MockHTTPError, MockProvider
+
+
+class FakeClock:
+    """Stands in for the time module inside ratelimit: sleeping advances it."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(ratelimit, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    """A fresh registry for call_api(), so 429 pauses don't leak between tests."""
+    fresh = RateLimiter({})
+    monkeypatch.setattr(providers, "RATE_LIMITER", fresh)
+    return fresh
+
+
+def http_error(headers):
+    return SimpleNamespace(response=SimpleNamespace(status_code=429, headers=headers))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  TOKEN BUCKETS
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_bucket_bursts_to_capacity_then_paces(clock):
+    bucket = TokenBucket(rpm=2)
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(30.0)
+    assert bucket.reserve() == pytest.approx(60.0)   # queued behind the previous reservation
+    clock.sleep(60)
+    assert bucket.reserve() == pytest.approx(30.0)
+
+
+def test_bucket_without_rpm_never_waits(clock):
+    bucket = TokenBucket(rpm=None, rpd=100)
+    assert all(bucket.reserve() == 0.0 for _ in range(50))
+
+
+def test_daily_cap_counts_committed_requests():
+    bucket = TokenBucket(rpm=None, rpd=2)
+    for _ in range(2):
+        bucket.reserve()
+        bucket.commit()
+    with pytest.raises(QuotaExhausted):
+        bucket.reserve()
+    assert bucket.used_today == 2 and bucket.reserved == 0
+
+
+def test_released_reservation_costs_nothing(clock):
+    bucket = TokenBucket(rpm=1, rpd=1)
+    bucket.reserve()
+    bucket.release()
+    assert bucket.reserve() == 0.0                   # token and daily slot both refunded
+    bucket.commit()
+    assert bucket.used_today == 1
+
+
+def test_cancelled_wait_releases_its_reservation(clock):
+    limiter = RateLimiter({"p": {"rpm": 1, "rpd": 5}})
+    limiter.acquire("p", "key")
+    token = CancelToken()
+    token.cancel()
+    with pytest.raises(Cancelled):
+        limiter.acquire("p", "key", token)           # would have waited a minute
+    bucket = limiter.bucket("p", "key")
+    assert bucket.used_today == 1 and bucket.reserved == 0
+
+
+def test_acquire_waits_then_commits(clock):
+    limiter = RateLimiter({"p": {"rpm": 1, "rpd": None}})
+    limiter.acquire("p", "key")
+    limiter.acquire("p", "key")
+    assert clock.now == pytest.approx(1060.0)
+    assert limiter.bucket("p", "key").used_today == 2
+
+
+def test_pause_holds_back_every_caller_of_the_key(clock):
+    limiter = RateLimiter({"p": {"rpm": 600, "rpd": None}})
+    limiter.pause("p", "key", 10)
+    assert limiter.bucket("p", "key").reserve() == pytest.approx(10.0)
+    assert limiter.bucket("p", "key").reserve() == pytest.approx(10.0)
+    assert limiter.bucket("p", "other-key").reserve() == 0.0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  LIMIT CONFIGURATION
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_parse_rate_limit():
+    assert parse_rate_limit("groq=30") == ("groq", 30, None)
+    assert parse_rate_limit("groq=30/1000") == ("groq", 30, 1000)
+    assert parse_rate_limit("groq=0") == ("groq", None, None)
+    for bad in ("groq", "groq=", "=30", "groq=fast", "groq=30/lots"):
+        with pytest.raises(ValueError, match="PROVIDER=RPM"):
+            parse_rate_limit(bad)
+
+
+def test_set_limit_replaces_existing_buckets():
+    limiter = RateLimiter({"p": {"rpm": 1, "rpd": None}})
+    old = limiter.bucket("p", "key")
+    limiter.set_limit("p", 60, 100)
+    new = limiter.bucket("p", "key")
+    assert new is not old and new.capacity == 60 and new.rpd == 100
+    limiter.set_limit("p", 0)
+    assert limiter.bucket("p", "key") is None       # unlimited: acquire() is a no-op
+
+
+def test_configured_limits_env_overrides(monkeypatch):
+    defaults = {"groq": {"rpm": 30, "rpd": 14_400}, "gemini": {"rpm": 15, "rpd": 1_000}}
+    monkeypatch.setenv("AUTHENTICA_GROQ_RPM", "0")
+    monkeypatch.setenv("AUTHENTICA_GEMINI_RPD", "500")
+    assert configured_limits(defaults) == {"groq":   {"rpm": None, "rpd": None},
+                                           "gemini": {"rpm": 15, "rpd": 500}}
+    monkeypatch.setattr(ratelimit, "ENFORCE_RPD", True)
+    assert configured_limits(defaults)["groq"] == {"rpm": None, "rpd": 14_400}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  RETRY-AFTER AND 429s
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_retry_after_parsing():
+    assert retry_after(http_error({"Retry-After": "12"})) == 12.0
+    assert retry_after(http_error({"retry-after": "1.5"})) == 1.5
+    assert retry_after(http_error({"Retry-After": "-3"})) == 0.0
+    assert retry_after(http_error({"Retry-After": "soon"})) is None
+    assert retry_after(http_error({})) is None
+    assert retry_after(ValueError("no response")) is None
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=120), usegmt=True)
+    assert 110 < retry_after(http_error({"Retry-After": later})) <= 120
+
+
+def test_429_is_retried(limiter):
+    mock = MockProvider(latency=0.0, jitter=0.0, error_rate=1.0, error_status=429, retry_after=0.01,
+                        name="mock-429").install()
+    with pytest.raises(MockHTTPError):
+        call_api("mock-429", "key", "mock-model", "system", "text", 0.7)
+    assert len(mock.calls) == MAX_RETRIES + 1
+
+
+def test_429_pauses_every_caller_of_the_key(limiter):
+    mock = MockProvider(latency=0.0, jitter=0.0, name="mock-flaky").install()
+    limiter.set_limit("mock-flaky", 6000)
+    sent = []                                        # (api_key, time the backend was called)
+
+    def flaky(api_key, *args, **kwargs):
+        sent.append((api_key, time.monotonic()))
+        if len(sent) == 1:
+            raise MockHTTPError(429, 0.3)
+        return mock(api_key, *args, **kwargs)
+
+    register_provider("mock-flaky", flaky)
+    first = threading.Thread(target=call_api, args=("mock-flaky", "key", "mock-model", "system", "one", 0.7))
+    first.start()
+    while limiter.bucket("mock-flaky", "key").paused_until == 0.0:
+        time.sleep(0.005)
+    throttled_at = sent[0][1]
+    assert call_api("mock-flaky", "other-key", "mock-model", "system", "two", 0.7) == "two"
+    assert call_api("mock-flaky", "key", "mock-model", "system", "three", 0.7) == "three"
+    first.join(5)
+    other = [at for key, at in sent if key == "other-key"]
+    same = [at for key, at in sent[1:] if key == "key"]
+    assert other[0] - throttled_at < 0.2            # other keys are unaffected
+    assert min(same) - throttled_at >= 0.25          # both callers of the key sat out the pause
+    assert len(same) == 2 and len(mock.calls) == 3
+
+
+def test_long_retry_after_fails_fast(limiter, monkeypatch):
+    monkeypatch.setattr(providers, "MAX_RETRY_AFTER", 5.0)
+    mock = MockProvider(latency=0.0, jitter=0.0, error_rate=1.0, error_status=429, retry_after=3600,
+                        name="mock-3600").install()
+    limiter.set_limit("mock-3600", 6000)
+    with pytest.raises(QuotaExhausted, match="3600s"):
+        call_api("mock-3600", "key", "mock-model", "system", "text", 0.7)
+    assert len(mock.calls) == 1
+    assert limiter.bucket("mock-3600", "key").reserve() == 0.0   # the key was not paused for an hour
+
+
+def test_stream_that_delivered_tokens_is_not_retried(limiter):
+    calls = []
+
+    def breaks_mid_stream(api_key, model, system, user, temperature, max_tokens=3500, on_token=None):
+        calls.append(1)
+        if on_token is not None:
+            on_token("partial ")
+        raise MockHTTPError(429, 0.01)
+
+    register_provider("mock-broken-stream", breaks_mid_stream)
+    received = []
+    with pytest.raises(MockHTTPError):
+        call_api("mock-broken-stream", "key", "mock-model", "system", "text", 0.7, on_token=received.append)
+    assert calls == [1] and received == ["partial "]
+    with pytest.raises(MockHTTPError):
+        call_api("mock-broken-stream", "key", "mock-model", "system", "text", 0.7)
+    assert len(calls) == 1 + MAX_RETRIES + 1        # not streamed: retried like any 429
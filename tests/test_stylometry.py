@@ -0,0 +1,40 @@
+"""
+Variant scoring — score_variants() ranks rewrites on the batch stylometry
+metrics.
+
+    python -m pytest tests
+"""
+
+import pytest
+
+from authentica.stylometry import score_variants
+
+pytest.importorskip("numpy")   # analyze_batch() imports it lazily
+
+VARIED = ("Short one. This next sentence, on the other hand, runs on for quite a while before it stops. "
+          "Then a medium one here.\n\nA second paragraph. It is brief.")
+FLAT = ("This sentence has exactly seven words here. This sentence has exactly seven words too. "
+        "This sentence has exactly seven words again.\n\nThis sentence has exactly seven words still.")
+
+
+def test_one_score_per_text_and_empty_scores_lowest():
+    scores = score_variants([VARIED, "", FLAT])
+    assert len(scores) == 3 and scores[1] == float("-inf")
+
+
+def test_varied_rhythm_beats_flat_rhythm():
+    varied, flat = score_variants([VARIED, FLAT])
+    assert varied > flat
+
+
+def test_cliches_and_transitions_are_penalized():
+    padded = VARIED + " Moreover, we leverage a robust paradigm. Furthermore, it is pivotal."
+    clean, worse = score_variants([VARIED, padded])
+    assert clean > worse
+
+
+def test_length_drift_from_the_source_is_penalized():
+    truncated = VARIED.split("\n\n")[0]
+    faithful, dropped = score_variants([VARIED, truncated], source=VARIED)
+    assert faithful > dropped
+    assert score_variants([VARIED], source=VARIED) == score_variants([VARIED])   # no drift, no penalty
@@ -0,0 +1,86 @@
+"""
+Cliché removal — the single-pass trie regex against a plain phrase-by-phrase
+reference scan.
+
+    python -m pytest tests
+"""
+
+import random
+
+import pytest
+
+from authentica.text import CLICHES, remove_cliches
+
+
+class First:
+    """An rng stand-in that always picks the first replacement."""
+
+    @staticmethod
+    def choice(options):
+        return options[0]
+
+
+def is_letter(ch):
+    return ch.isascii() and ch.isalpha()
+
+
+def reference(text):
+    """Leftmost-longest replacement, one position at a time: at each word
+    boundary try every phrase, longest first."""
+    phrases = sorted(CLICHES, key=len, reverse=True)
+    lower, out, i = text.lower(), [], 0
+    while i < len(text):
+        if i == 0 or not is_letter(text[i - 1]):
+            for phrase in phrases:
+                end = i + len(phrase)
+                if lower.startswith(phrase, i) and (end == len(text) or not is_letter(text[end])):
+                    repl = CLICHES[phrase][0]
+                    out.append(repl[0].upper() + repl[1:] if text[i].isupper() else repl)
+                    i = end
+                    break
+            else:
+                out.append(text[i])
+                i += 1
+        else:
+            out.append(text[i])
+            i += 1
+    return "".join(out)
+
+
+def test_longest_phrase_wins():
+    assert remove_cliches("We leverages it.", First) == "We uses it."
+    assert remove_cliches("It is important to note that it works.", First) == "Worth noting, it works."
+    assert remove_cliches("A cutting-edge and cutting edge idea.", First) == "A new and new idea."
+
+
+def test_every_occurrence_is_replaced():
+    text = "We utilize this. They utilize that. Everyone will utilize it."
+    assert remove_cliches(text, First) == "We use this. They use that. Everyone will use it."
+
+
+def test_only_whole_words_match():
+    text = "Leveraged realms and unrobust harnesses stay."
+    assert remove_cliches(text, First) == text
+
+
+def test_capitalized_match_keeps_its_capital():
+    assert remove_cliches("Paramount. PARAMOUNT. paramount.", First) == "Key. Key. key."
+
+
+def test_rng_makes_runs_reproducible():
+    text = " ".join(["We leverage a robust, comprehensive paradigm."] * 20)
+    assert remove_cliches(text, random.Random(7)) == remove_cliches(text, random.Random(7))
+    assert remove_cliches(text, random.Random(7)) != remove_cliches(text, random.Random(8))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_reference_on_overlapping_phrases(seed):
+    rng = random.Random(seed)
+    words = list(CLICHES) + ["in order", "to", "cutting", "edge", "it is", "note that", "leveraged", "xrealm", "the"]
+    pieces = []
+    for _ in range(60):
+        word = rng.choice(words)
+        word = word.capitalize() if rng.random() < 0.2 else word
+        pieces.append(word + rng.choice([" ", " ", ", ", ". ", "-", "\n"]))
+    text = "".join(pieces)
+    assert remove_cliches(text, First) == reference(text)